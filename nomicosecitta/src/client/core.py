@@ -0,0 +1,311 @@
+import asyncio
+import threading
+from typing import Callable, Hashable, Optional
+
+from src.common.message import Message, MessageType
+
+from src.client.frontend             import FrontEnd
+from src.client.network_handler      import NetworkHandler
+from src.client.reconnection_manager import ReconnectionManager
+from src.client.message_handler      import MessageHandler
+from src.client.p2p_broadcaster      import P2PBroadcaster
+from src.client.vote_batcher         import VoteBatcher
+from src.client.rate_limiter         import RateLimiter
+from src.client.server_clock         import ServerClock
+
+_ACTION_SETTINGS   = "settings"
+_ACTION_CATEGORIES = "categories"
+
+
+class ClientCore:
+    """
+    Client protocol logic without any user interface: server connection and
+    failover, P2P chat and votes, and the game state. It runs its asyncio
+    loop on a background thread, started by start() or by the first
+    connect_to_server(), and reports to a FrontEnd; the Tk client, the
+    headless client and the terminal client all share it.
+    """
+
+    def __init__(self, frontend: FrontEnd):
+        self.frontend = frontend
+        self.loop     = asyncio.new_event_loop()
+        self.network  = None
+        self.username = ""
+        self.peer_map: dict[str, str] = {}
+        self.my_votes: dict[str, dict] = {}
+        self.reviewers: dict[str, dict] | None = None
+        self.peer_vote_seqs: dict[tuple, int] = {}
+        self.chat_limiter = RateLimiter()
+        self.clock        = ServerClock()
+
+        self.reconnection_manager = ReconnectionManager()
+        self.p2p_port:   int  = 0
+        self._reconnecting:          bool = False
+        self._intentional_disconnect: bool = False
+
+        self.p2p_broadcaster = P2PBroadcaster(
+            get_network=lambda: self.network,
+            get_peer_map=lambda: self.peer_map,
+            get_username=lambda: self.username,
+            get_reviewers=lambda: self.reviewers,
+            deliver=lambda msg: self._msg_handler.handle(msg)
+        )
+        self.vote_batcher = VoteBatcher(self._send_vote_batch)
+        self._peer_votes: Optional[asyncio.Future] = None   # P2P copy of the last batch
+
+        # Message handler
+        self._msg_handler = MessageHandler(self)
+        self._network_thread: Optional[threading.Thread] = None
+
+    def start(self):
+        """Run the network event loop on a daemon thread (once)."""
+        if self._network_thread is not None:
+            return
+        self._network_thread = threading.Thread(
+            target=self._start_async_loop, daemon=True
+        )
+        self._network_thread.start()
+
+    def _start_async_loop(self):
+        asyncio.set_event_loop(self.loop)
+        self.loop.run_forever()
+
+    def post(self, fn: Callable, key: Optional[Hashable] = None) -> None:
+        """Hand a front-end update over to the front-end's thread."""
+        self.frontend.post(fn, key)
+
+    # Connection
+
+    def connect_to_server(self, ip: str, username: str):
+        self.username = username
+        self._intentional_disconnect = False
+        self.start()
+        self.frontend.set_busy("Searching for server…")
+
+        future = asyncio.run_coroutine_threadsafe(self._async_connect(), self.loop)
+        future.add_done_callback(self._on_connect_done)
+        return future
+
+    def _on_connect_done(self, future):
+        try:
+            future.result()
+        except Exception as e:
+            import traceback
+            print(f"[FATAL] {e}")
+            traceback.print_exc()
+        self.post(lambda: self.frontend.set_busy(None), key="busy")
+
+    async def _async_connect(self):
+        def _status(msg: str):
+            print(f"[LOGIN] {msg}")
+            self.post(lambda: self.frontend.set_busy(f"Searching: {msg}"), key="busy")
+
+        await self.reconnection_manager.locate_servers()
+        host, port = self.reconnection_manager.get_initial_server()
+        _status(f"Connecting to {host}:{port}…")
+        self.network  = self._build_handler(host, port)
+        self.p2p_port = await self.network.start_p2p_listener()
+        success       = await self.network.connect()
+
+        if not success:
+            _status("Direct connection failed — trying fallback…")
+            await self.reconnection_manager.await_lan_server()
+            new_handler = await self.reconnection_manager.reconnect(
+                network_factory=self._build_handler,
+                username=self.username,
+                p2p_port=0,
+                on_status=_status,
+            )
+            if new_handler is None:
+                self.post(lambda: self.frontend.show_error(
+                    "Error",
+                    "Could not connect to any server.\n"
+                    f"Tried: {', '.join(self.reconnection_manager.server_list)}",
+                ))
+                return
+            self.network  = new_handler
+            self.p2p_port = await self.network.start_p2p_listener()
+
+        await self.network.send(Message(
+            type=MessageType.CMD_JOIN,
+            sender=self.username,
+            payload={"username": self.username, "p2p_port": self.p2p_port},
+        ))
+
+    def _build_handler(self, host: str, port: int) -> NetworkHandler:
+        handler              = NetworkHandler(host, port)
+        self.clock.reset()   # another server, another clock
+        handler.on_message   = self._msg_handler.handle
+        handler.on_disconnect = self.handle_disconnection
+        return handler
+
+    # Disconnection & reconnection
+
+    def handle_disconnection(self, reason: str):
+        self.p2p_broadcaster.gossip.stop()
+        if self._intentional_disconnect or self._reconnecting:
+            return
+        print(f"[CONTROLLER] Unexpected disconnection: {reason}")
+        self._reconnecting = True
+        self.post(self.frontend.pause_timers)
+        self.post(lambda: self.frontend.show_reconnecting(reason))
+        asyncio.run_coroutine_threadsafe(self._async_reconnect(), self.loop)
+
+    async def _async_reconnect(self):
+        new_handler = await self.reconnection_manager.reconnect(
+            network_factory=self._build_handler,
+            username=self.username,
+            p2p_port=self.p2p_port,
+            on_status=lambda m: self.post(lambda msg=m: self.frontend.update_reconnect_status(msg),
+                                          key="reconnect_status"),
+        )
+        self._reconnecting = False
+
+        if new_handler is None:
+            self.post(self._on_reconnection_failed)
+            return
+
+        self.network  = new_handler
+        self.p2p_port = await self.network.start_p2p_listener()
+        host, port    = self.reconnection_manager.get_current_server()
+
+        success = await self.network.send(Message(
+            type=MessageType.CMD_JOIN,
+            sender=self.username,
+            payload={"username": self.username, "p2p_port": self.p2p_port},
+        ))
+
+        if success:
+            self.post(lambda h=host, p=port: self._on_reconnection_success(h, p))
+        else:
+            self.post(self._on_reconnection_failed)
+
+    def _on_reconnection_success(self, host: str, port: int):
+        self.frontend.hide_reconnecting()
+        info = f"Reconnected to {host}:{port}"
+        self.frontend.append_log(f"[✓] {info}")
+        self.frontend.update_game_status(info)
+
+    def _on_reconnection_failed(self):
+        self.frontend.hide_reconnecting()
+        self.frontend.show_warning(
+            "Connection Lost",
+            "Could not reconnect to any server.\n\n"
+            f"Servers tried: {', '.join(self.reconnection_manager.server_list)}\n\n"
+            "Returning to the login screen.",
+        )
+        self.frontend.show_login()
+
+    # Lobby
+
+    def send_lobby_settings(self, settings: dict):
+        self._send_async(Message(
+            type=MessageType.CMD_LOBBY_ACTION,
+            sender=self.username,
+            payload={
+                "action_type":          _ACTION_SETTINGS,
+                "mode":                 settings["mode"],
+                "num_extra_categories": settings["num_extra_categories"],
+                "round_time":           settings["round_time"],
+            },
+        ))
+
+    def send_category_vote(self, categories: list):
+        self._send_async(Message(
+            type=MessageType.CMD_LOBBY_ACTION,
+            sender=self.username,
+            payload={"action_type": _ACTION_CATEGORIES, "categories": categories},
+        ))
+
+    def request_game_start(self, settings: dict):
+        print(f"[CONTROLLER] Requesting game start: {settings}")
+        self._send_async(Message(
+            type=MessageType.CMD_START_GAME,
+            sender=self.username,
+            payload={
+                "mode":                 settings["mode"],
+                "num_extra_categories": settings["num_extra_categories"],
+                "round_time":           settings["round_time"],
+            },
+        ))
+
+    def submit_answers(self, answers: dict | None = None):
+        if answers is None:
+            answers = self.frontend.get_answers()
+        print("[CONTROLLER] Submitting answers…")
+        self._send_async(Message(
+            type=MessageType.CMD_SUBMIT,
+            sender=self.username,
+            payload={"words": answers},
+        ))
+
+    def handle_user_vote(self, target_user: str, category: str, is_valid: bool):
+        if category in self.my_votes:
+            self.my_votes[category][target_user] = is_valid
+        self.loop.call_soon_threadsafe(self.vote_batcher.add, category, target_user, is_valid)
+
+    def send_message(self, msg_text: str):
+        if not msg_text.strip():
+            return
+        self.frontend.append_log(f"YOU: {msg_text}")
+        asyncio.run_coroutine_threadsafe(
+            self.p2p_broadcaster.broadcast_chat(msg_text), self.loop
+        )
+
+    def submit_final_votes(self):
+        print(f"[CONTROLLER] Submitting final votes: {self.my_votes}")
+        final = Message(
+            type=MessageType.CMD_SUBMIT,
+            sender=self.username,
+            payload={"votes": self.my_votes},
+        )
+        asyncio.run_coroutine_threadsafe(self._flush_votes_and_send(final), self.loop)
+
+    # Internals
+
+    async def _send_vote_batch(self, seq: int, votes: list[list]):
+        # The server copy is authoritative: a slow peer must not hold it (or
+        # the final submit) back, so the P2P copies fan out in the background
+        self._peer_votes = asyncio.ensure_future(
+            self._broadcast_votes_after(self._peer_votes, seq, votes))
+        if self.network and self.network.is_connected():
+            await self.network.send(Message(
+                type=MessageType.CMD_SUBMIT,
+                sender=self.username,
+                payload={"vote_batch": votes, "seq": seq},
+            ))
+
+    async def _broadcast_votes_after(self, previous: Optional[asyncio.Future], seq: int, votes: list[list]):
+        # Peers drop batches older than the last one seen, so keep them in order
+        if previous is not None:
+            await asyncio.wait([previous])
+        await self.p2p_broadcaster.broadcast_vote_batch(seq, votes)
+
+    async def _flush_votes_and_send(self, msg: Message):
+        await self.vote_batcher.flush()
+        if self.network and self.network.is_connected():
+            await self.network.send(msg)
+        else:
+            print(f"[ERROR] Not connected — cannot send {msg.type}.")
+
+    def _send_async(self, msg: Message):
+        if self.network and self.network.is_connected():
+            asyncio.run_coroutine_threadsafe(self.network.send(msg), self.loop)
+        else:
+            print(f"[ERROR] Not connected — cannot send {msg.type}.")
+
+    def shutdown(self):
+        """Disconnect and stop the network loop."""
+        print("[CLIENT] Shutting down…")
+        self._intentional_disconnect = True
+        if self.network:
+            future = asyncio.run_coroutine_threadsafe(
+                self.network.disconnect(), self.loop
+            )
+            try:
+                future.result(timeout=1.5)
+            except Exception:
+                pass
+        self.loop.call_soon_threadsafe(self.p2p_broadcaster.gossip.stop)
+        self.loop.call_soon_threadsafe(self.loop.stop)
+        print("[CLIENT] Shutdown complete.")
@@ -0,0 +1,64 @@
+from typing import Callable, Hashable, Optional
+
+
+class FrontEnd:
+    """
+    Everything ClientCore needs from a user interface.
+
+    ClientCore calls these methods through its post(), so they run on the
+    front-end's own thread. The defaults do nothing, so a front-end only
+    overrides what it shows; get_answers() is what gets submitted when a
+    round ends.
+    """
+
+    def post(self, fn: Callable, key: Optional[Hashable] = None) -> None:
+        """Run fn on the front-end's thread (a keyed call may replace a pending one)."""
+        fn()
+
+    # Navigation
+
+    def current_screen_name(self) -> str:
+        return ""
+
+    def show_login(self): pass
+    def show_lobby(self): pass
+    def show_game(self): pass
+
+    # Lobby
+
+    def set_admin(self, is_admin: bool): pass
+    def update_player_list(self, players: list, admin_username: str = None): pass
+    def update_lobby_settings(self, mode: str, num_extra_categories: int, round_time: int = None): pass
+
+    # Game
+
+    def start_round(self, letter: str, categories: list, round_number: int, duration: int,
+                    is_recovery: bool = False, deadline: float = None): pass
+
+    def show_voting_phase(self, words_to_vote: dict, my_username: str, duration: int,
+                          is_recovery: bool = False, deadline: float = None): pass
+
+    def update_game_letter(self, letter: str): pass
+    def update_round_info(self, round_number: int): pass
+    def update_game_status(self, status: str): pass
+    def set_inputs_enabled(self, enabled: bool): pass
+    def update_scoreboard(self, scores: dict, round_scores: dict = None): pass
+    def update_peer_vote(self, target_user: str, category: str, voter: str, is_valid: bool): pass
+    def append_log(self, text: str): pass
+    def pause_timers(self): pass
+
+    def get_answers(self) -> dict:
+        return {}
+
+    # Dialogs and connection state
+
+    def show_info(self, title: str, text: str): pass
+    def show_error(self, title: str, text: str): pass
+    def show_warning(self, title: str, text: str): pass
+
+    def set_busy(self, status: Optional[str]):
+        """Show a connection-in-progress status, or clear it with None."""
+
+    def show_reconnecting(self, reason: str): pass
+    def update_reconnect_status(self, text: str): pass
+    def hide_reconnecting(self): pass
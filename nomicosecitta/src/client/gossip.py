@@ -0,0 +1,141 @@
+import asyncio
+import random
+import uuid
+from collections import OrderedDict
+from typing import Awaitable, Callable
+
+from src.common.constants import GOSSIP_FANOUT, GOSSIP_DIGEST_INTERVAL, GOSSIP_HISTORY
+from src.common.message import Message, MessageType
+
+# (peer name, peer address, message) triples, as sent by P2PBroadcaster._fan_out
+Deliveries = list[tuple[str, str, Message]]
+
+
+def _origin_key(envelope: dict) -> str:
+    return f"{envelope['origin']}#{envelope.get('incarnation', '')}"
+
+
+class GossipEngine:
+    """
+    Epidemic dissemination of P2P messages.
+
+    A published message is wrapped in a MSG_GOSSIP envelope carrying its
+    origin, the origin's incarnation (a random id per engine, so a client
+    that restarts under the same name starts a fresh sequence instead of
+    having its messages dropped as old) and the origin's sequence number.
+    Sequences are tracked per "<origin>#<incarnation>". Each client delivers an
+    envelope the first time it sees it and forwards it to `fanout` random
+    peers, so it reaches everyone in O(log n) hops while every client sends
+    a constant number of copies. Every digest_interval seconds a client
+    sends a random peer the highest contiguous sequence it holds per origin
+    (MSG_GOSSIP_DIGEST); the two then push each other what the other lacks.
+    """
+
+    def __init__(self, send: Callable[[Deliveries], Awaitable[None]], get_peer_map: Callable,
+                 get_username: Callable, deliver: Callable[[Message], None],
+                 fanout: int = GOSSIP_FANOUT, digest_interval: float = GOSSIP_DIGEST_INTERVAL,
+                 history: int = GOSSIP_HISTORY):
+        self.send            = send
+        self.get_peer_map    = get_peer_map
+        self.get_username    = get_username
+        self.deliver         = deliver
+        self.fanout          = fanout
+        self.digest_interval = digest_interval
+        self.history_size    = history
+
+        self._seq     = 0
+        self._incarnation = uuid.uuid4().hex[:8]
+        self._high:    dict[str, int]      = {}  # contiguous sequence numbers seen, per origin key
+        self._ahead:   dict[str, set[int]] = {}  # seen out of order, above _high
+        self._history: OrderedDict[tuple[str, int], dict] = OrderedDict()
+        self._digest_task: asyncio.Task | None = None
+
+    async def publish(self, message: Message):
+        self.start()
+        self._seq += 1
+        envelope = {"origin": self.get_username(), "incarnation": self._incarnation,
+                    "seq": self._seq, "inner": message.to_dict()}
+        self._remember(envelope)
+        await self.send(self._pick(envelope, exclude={self.get_username()}))
+
+    def receive(self, msg: Message):
+        """Handle an incoming MSG_GOSSIP: deliver and forward it if it is new."""
+        self.start()
+        envelope = msg.payload
+        if not self._remember(envelope):
+            return
+        self.deliver(Message.from_dict(envelope["inner"]))
+        deliveries = self._pick(envelope, exclude={self.get_username(), msg.sender, envelope["origin"]})
+        asyncio.ensure_future(self.send(deliveries))
+
+    def receive_digest(self, msg: Message):
+        """Push what the peer is missing and, if it is ahead of us, ask for a push back."""
+        theirs  = msg.payload.get("digest", {})
+        address = self.get_peer_map().get(msg.sender)
+        if not address:
+            return
+
+        deliveries: Deliveries = [
+            (msg.sender, address, self._wrap(envelope))
+            for (key, seq), envelope in self._history.items()
+            if seq > theirs.get(key, 0) and envelope["origin"] != msg.sender
+        ]
+        if msg.payload.get("reply") and any(seq > self._high.get(o, 0) for o, seq in theirs.items()):
+            deliveries.append((msg.sender, address, self._digest(reply=False)))
+        if deliveries:
+            asyncio.ensure_future(self.send(deliveries))
+
+    def start(self):
+        """Start the periodic anti-entropy exchange (idempotent, needs a running loop)."""
+        if self._digest_task is None or self._digest_task.done():
+            self._digest_task = asyncio.ensure_future(self._anti_entropy_loop())
+
+    def stop(self):
+        """Stop the anti-entropy exchange; the next publish or receive restarts it."""
+        if self._digest_task:
+            self._digest_task.cancel()
+            self._digest_task = None
+
+    #  Internals
+
+    async def _anti_entropy_loop(self):
+        while True:
+            await asyncio.sleep(self.digest_interval)
+            peers = [(n, a) for n, a in self.get_peer_map().items() if n != self.get_username()]
+            if peers:
+                name, address = random.choice(peers)
+                await self.send([(name, address, self._digest(reply=True))])
+
+    def _remember(self, envelope: dict) -> bool:
+        """Record the envelope; False if (origin key, seq) was already seen."""
+        key, seq = _origin_key(envelope), envelope["seq"]
+        high  = self._high.get(key, 0)
+        ahead = self._ahead.setdefault(key, set())
+        if seq <= high or seq in ahead:
+            return False
+
+        ahead.add(seq)
+        while high + 1 in ahead:
+            high += 1
+            ahead.remove(high)
+        self._high[key] = high
+
+        self._history[(key, seq)] = envelope
+        while len(self._history) > self.history_size:
+            self._history.popitem(last=False)
+        return True
+
+    def _pick(self, envelope: dict, exclude: set[str]) -> Deliveries:
+        peers = [(n, a) for n, a in self.get_peer_map().items() if n not in exclude]
+        chosen = random.sample(peers, min(self.fanout, len(peers)))
+        return [(name, address, self._wrap(envelope)) for name, address in chosen]
+
+    def _wrap(self, envelope: dict) -> Message:
+        return Message(type=MessageType.MSG_GOSSIP, sender=self.get_username(), payload=envelope)
+
+    def _digest(self, reply: bool) -> Message:
+        return Message(
+            type=MessageType.MSG_GOSSIP_DIGEST,
+            sender=self.get_username(),
+            payload={"digest": dict(self._high), "reply": reply},
+        )
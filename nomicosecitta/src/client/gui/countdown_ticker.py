@@ -0,0 +1,79 @@
+"""
+Shared clock for every countdown on screen.
+"""
+import math
+import time
+import tkinter as tk
+from typing import Callable, Optional
+
+
+class CountdownTicker:
+    """
+    A single after() loop driving all countdowns.
+
+    Each countdown is an absolute time.monotonic() deadline, so a late tick
+    never accumulates drift, and the next tick is aimed at the moment the
+    earliest displayed second changes. pause() stops the loop (e.g. while
+    disconnected); the next start() resumes it.
+    """
+
+    def __init__(self, root: tk.Misc):
+        self.root = root
+        # name -> [deadline, on_tick(seconds_left), on_expire, last shown value]
+        self._countdowns: dict[str, list] = {}
+        self._job    = None
+        self._paused = False
+
+    def start(self, name: str, deadline: float,
+              on_tick: Callable[[int], None],
+              on_expire: Optional[Callable[[], None]] = None):
+        """Start (or replace) the countdown `name`, ending at monotonic time `deadline`."""
+        self._countdowns[name] = [deadline, on_tick, on_expire, None]
+        self._paused = False
+        self._tick()
+
+    def cancel(self, name: str):
+        self._countdowns.pop(name, None)
+        if not self._countdowns:
+            self._cancel_job()
+
+    def pause(self):
+        self._paused = True
+        self._cancel_job()
+
+    def remaining(self, name: str) -> Optional[float]:
+        countdown = self._countdowns.get(name)
+        return None if countdown is None else max(0.0, countdown[0] - time.monotonic())
+
+    def _tick(self):
+        self._cancel_job()
+        if self._paused:
+            return
+
+        now = time.monotonic()
+        next_change = None
+        expired = []
+        for name, countdown in list(self._countdowns.items()):
+            left  = countdown[0] - now
+            shown = max(0, math.ceil(left))
+            if shown != countdown[3]:
+                countdown[3] = shown
+                countdown[1](shown)
+            if left <= 0:
+                del self._countdowns[name]
+                expired.append(countdown[2])
+                continue
+            until = left - (shown - 1)
+            next_change = until if next_change is None else min(next_change, until)
+
+        if next_change is not None:
+            self._job = self.root.after(max(1, int(next_change * 1000) + 5), self._tick)
+        # Last, so an expiry callback that starts a new countdown reschedules cleanly
+        for on_expire in expired:
+            if on_expire:
+                on_expire()
+
+    def _cancel_job(self):
+        if self._job is not None:
+            self.root.after_cancel(self._job)
+            self._job = None
@@ -4,12 +4,17 @@ GUI Manager - Central coordinator for screen navigation and callbacks.
 This is the main entry point for the GUI subsystem.
 The controller interacts only with this class.
 """
+import importlib
 import tkinter as tk
+from tkinter import messagebox
 from enum import Enum, auto
-from typing import Callable, Optional, Dict
+from typing import TYPE_CHECKING, Callable, Optional, Dict
+
+from src.client.frontend import FrontEnd
 
-from src.client.gui.screens import LoginScreen, LobbyScreen, GameScreen
 from src.client.gui.screens.base_screen import BaseScreen
+from src.client.gui.countdown_ticker import CountdownTicker
+from src.client.gui.reconnection_overlay import ReconnectionOverlay
 from src.client.gui import theme
 
 
@@ -19,11 +24,27 @@ class Screen(Enum):
     GAME = auto()
 
 
-class GUIManager:
+# Screen -> (module, class). Each is imported and built on first navigation.
+_SCREEN_CLASSES = {
+    Screen.LOGIN: ("src.client.gui.screens.login", "LoginScreen"),
+    Screen.LOBBY: ("src.client.gui.screens.lobby", "LobbyScreen"),
+    Screen.GAME:  ("src.client.gui.screens.game",  "GameScreen"),
+}
+
+if TYPE_CHECKING:
+    from src.client.gui.screens import LoginScreen, LobbyScreen, GameScreen
+
+
+class GUIManager(FrontEnd):
     """
-    Central manager for the GUI subsystem.
+    Central manager for the GUI subsystem: the Tkinter FrontEnd.
+
+    Only the login screen exists at startup; the lobby and game screens
+    are built the first time they are shown or updated.
     """
 
+    TITLE = "Nomi Cose Città"
+
     def __init__(self, root: tk.Tk):
         self.root = root
         self._configure_window()
@@ -37,22 +58,30 @@ class GUIManager:
         self.on_lobby_settings_changed: Optional[Callable[[dict], None]] = None
         self.on_category_vote_changed: Optional[Callable[[list], None]] = None
 
+        self.ticker  = CountdownTicker(root)
+        self.overlay = ReconnectionOverlay(root, self.append_log)
+
         self._screens: Dict[Screen, BaseScreen] = {}
         self._current_screen: Optional[Screen] = None
 
-        self._init_screens()
         self.navigate_to(Screen.LOGIN)
 
     def _configure_window(self):
-        self.root.title("Nomi Cose Città")
+        self.root.title(self.TITLE)
         self.root.geometry("900x550")
         self.root.minsize(850, 500)
         self.root.configure(bg=theme.BG_PAGE)
 
-    def _init_screens(self):
-        self._screens[Screen.LOGIN] = LoginScreen(self.root, self)
-        self._screens[Screen.LOBBY] = LobbyScreen(self.root, self)
-        self._screens[Screen.GAME] = GameScreen(self.root, self)
+    def _screen(self, screen: Screen) -> BaseScreen:
+        built = self._screens.get(screen)
+        if built is None:
+            module, cls = _SCREEN_CLASSES[screen]
+            built = getattr(importlib.import_module(module), cls)(self.root, self)
+            self._screens[screen] = built
+        return built
+
+    def is_built(self, screen: Screen) -> bool:
+        return screen in self._screens
 
     # Navigation methods
 
@@ -60,15 +89,18 @@ class GUIManager:
         if self._current_screen is not None:
             self._screens[self._current_screen].hide()
         self._current_screen = screen
-        self._screens[screen].show()
+        self._screen(screen).show()
 
     def get_screen(self, screen: Screen) -> BaseScreen:
-        return self._screens[screen]
+        return self._screen(screen)
 
     @property
     def current_screen(self) -> Optional[Screen]:
         return self._current_screen
 
+    def current_screen_name(self) -> str:
+        return self._current_screen.name if self._current_screen else ""
+
     def show_login(self):
         self.navigate_to(Screen.LOGIN)
 
@@ -78,23 +110,24 @@ class GUIManager:
     def show_game(self):
         self.navigate_to(Screen.GAME)
 
-    def show_voting_phase(self, words_to_vote: dict, my_username: str, duration: int, is_recovery: bool = False):
+    def show_voting_phase(self, words_to_vote: dict, my_username: str, duration: int,
+                          is_recovery: bool = False, deadline: float = None):
         self.navigate_to(Screen.GAME)
-        self.game.build_voting_ui(words_to_vote, my_username, duration, is_recovery)
+        self.game.build_voting_ui(words_to_vote, my_username, duration, is_recovery, deadline)
 
     # Screen properties
 
     @property
-    def login(self) -> LoginScreen:
-        return self._screens[Screen.LOGIN]
+    def login(self) -> 'LoginScreen':
+        return self._screen(Screen.LOGIN)
 
     @property
-    def lobby(self) -> LobbyScreen:
-        return self._screens[Screen.LOBBY]
+    def lobby(self) -> 'LobbyScreen':
+        return self._screen(Screen.LOBBY)
 
     @property
-    def game(self) -> GameScreen:
-        return self._screens[Screen.GAME]
+    def game(self) -> 'GameScreen':
+        return self._screen(Screen.GAME)
 
     # Lobby delegations
 
@@ -134,6 +167,8 @@ class GUIManager:
         self.game.update_status(status)
 
     def get_answers(self) -> dict:
+        if not self.is_built(Screen.GAME):
+            return {}
         return self.game.get_answers()
 
     def clear_answers(self):
@@ -142,8 +177,9 @@ class GUIManager:
     def set_inputs_enabled(self, enabled: bool):
         self.game.set_inputs_enabled(enabled)
 
-    def start_round(self, letter: str, categories: list, round_number: int, duration: int, is_recovery: bool = False):
-        self.game.start_round(letter, categories, round_number, duration, is_recovery)
+    def start_round(self, letter: str, categories: list, round_number: int, duration: int,
+                    is_recovery: bool = False, deadline: float = None):
+        self.game.start_round(letter, categories, round_number, duration, is_recovery, deadline)
 
     def update_peer_vote(self, target_user: str, category: str, voter: str, is_valid: bool):
         if self._current_screen == Screen.GAME:
@@ -161,4 +197,32 @@ class GUIManager:
 
     @property
     def players_list(self):
-        return self.lobby.player_list
\ No newline at end of file
+        return self.lobby.player_list
+
+    # Dialogs and connection state
+
+    def show_info(self, title: str, text: str):
+        messagebox.showinfo(title, text)
+
+    def show_error(self, title: str, text: str):
+        messagebox.showerror(title, text)
+
+    def show_warning(self, title: str, text: str):
+        messagebox.showwarning(title, text)
+
+    def set_busy(self, status: Optional[str]):
+        if status is None:
+            self.root.config(cursor="")
+            self.root.title(self.TITLE)
+        else:
+            self.root.config(cursor="watch")
+            self.root.title(f"{self.TITLE} — {status}")
+
+    def show_reconnecting(self, reason: str):
+        self.overlay.show(reason)
+
+    def update_reconnect_status(self, text: str):
+        self.overlay.update_status(text)
+
+    def hide_reconnecting(self):
+        self.overlay.close()
@@ -1,5 +1,17 @@
-from src.client.gui.screens.login import LoginScreen
-from src.client.gui.screens.lobby import LobbyScreen
-from src.client.gui.screens.game import GameScreen
+import importlib
 
-__all__ = ['LoginScreen', 'LobbyScreen', 'GameScreen']
\ No newline at end of file
+# Screens are imported on first use, so the login window doesn't wait for
+# the lobby and game modules (see GUIManager._screen)
+_MODULES = {
+    'LoginScreen': 'src.client.gui.screens.login',
+    'LobbyScreen': 'src.client.gui.screens.lobby',
+    'GameScreen':  'src.client.gui.screens.game',
+}
+
+__all__ = ['LoginScreen', 'LobbyScreen', 'GameScreen']
+
+
+def __getattr__(name):
+    if name in _MODULES:
+        return getattr(importlib.import_module(_MODULES[name]), name)
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
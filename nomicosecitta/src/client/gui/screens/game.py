@@ -3,6 +3,7 @@ Game Screen
 Single responsibility: answer-input UI and scoreboard display.
 Voting UI is fully delegated to VotingPanel.
 """
+import time
 import tkinter as tk
 from src.client.gui.screens.base_screen import BaseScreen
 from src.client.gui.widgets import TimerDisplay
@@ -18,6 +19,122 @@ _FONT_LB_NAME   = (theme.HAND_FONT,  9, "bold")
 _FONT_LB_PTS    = (theme.HAND_FONT,  9)
 _FONT_LB_DELTA  = (theme.HAND_FONT,  9, "bold")
 _MAX_LB_PLAYERS = 10
+_MEDALS         = ["🥇", "🥈", "🥉"]
+_RANK_FLASH_MS  = 900
+_SPARE_ROW_CAP  = 8     # unused answer rows kept for later rounds, the rest are destroyed
+
+
+class _CategoryRow:
+    """Label and entry for one category; reconfigured, not rebuilt, every round."""
+
+    def __init__(self, parent: tk.Frame, on_return):
+        self.category = None
+        self.var   = tk.StringVar()
+        self.frame = tk.Frame(parent, bg=theme.BG_PAGE, pady=0, padx=theme.PAD_LG)
+        self.line  = tk.Frame(parent, bg=theme.LINE_COLOR, height=1)
+
+        inner = tk.Frame(self.frame, bg=theme.BG_PAGE)
+        inner.pack(fill="x", pady=5)
+        self.label = tk.Label(inner, font=theme.FONT_LABEL,
+                              bg=theme.BG_PAGE, fg=theme.INK, anchor="w")
+        self.label.pack(side="left", padx=(0, theme.PAD_SM))
+
+        self.entry = tk.Entry(inner, textvariable=self.var)
+        theme.style_entry(self.entry)
+        self.entry.configure(highlightthickness=0, relief="flat", bd=0)
+        self.entry.pack(side="left", fill="x", expand=True, ipady=4)
+        self.entry.bind("<Return>", lambda e: on_return(self))
+
+    def show(self, category: str):
+        if category != self.category:
+            self.label.configure(text=f"{category}:")
+            self.var.set("")
+            self.category = category
+        self.frame.pack(fill="x")
+        self.line.pack(fill="x", padx=theme.PAD_LG)
+
+    def hide(self):
+        self.frame.pack_forget()
+        self.line.pack_forget()
+
+    def destroy(self):
+        self.frame.destroy()
+        self.line.destroy()
+
+
+class _LeaderboardCard:
+    """
+    One player in the leaderboard bar. show() only touches the widgets whose
+    value changed; a rank change briefly tints the name (green up, red down).
+    """
+
+    def __init__(self, parent: tk.Frame, username: str):
+        self.frame = tk.Frame(parent, bg=theme.BG_SURFACE)
+        self._sep  = tk.Frame(self.frame, bg=theme.LINE_COLOR, width=1)
+        self._body = tk.Frame(self.frame, bg=theme.BG_SURFACE)
+        self._body.pack(side="left", padx=(4, 0))
+
+        top = tk.Frame(self._body, bg=theme.BG_SURFACE)
+        top.pack(anchor="w")
+        self._medal = tk.Label(top, font=_FONT_LB_NAME, bg=theme.BG_SURFACE, fg=theme.INK)
+        self._medal.pack(side="left")
+        self._name = tk.Label(top, text=f" {username}", font=_FONT_LB_NAME,
+                              bg=theme.BG_SURFACE, fg=theme.INK)
+        self._name.pack(side="left")
+
+        bot = tk.Frame(self._body, bg=theme.BG_SURFACE)
+        bot.pack(anchor="w")
+        self._points = tk.Label(bot, font=_FONT_LB_PTS, bg=theme.BG_SURFACE, fg=theme.INK_LIGHT)
+        self._points.pack(side="left")
+        self._delta = tk.Label(bot, font=_FONT_LB_DELTA, bg=theme.BG_SURFACE, fg=theme.GREEN_INK)
+
+        self._rank: int | None = None
+        self._total = self._delta_value = None
+        self._flash_job = None
+
+    def show(self, rank: int, total: int, delta: int | None):
+        if rank != self._rank:
+            self.frame.grid(row=0, column=rank, sticky="ns")
+            self._medal.configure(text=_MEDALS[rank] if rank < 3 else f"{rank + 1}.")
+            if rank == 0:
+                self._sep.pack_forget()
+            elif self._rank in (None, 0):
+                self._sep.pack(side="left", fill="y", padx=theme.PAD_SM, pady=2, before=self._body)
+            if self._rank is not None:
+                self._flash(theme.GREEN_INK if rank < self._rank else theme.RED_INK)
+            self._rank = rank
+
+        if total != self._total:
+            self._points.configure(text=f"{total} pts")
+            self._total = total
+
+        if delta != self._delta_value:
+            if delta:
+                self._delta.configure(text=f"  +{delta}")
+                self._delta.pack(side="left")
+            else:
+                self._delta.pack_forget()
+            self._delta_value = delta
+
+    def hide(self):
+        if self._rank is not None:
+            self.frame.grid_remove()
+            self._rank = None
+
+    def destroy(self):
+        if self._flash_job:
+            self.frame.after_cancel(self._flash_job)
+        self.frame.destroy()
+
+    def _flash(self, color: str):
+        if self._flash_job:
+            self.frame.after_cancel(self._flash_job)
+        self._name.configure(fg=color)
+
+        def _restore():
+            self._flash_job = None
+            self._name.configure(fg=theme.INK)
+        self._flash_job = self.frame.after(_RANK_FLASH_MS, _restore)
 
 
 class GameScreen(BaseScreen):
@@ -46,6 +163,7 @@ class GameScreen(BaseScreen):
             parent_frame     = self._categories_frame,
             canvas           = self._canvas,
             timer_display    = self._timer,
+            ticker           = self.manager.ticker,
             on_vote_cast     = lambda t, c, v: (
                 self.manager.on_vote_cast(t, c, v)
                 if getattr(self.manager, 'on_vote_cast', None) else None),
@@ -93,8 +211,6 @@ class GameScreen(BaseScreen):
 
     # Leaderboard bar
 
-    _MEDALS = ["🥇", "🥈", "🥉"]
-
     def _setup_leaderboard_bar(self):
         outer = tk.Frame(self.frame, bg=theme.BG_SURFACE, padx=theme.PAD_SM, pady=4)
         outer.pack(fill="x")
@@ -114,48 +230,36 @@ class GameScreen(BaseScreen):
                                       scrollregion=self._lb_canvas.bbox("all"))
         self._lb_inner.bind("<Configure>", _sync_height)
 
-        tk.Label(self._lb_inner, text="No scores yet",
-                 font=(theme.HAND_FONT, 9, "italic"),
-                 bg=theme.BG_SURFACE, fg=theme.INK_LIGHT).pack(
-                     side="left", padx=theme.PAD_SM)
+        self._lb_cards: dict[str, _LeaderboardCard] = {}
+        self._lb_empty = tk.Label(self._lb_inner, text="No scores yet",
+                                  font=(theme.HAND_FONT, 9, "italic"),
+                                  bg=theme.BG_SURFACE, fg=theme.INK_LIGHT)
+        self._lb_empty.grid(row=0, column=0, padx=theme.PAD_SM)
         theme.separator(self.frame, color=theme.LINE_COLOR).pack(fill="x")
 
     def update_scoreboard(self, scores: dict, round_scores: dict = None):
-        for w in self._lb_inner.winfo_children():
-            w.destroy()
+        """
+        Reconfigure the cached player cards in place. Cards are only created
+        or destroyed when players appear in or disappear from the scores.
+        """
+        for username in self._lb_cards.keys() - scores.keys():
+            self._lb_cards.pop(username).destroy()
         if not scores:
-            tk.Label(self._lb_inner, text="No scores yet",
-                     font=(theme.HAND_FONT, 9, "italic"),
-                     bg=theme.BG_SURFACE, fg=theme.INK_LIGHT).pack(
-                         side="left", padx=theme.PAD_SM)
+            self._lb_empty.grid(row=0, column=0, padx=theme.PAD_SM)
             return
+        self._lb_empty.grid_remove()
 
         sorted_players = sorted(scores.items(), key=lambda kv: kv[1], reverse=True)
-        sorted_players = sorted_players[:_MAX_LB_PLAYERS]
         for rank, (username, total) in enumerate(sorted_players):
-            if rank > 0:
-                tk.Frame(self._lb_inner, bg=theme.LINE_COLOR, width=1).pack(
-                    side="left", fill="y", padx=theme.PAD_SM, pady=2)
-            card = tk.Frame(self._lb_inner, bg=theme.BG_SURFACE)
-            card.pack(side="left", padx=(4, 0))
-            medal = self._MEDALS[rank] if rank < 3 else f"{rank + 1}."
-            top = tk.Frame(card, bg=theme.BG_SURFACE)
-            top.pack(anchor="w")
-            tk.Label(top, text=medal,          font=_FONT_LB_NAME,
-                     bg=theme.BG_SURFACE, fg=theme.INK).pack(side="left")
-            tk.Label(top, text=f" {username}", font=_FONT_LB_NAME,
-                     bg=theme.BG_SURFACE, fg=theme.INK).pack(side="left")
-            bot = tk.Frame(card, bg=theme.BG_SURFACE)
-            bot.pack(anchor="w")
-            tk.Label(bot, text=f"{total} pts", font=_FONT_LB_PTS,
-                     bg=theme.BG_SURFACE, fg=theme.INK_LIGHT).pack(side="left")
-            delta = (round_scores or {}).get(username)
-            if delta:
-                tk.Label(bot, text=f"  +{delta}", font=_FONT_LB_DELTA,
-                         bg=theme.BG_SURFACE, fg=theme.GREEN_INK).pack(side="left")
+            card = self._lb_cards.get(username)
+            if card is None:
+                card = self._lb_cards[username] = _LeaderboardCard(self._lb_inner, username)
+            if rank < _MAX_LB_PLAYERS:
+                card.show(rank, total, (round_scores or {}).get(username))
+            else:
+                card.hide()
 
         self.update_status("Scores updated! Next round starting shortly…")
-        self.frame.update_idletasks()
 
     # Categories area
 
@@ -173,7 +277,8 @@ class GameScreen(BaseScreen):
                                 bg=theme.BG_SURFACE, troughcolor=theme.BG_SURFACE,
                                 relief="flat", bd=0)
         self._categories_frame = tk.Frame(self._canvas, bg=theme.BG_PAGE)
-        self._canvas.configure(yscrollcommand=v_scroll.set, xscrollcommand=h_scroll.set)
+        self._v_scroll = v_scroll
+        self._canvas.configure(yscrollcommand=self._on_yscroll, xscrollcommand=h_scroll.set)
         h_scroll.pack(side="bottom", fill="x")
         v_scroll.pack(side="right",  fill="y")
         self._canvas.pack(side="left", fill="both", expand=True)
@@ -181,6 +286,9 @@ class GameScreen(BaseScreen):
         self._canvas_window = self._canvas.create_window(
             (0, 0), window=self._categories_frame, anchor="nw")
         self._categories_frame.bind("<Configure>", self._on_frame_configure)
+        self._answers_frame = tk.Frame(self._categories_frame, bg=theme.BG_PAGE)
+        self._category_rows: list[_CategoryRow] = []
+        self._spare_rows:    list[_CategoryRow] = []
         self._canvas.bind("<Configure>",            self._on_canvas_configure)
         bind_mousewheel(self._canvas)
 
@@ -192,60 +300,51 @@ class GameScreen(BaseScreen):
         canvas_w  = self._canvas.winfo_width()
         self._canvas.itemconfig(self._canvas_window, width=max(canvas_w, req_w))
 
+    def _on_yscroll(self, first, last):
+        self._v_scroll.set(first, last)
+        # The voting list only renders the rows in view
+        if hasattr(self, '_voting_panel'):
+            self._voting_panel.on_view_changed()
+
     def _on_canvas_configure(self, event):
         req_w = self._categories_frame.winfo_reqwidth()
         self._canvas.itemconfig(self._canvas_window, width=max(event.width, req_w))
 
     def _create_category_fields(self, categories: list):
-        for w in self._categories_frame.winfo_children():
-            w.destroy()
-        self._answer_vars.clear()
-        self._categories = categories
-
-        for i, cat in enumerate(categories):
-            row = tk.Frame(self._categories_frame, bg=theme.BG_PAGE,
-                           pady=0, padx=theme.PAD_LG)
-            row.pack(fill="x")
-            tk.Frame(self._categories_frame, bg=theme.LINE_COLOR, height=1).pack(
-                fill="x", padx=theme.PAD_LG)
-
-            inner = tk.Frame(row, bg=theme.BG_PAGE)
-            inner.pack(fill="x", pady=5)
-            tk.Label(inner, text=f"{cat}:", font=theme.FONT_LABEL,
-                     bg=theme.BG_PAGE, fg=theme.INK, anchor="w").pack(
-                         side="left", padx=(0, theme.PAD_SM))
-
-            var = tk.StringVar()
-            self._answer_vars[cat] = var
-            entry = tk.Entry(inner, textvariable=var)
-            theme.style_entry(entry)
-            entry.configure(highlightthickness=0, relief="flat", bd=0)
-            entry.pack(side="left", fill="x", expand=True, ipady=4)
-            entry.bind("<Return>", lambda e, idx=i: self._focus_next(idx))
-
-        self.frame.update_idletasks()
+        """Show one answer row per category, reusing the rows of earlier rounds."""
+        if hasattr(self, '_voting_panel'):
+            self._voting_panel.hide()
+        for row in self._category_rows:
+            row.hide()
+
+        while len(self._category_rows) < len(categories):
+            self._category_rows.append(
+                self._spare_rows.pop() if self._spare_rows
+                else _CategoryRow(self._answers_frame, self._focus_next))
+        while len(self._category_rows) > len(categories):
+            self._spare_rows.append(self._category_rows.pop())
+        for row in self._spare_rows[_SPARE_ROW_CAP:]:
+            row.destroy()
+        del self._spare_rows[_SPARE_ROW_CAP:]
+
+        self._answer_vars = {}
+        self._categories  = categories
+        for row, cat in zip(self._category_rows, categories):
+            row.show(cat)
+            self._answer_vars[cat] = row.var
+
+        self._answers_frame.pack(fill="x")
         self._canvas.yview_moveto(0)
         self._canvas.xview_moveto(0)
 
-    def _focus_next(self, idx: int):
-        rows = [w for w in self._categories_frame.winfo_children()
-                if isinstance(w, tk.Frame)]
-        pairs = [(rows[i], rows[i + 1]) for i in range(0, len(rows) - 1, 2)]
-        if idx + 1 < len(pairs):
-            for child in pairs[idx + 1][0].winfo_children():
-                if isinstance(child, tk.Frame):
-                    for c in child.winfo_children():
-                        if isinstance(c, tk.Entry):
-                            c.focus_set(); return
+    def _focus_next(self, row: "_CategoryRow"):
+        idx = self._category_rows.index(row)
+        if idx + 1 < len(self._category_rows):
+            self._category_rows[idx + 1].entry.focus_set()
 
     def _focus_first_entry(self):
-        for w in self._categories_frame.winfo_children():
-            if isinstance(w, tk.Frame):
-                for child in w.winfo_children():
-                    if isinstance(child, tk.Frame):
-                        for c in child.winfo_children():
-                            if isinstance(c, tk.Entry):
-                                c.focus_set(); return
+        if self._category_rows:
+            self._category_rows[0].entry.focus_set()
 
     # Chat panel
 
@@ -301,20 +400,15 @@ class GameScreen(BaseScreen):
 
     def set_inputs_enabled(self, enabled: bool):
         state = "normal" if enabled else "disabled"
-        for row in self._categories_frame.winfo_children():
-            for child in row.winfo_children():
-                if isinstance(child, tk.Frame):
-                    for c in child.winfo_children():
-                        if isinstance(c, tk.Entry):
-                            c.configure(state=state)
+        for row in self._category_rows:
+            row.entry.configure(state=state)
 
     # Round lifecycle
 
     def start_round(self, letter: str, categories: list,
-                    round_number: int, duration: int, is_recovery: bool = False):
-        if hasattr(self, '_timer_job'):
-            self.frame.after_cancel(self._timer_job)
-            del self._timer_job
+                    round_number: int, duration: int, is_recovery: bool = False,
+                    deadline: float = None):
+        """deadline is the time.monotonic() at which the round ends (default: now + duration)."""
         self._voting_panel.reset()
 
         self.update_letter(letter)
@@ -327,7 +421,6 @@ class GameScreen(BaseScreen):
         self.set_inputs_enabled(True)
         self._timer.reset()
         self._focus_first_entry()
-        self._local_duration = duration
 
         if round_number == 1 and not is_recovery:
             self.update_scoreboard({})
@@ -339,52 +432,42 @@ class GameScreen(BaseScreen):
         else:
             self.update_status("Write your answers!")
 
-        self._run_local_timer()
+        if deadline is None:
+            deadline = time.monotonic() + duration
+        self.manager.ticker.start("round", deadline, self.update_timer, self._on_round_expired)
 
-    def _run_local_timer(self):
-        if (hasattr(self, '_local_duration')
-                and self._local_duration >= 0
-                and self.is_active):
-            self.update_timer(self._local_duration)
-            if self._local_duration > 0:
-                self._local_duration -= 1
-                self._timer_job = self.frame.after(1000, self._run_local_timer)
-            else:
-                self.end_round()
-                if getattr(self.manager, 'on_submit_answers', None):
-                    self.manager.on_submit_answers(self.get_answers())
+    def _on_round_expired(self):
+        if not self.is_active:
+            return
+        self.end_round()
+        if getattr(self.manager, 'on_submit_answers', None):
+            self.manager.on_submit_answers(self.get_answers())
 
     def end_round(self):
-        if hasattr(self, '_timer_job'):
-            self.frame.after_cancel(self._timer_job)
+        self.manager.ticker.cancel("round")
         self.set_inputs_enabled(False)
         self.update_status("Time's up! Waiting for the results…")
         self._timer.set_expired()
 
     def pause_timers(self):
-        if hasattr(self, '_timer_job'):
-            self.frame.after_cancel(self._timer_job)
-            del self._timer_job
-
-        if hasattr(self, '_voting_timer_job'):
-            self.frame.after_cancel(self._voting_timer_job)
-            del self._voting_timer_job
-
+        # The server re-sends the deadlines on reconnection, which restarts the ticker
+        self.manager.ticker.pause()
         self.update_status("Connessione persa. Timer in pausa...")
 
     # Voting phase
 
-    def build_voting_ui(self, words_to_vote: dict, my_username: str, duration: int = 0, is_recovery: bool = False):
+    def build_voting_ui(self, words_to_vote: dict, my_username: str, duration: int = 0,
+                        is_recovery: bool = False, deadline: float = None):
         """Hand off voting UI construction to VotingPanel."""
-        if hasattr(self, '_timer_job'):
-            self.frame.after_cancel(self._timer_job)
+        self.manager.ticker.cancel("round")
 
         if is_recovery:
             self.update_status("Connessione ristabilita! Continua a votare.")
         else:
             self.update_status("Voting phase: vote and click Ready.")
 
-        self._voting_panel.build(words_to_vote, my_username, duration)
+        self._answers_frame.pack_forget()
+        self._voting_panel.build(words_to_vote, my_username, duration, deadline)
 
     def update_peer_vote(self, target_user: str, category: str,
                          voter: str, is_valid: bool):
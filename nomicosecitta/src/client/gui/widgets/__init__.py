@@ -1,6 +1,18 @@
-from src.client.gui.widgets.timer_display import TimerDisplay
-from src.client.gui.widgets.player_list  import PlayerList
-from src.client.gui.widgets.chat_panel   import ChatPanel
-from src.client.gui.widgets.voting_panel import VotingPanel
+import importlib
 
-__all__ = ['TimerDisplay', 'PlayerList', 'ChatPanel', 'VotingPanel']
\ No newline at end of file
+# Imported on first use, like the screens: the lobby needs PlayerList
+# without paying for the voting panel
+_MODULES = {
+    'TimerDisplay': 'src.client.gui.widgets.timer_display',
+    'PlayerList':   'src.client.gui.widgets.player_list',
+    'ChatPanel':    'src.client.gui.widgets.chat_panel',
+    'VotingPanel':  'src.client.gui.widgets.voting_panel',
+}
+
+__all__ = ['TimerDisplay', 'PlayerList', 'ChatPanel', 'VotingPanel']
+
+
+def __getattr__(name):
+    if name in _MODULES:
+        return getattr(importlib.import_module(_MODULES[name]), name)
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
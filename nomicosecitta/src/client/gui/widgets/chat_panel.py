@@ -5,16 +5,27 @@ import tkinter as tk
 from tkinter import scrolledtext
 from typing import Callable, Optional
 from src.client.gui import theme
+from src.common.constants import CHAT_MAX_LINES, UI_FRAME_MS
 
 
 class ChatPanel:
+    """
+    Chat and game log. append() only queues the line: queued lines are
+    inserted together once per frame, and the oldest lines are trimmed so
+    the log never holds more than max_lines.
+    """
+
     def __init__(self, parent: tk.Widget,
                  on_send: Optional[Callable[[str], None]] = None,
-                 title: str = "Chat:"):
+                 title: str = "Chat:",
+                 max_lines: int = CHAT_MAX_LINES):
         self.frame = tk.Frame(parent, bg=theme.BG_PAGE)
         self.on_send = on_send
+        self.max_lines = max_lines
         self._title = title
         self._msg_var = tk.StringVar()
+        self._pending: list[str] = []
+        self._flush_job = None
         self._setup_ui()
 
     def _setup_ui(self):
@@ -54,12 +65,31 @@ class ChatPanel:
             self._msg_var.set("")
 
     def append(self, text: str):
+        self._pending.append(text)
+        if len(self._pending) > self.max_lines:
+            del self._pending[:-self.max_lines]
+        if self._flush_job is None:
+            self._flush_job = self.frame.after(UI_FRAME_MS, self._flush)
+
+    def _flush(self):
+        self._flush_job = None
+        if not self._pending:
+            return
+        lines, self._pending = self._pending, []
+        # Only follow new lines if the user has not scrolled back to read
+        at_bottom = self._log_area.yview()[1] >= 0.999
+
         self._log_area.config(state="normal")
-        self._log_area.insert(tk.END, text + "\n")
-        self._log_area.see(tk.END)
+        self._log_area.insert(tk.END, "\n".join(lines) + "\n")
+        excess = int(self._log_area.index("end-1c").split(".")[0]) - 1 - self.max_lines
+        if excess > 0:
+            self._log_area.delete("1.0", f"{excess + 1}.0")
         self._log_area.config(state="disabled")
+        if at_bottom:
+            self._log_area.see(tk.END)
 
     def clear(self):
+        self._pending.clear()
         self._log_area.config(state="normal")
         self._log_area.delete(1.0, tk.END)
         self._log_area.config(state="disabled")
@@ -1,13 +1,110 @@
+import time
 import tkinter as tk
+from bisect import bisect_left, bisect_right
 from tkinter import messagebox
 from typing import Callable, Optional
 
 from src.client.gui import theme
 
+_HEADER_HEIGHT = 44   # px, category title row
+_ANSWER_HEIGHT = 34   # px, one answer with its vote buttons
+_ROW_BUFFER    = 4    # rows kept rendered above and below the visible area
+_VIEW_FALLBACK = 600  # px assumed for the viewport before the canvas is laid out
+_SPARE_CAP     = 48   # recycled rows of each kind kept between rounds
+
+_CAT_FONT     = (theme.FONT_LABEL[0] if isinstance(theme.FONT_LABEL, tuple) else "Helvetica", 12, "bold")
+_BASE_FONT    = ("Helvetica", 8)
+_COUNTER_FONT = ("Helvetica", 9, "bold")
+
+
+class _HeaderRow:
+    kind = "header"
+
+    def __init__(self, parent: tk.Frame):
+        self.frame  = tk.Frame(parent, bg=theme.BG_PAGE)
+        self._label = tk.Label(self.frame, font=_CAT_FONT, bg=theme.BG_PAGE, fg=theme.INK)
+        self._label.pack(pady=(15, 5))
+
+    def bind(self, panel: "VotingPanel", item: tuple):
+        self._label.configure(text=item[1].upper())
+
+
+class _AnswerRow:
+    kind = "answer"
+
+    def __init__(self, parent: tk.Frame, panel: "VotingPanel"):
+        self.key   = None
+        self.frame = tk.Frame(parent, bg=theme.BG_PAGE)
+        self.frame.columnconfigure(0, weight=1)
+
+        self._word = tk.Label(self.frame, font=theme.FONT_BODY, bg=theme.BG_PAGE, fg=theme.INK,
+                              anchor="w", justify="left")
+        self._word.grid(row=0, column=0, sticky="ew", padx=(4, 2), pady=2)
+
+        self.btn_yes = tk.Button(self.frame, text="Valid", width=5, font=_BASE_FONT,
+                                 command=lambda: panel._cast_vote(self.key[1], self.key[0], True))
+        self.btn_no  = tk.Button(self.frame, text="Invalid", width=5, font=_BASE_FONT,
+                                 command=lambda: panel._cast_vote(self.key[1], self.key[0], False))
+        # Shown instead of the vote buttons on the player's own answer
+        self._spacers = [tk.Label(self.frame, bg=theme.BG_PAGE, width=5) for _ in range(2)]
+
+        self.valid_btn = tk.Button(self.frame, text="✅ 0", width=4, cursor="hand2",
+                                   command=lambda: panel._show_vote_details(*self.key))
+        theme.style_button(self.valid_btn, variant="ghost")
+        self.valid_btn.configure(font=_COUNTER_FONT, fg=theme.GREEN_INK)
+        self.valid_btn.grid(row=0, column=3, padx=(8, 1), sticky="ns")
+
+        self.invalid_btn = tk.Button(self.frame, text="❌ 0", width=4, cursor="hand2",
+                                     command=lambda: panel._show_vote_details(*self.key, is_invalid=True))
+        theme.style_button(self.invalid_btn, variant="ghost")
+        self.invalid_btn.configure(font=_COUNTER_FONT, fg=theme.RED_INK)
+        self.invalid_btn.grid(row=0, column=4, padx=(1, 4), sticky="ns")
+
+    def bind(self, panel: "VotingPanel", item: tuple):
+        _, category, target_user, word = item
+        self.key = (category, target_user)
+        display  = "YOU" if target_user == panel._my_username else target_user
+        self._word.configure(text=f"{display}:  {word}")
+
+        if self.key in panel._votable:
+            for column, btn in enumerate((self.btn_yes, self.btn_no), start=1):
+                btn.grid(row=0, column=column, padx=2, sticky="ns")
+            for spacer in self._spacers:
+                spacer.grid_remove()
+            self.show_choice(panel._my_choice.get(self.key))
+            state = "disabled" if panel._submitted else "normal"
+            self.btn_yes.configure(state=state)
+            self.btn_no.configure(state=state)
+        else:
+            self.btn_yes.grid_remove()
+            self.btn_no.grid_remove()
+            for column, spacer in enumerate(self._spacers, start=1):
+                spacer.grid(row=0, column=column, padx=2)
+        self.show_counts(panel._peer_votes_data.get(self.key, {}))
+
+    def show_choice(self, is_valid: Optional[bool]):
+        theme.style_button(self.btn_yes, variant="success" if is_valid is True else "ghost")
+        theme.style_button(self.btn_no,  variant="danger" if is_valid is False else "ghost")
+
+    def show_counts(self, votes: dict):
+        v = sum(1 for x in votes.values() if x is True)
+        i = sum(1 for x in votes.values() if x is False)
+        self.valid_btn.configure(text=f"✅ {v}")
+        self.invalid_btn.configure(text=f"❌ {i}")
+
 
 class VotingPanel:
     """
     Self-contained widget for the voting phase.
+
+    The answers are kept as a flat list of fixed-height rows and only the
+    ones inside the canvas viewport (plus _ROW_BUFFER on each side) exist as
+    widgets. Rows scrolled out of view are recycled for the ones scrolling
+    in, so building the list costs the same for 3 players or 30. The rows
+    and the submit bar outlive the round: hide() takes the panel off screen
+    and the next build() rebinds them (keeping at most _SPARE_CAP spare rows
+    of each kind). GameScreen calls on_view_changed() whenever the canvas
+    view moves.
     """
 
     def __init__(
@@ -15,6 +112,7 @@ class VotingPanel:
         parent_frame: tk.Frame,
         canvas: tk.Canvas,
         timer_display,
+        ticker,
         on_vote_cast:    Optional[Callable[[str, str, bool], None]] = None,
         on_submit_votes: Optional[Callable[[], None]]               = None,
         on_status_change: Optional[Callable[[str], None]]           = None,
@@ -22,48 +120,91 @@ class VotingPanel:
         self._frame           = parent_frame
         self._canvas          = canvas
         self._timer           = timer_display
+        self._ticker          = ticker
         self.on_vote_cast     = on_vote_cast
         self.on_submit_votes  = on_submit_votes
         self.on_status_change = on_status_change
 
-        self._vote_buttons:    dict = {}
-        self._voted_items:     set  = set()
+        self._items:           list = []   # ("header", category) | ("answer", category, user, word)
+        self._offsets:         list = []   # y of each item inside self._body
+        self._votable:         set  = set()
+        self._my_choice:       dict = {}
         self._peer_votes_data: dict = {}
-        self._vote_counters:   dict = {}
         self._my_username:     str  = ""
-        self._voting_timer_job      = None
-
-    def build(self, words_to_vote: dict, my_username: str, duration: int = 0):
-        """Clear the parent frame and build the full voting UI."""
+        self._submitted:       bool = False
+
+        self._container: Optional[tk.Frame] = None
+        self._body:      Optional[tk.Frame] = None
+        self._shown:     bool = False
+        self._visible: dict = {}           # item index -> row widget
+        self._rows_by_key: dict = {}       # (category, user) -> visible _AnswerRow
+        self._spare:   dict = {"header": [], "answer": []}
+
+    def build(self, words_to_vote: dict, my_username: str, duration: int = 0,
+              deadline: float = None):
+        """
+        Show the voting UI for a new round (only the visible rows get widgets).
+        The countdown ends at deadline (time.monotonic()), or duration seconds from now.
+        """
         self._my_username = my_username
         self.reset()
 
-        self._vote_buttons.clear()
-        self._voted_items.clear()
+        self._items.clear()
+        self._offsets.clear()
+        self._votable.clear()
+        self._my_choice.clear()
         self._peer_votes_data.clear()
-        self._vote_counters.clear()
-
-        for w in self._frame.winfo_children():
-            w.destroy()
+        self._submitted = False
 
+        y = 0
         for category, users_words in words_to_vote.items():
-            cat_font = (theme.FONT_LABEL[0] if isinstance(theme.FONT_LABEL, tuple) else "Helvetica", 12, "bold") 
-            tk.Label(self._frame, text=category.upper(),
-                     font=cat_font,
-                     bg=theme.BG_PAGE, fg=theme.INK).pack(pady=(15, 5))
+            self._items.append(("header", category))
+            self._offsets.append(y)
+            y += _HEADER_HEIGHT
             for target_user, word in users_words.items():
                 self._peer_votes_data[(category, target_user)] = {}
-                self._build_answer_row(category, target_user, word)
-
-        self._build_submit_row()
+                if target_user != my_username:
+                    self._votable.add((category, target_user))
+                self._items.append(("answer", category, target_user, word))
+                self._offsets.append(y)
+                y += _ANSWER_HEIGHT
+
+        if self._container is None:
+            self._container = tk.Frame(self._frame, bg=theme.BG_PAGE)
+            self._body      = tk.Frame(self._container, bg=theme.BG_PAGE)
+            self._body.pack(fill="x")
+            self._build_submit_row()
+        self._release_rows(range(0))
+        for spare in self._spare.values():
+            for row in spare[_SPARE_CAP:]:
+                row.frame.destroy()
+            del spare[_SPARE_CAP:]
+
+        self._body.configure(height=max(y, 1))
+        self._reset_submit_row()
+        self._container.pack(fill="x")
+        self._shown = True
+
+        self._canvas.yview_moveto(0)
+        self._render()
+
+        if deadline is None and duration > 0:
+            deadline = time.monotonic() + duration
+        if deadline is not None:
+            self._timer.reset()
+            self._ticker.start("voting", deadline, self._timer.update, self._on_voting_expired)
 
-        self._frame.update_idletasks()
-        self._canvas.configure(scrollregion=self._canvas.bbox("all"))
+    def on_view_changed(self):
+        """Re-render the rows after the canvas scrolled or was resized."""
+        if self._shown:
+            self._render()
 
-        if duration > 0:
-            self._timer.reset()
-            self._voting_duration = duration
-            self._run_timer()
+    def hide(self):
+        """Take the voting list off screen; its widgets are kept for the next build()."""
+        self.reset()
+        if self._container is not None:
+            self._container.pack_forget()
+        self._shown = False
 
     def update_peer_vote(self, target_user: str, category: str,
                          voter: str, is_valid: bool):
@@ -72,100 +213,89 @@ class VotingPanel:
         if key not in self._peer_votes_data:
             return
         self._peer_votes_data[key][voter] = is_valid
-        if key in self._vote_counters:
-            votes = self._peer_votes_data[key]
-            v     = sum(1 for x in votes.values() if x is True)
-            i     = sum(1 for x in votes.values() if x is False)
-            self._vote_counters[key]["valid_btn"].configure(text=f"✅ {v}")
-            self._vote_counters[key]["invalid_btn"].configure(text=f"❌ {i}")
+        row = self._rows_by_key.get(key)
+        if row:
+            row.show_counts(self._peer_votes_data[key])
 
     def reset(self):
-        """Cancel any active voting timer (call before starting a new round)."""
-        if self._voting_timer_job is not None:
-            self._frame.after_cancel(self._voting_timer_job)
-            self._voting_timer_job = None
+        """Cancel any active voting countdown (call before starting a new round)."""
+        self._ticker.cancel("voting")
 
-    # UI builders
+    # Virtualized rows
 
-    def _build_answer_row(self, category: str, target_user: str, word: str):
-        row = tk.Frame(self._frame, bg=theme.BG_PAGE)
-        row.pack(fill="x", padx=4, pady=2)
-        row.columnconfigure(0, weight=1)
-
-        display = "YOU" if target_user == self._my_username else target_user
-        word_label = tk.Label(row, text=f"{display}:  {word}",
-                              font=theme.FONT_BODY, bg=theme.BG_PAGE, fg=theme.INK,
-                              anchor="w", justify="left", wraplength=180)
-        word_label.grid(row=0, column=0, sticky="ew", padx=(0, 2), pady=2)
-        base_font = ("Helvetica", 8)
-        counter_font = ("Helvetica", 9, "bold")
-
-        if target_user != self._my_username:
-            btn_yes = tk.Button(row, text="Valid", width=5, font=base_font)
-            btn_no  = tk.Button(row, text="Invalid", width=5, font=base_font)
-            theme.style_button(btn_yes, variant="ghost")
-            theme.style_button(btn_no,  variant="ghost")
-            btn_yes.grid(row=0, column=1, padx=2, sticky="ns")
-            btn_no.grid( row=0, column=2, padx=2, sticky="ns")
-            btn_yes.configure(
-                command=lambda c=category, t=target_user, y=btn_yes, n=btn_no:
-                    self._cast_vote(t, c, True, y, n))
-            btn_no.configure(
-                command=lambda c=category, t=target_user, y=btn_yes, n=btn_no:
-                    self._cast_vote(t, c, False, y, n))
-            self._vote_buttons[(category, target_user)] = {
-                "yes": btn_yes, "no": btn_no}
-        else:
-            tk.Label(row, bg=theme.BG_PAGE, width=5).grid(row=0, column=1, padx=2)
-            tk.Label(row, bg=theme.BG_PAGE, width=5).grid(row=0, column=2, padx=2)
-
-        vbtn = tk.Button(row, text="✅ 0", width=4, cursor="hand2",
-                         command=lambda c=category, t=target_user:
-                             self._show_vote_details(c, t))
-        theme.style_button(vbtn, variant="ghost")
-        vbtn.configure(font=counter_font, fg=theme.GREEN_INK)
-        vbtn.grid(row=0, column=3, padx=(8, 1), sticky="ns")
-
-        ibtn = tk.Button(row, text="❌ 0", width=4, cursor="hand2",
-                         command=lambda c=category, t=target_user:
-                             self._show_vote_details(c, t, is_invalid=True))
-        theme.style_button(ibtn, variant="ghost")
-        ibtn.configure(font=counter_font, fg=theme.RED_INK)
-        ibtn.grid(row=0, column=4, padx=1, sticky="ns")
-
-        self._vote_counters[(category, target_user)] = {
-            "valid_btn": vbtn, "invalid_btn": ibtn}
+    def _render(self):
+        if not self._items:
+            return
+        viewport = self._canvas.winfo_height()
+        if viewport <= 1:
+            viewport = _VIEW_FALLBACK
+        top    = self._canvas.canvasy(0) - self._body.winfo_y()
+        first  = max(bisect_right(self._offsets, top) - 1 - _ROW_BUFFER, 0)
+        last   = min(bisect_left(self._offsets, top + viewport) + _ROW_BUFFER, len(self._items))
+        wanted = range(first, last)
+
+        self._release_rows(wanted)
+
+        for index in wanted:
+            if index in self._visible:
+                continue
+            item = self._items[index]
+            row  = self._take_row(item[0])
+            row.bind(self, item)
+            height = _HEADER_HEIGHT if item[0] == "header" else _ANSWER_HEIGHT
+            row.frame.place(x=0, y=self._offsets[index], relwidth=1, height=height)
+            self._visible[index] = row
+            if row.kind == "answer":
+                self._rows_by_key[row.key] = row
+
+    def _release_rows(self, keep: range):
+        """Move the rendered rows outside keep back to the spare pool."""
+        for index in [i for i in self._visible if i not in keep]:
+            row = self._visible.pop(index)
+            row.frame.place_forget()
+            if row.kind == "answer":
+                self._rows_by_key.pop(row.key, None)
+            self._spare[row.kind].append(row)
+
+    def _take_row(self, kind: str):
+        if self._spare[kind]:
+            return self._spare[kind].pop()
+        return _HeaderRow(self._body) if kind == "header" else _AnswerRow(self._body, self)
+
+    # UI builders
 
     def _build_submit_row(self):
-        sf           = tk.Frame(self._frame, bg=theme.BG_PAGE)
+        sf = tk.Frame(self._container, bg=theme.BG_PAGE)
         sf.pack(fill="x", pady=(30, 10))
-        needs_voting = len(self._vote_buttons) > 0
 
-        self._submit_btn = tk.Button(
-            sf, text="Ready",
-            command=self._on_submit_click,
-            state="disabled" if needs_voting else "normal",
-        )
+        self._submit_btn = tk.Button(sf, text="Ready", command=self._on_submit_click)
+        self._submit_btn.pack()
+
+        self._hint_label = tk.Label(sf, font=(theme.HAND_FONT, 9, "italic"),
+                                    bg=theme.BG_PAGE)
+        self._hint_label.pack(pady=(4, 0))
+
+    def _reset_submit_row(self):
+        needs_voting = len(self._votable) > 0
+        self._submit_btn.configure(text="Ready",
+                                   state="disabled" if needs_voting else "normal")
         theme.style_button(self._submit_btn,
                            variant="ghost" if needs_voting else "primary")
-        self._submit_btn.pack()
 
         hint = ("Vote all answers to unlock the button."
                 if needs_voting else "No answers to vote.")
-        self._hint_label = tk.Label(sf, text=hint,
-                                    font=(theme.HAND_FONT, 9, "italic"),
-                                    bg=theme.BG_PAGE, fg=theme.INK_LIGHT)
-        self._hint_label.pack(pady=(4, 0))
+        self._hint_label.configure(text=hint, fg=theme.INK_LIGHT)
 
     # Interaction handlers
 
-    def _cast_vote(self, target: str, category: str, is_valid: bool,
-                   btn_yes: tk.Button, btn_no: tk.Button):
-        self._voted_items.add((category, target))
-        theme.style_button(btn_yes, variant="success" if is_valid else "ghost")
-        theme.style_button(btn_no,  variant="ghost"   if is_valid else "danger")
+    def _cast_vote(self, target: str, category: str, is_valid: bool):
+        key = (category, target)
+        self._my_choice[key] = is_valid
+        row = self._rows_by_key.get(key)
+        if row:
+            row.show_choice(is_valid)
 
-        if len(self._voted_items) >= len(self._vote_buttons):
+        if len(self._my_choice) >= len(self._votable):
             self._submit_btn.configure(state="normal")
             theme.style_button(self._submit_btn, variant="primary")
             self._hint_label.configure(text="All answers voted.", fg=theme.GREEN_INK)
@@ -176,9 +306,10 @@ class VotingPanel:
             self.on_vote_cast(target, category, is_valid)
 
     def _on_submit_click(self):
-        for btns in self._vote_buttons.values():
-            btns["yes"].configure(state="disabled")
-            btns["no"].configure(state="disabled")
+        self._submitted = True
+        for row in self._rows_by_key.values():
+            row.btn_yes.configure(state="disabled")
+            row.btn_no.configure(state="disabled")
         theme.style_button(self._submit_btn, variant="ghost")
         self._submit_btn.configure(state="disabled", text="Ready for the next round!")
         self.reset()
@@ -206,16 +337,9 @@ class VotingPanel:
 
     # Timer
 
-    def _run_timer(self):
-        if not hasattr(self, '_voting_duration') or self._voting_duration < 0:
-            return
-        self._timer.update(self._voting_duration)
-        if self._voting_duration > 0:
-            self._voting_duration -= 1
-            self._voting_timer_job = self._frame.after(1000, self._run_timer)
-        else:
-            self._timer.set_expired()
-            if self.on_status_change:
-                self.on_status_change("Time's up! Submitting votes…")
-            self._submit_btn.configure(state="normal")
-            self._on_submit_click()
\ No newline at end of file
+    def _on_voting_expired(self):
+        self._timer.set_expired()
+        if self.on_status_change:
+            self.on_status_change("Time's up! Submitting votes…")
+        self._submit_btn.configure(state="normal")
+        self._on_submit_click()
@@ -0,0 +1,134 @@
+"""
+Headless front-end for bots, soak tests and automation.
+
+    bot = ClientCore(HeadlessFrontEnd(answers={"Nome": "Anna"}))
+    bot.start()
+    bot.connect_to_server("", "bot1")
+    bot.frontend.wait_for("show_lobby")
+"""
+import threading
+from typing import Callable, Optional
+
+from src.client.frontend import FrontEnd
+
+
+class HeadlessFrontEnd(FrontEnd):
+    """
+    Records every update ClientCore makes as (name, args) in `events`.
+
+    Updates run straight on the network thread, so wait_for() lets another
+    thread block until one arrives. `answers` is what the client submits at
+    the end of a round; on_event, if set, sees each event as it is recorded.
+    """
+
+    def __init__(self, answers: Optional[dict] = None,
+                 on_event: Optional[Callable[[str, tuple], None]] = None):
+        self.answers  = dict(answers or {})
+        self.on_event = on_event
+        self.events: list[tuple[str, tuple]] = []
+        self.screen   = "LOGIN"
+        self._cond    = threading.Condition()
+
+    def wait_for(self, name: str, timeout: float = 5.0, after: int = 0) -> Optional[tuple]:
+        """
+        Block until an event `name` is recorded at index >= after; return its
+        args, or None on timeout.
+        """
+        with self._cond:
+            found = self._cond.wait_for(lambda: self._find(name, after), timeout)
+            return found[1] if found else None
+
+    def names(self) -> list[str]:
+        with self._cond:
+            return [name for name, _ in self.events]
+
+    def _find(self, name: str, after: int):
+        return next((e for e in self.events[after:] if e[0] == name), None)
+
+    def _record(self, name: str, *args):
+        with self._cond:
+            self.events.append((name, args))
+            self._cond.notify_all()
+        if self.on_event:
+            self.on_event(name, args)
+
+    # Navigation
+
+    def current_screen_name(self) -> str:
+        return self.screen
+
+    def show_login(self):
+        self.screen = "LOGIN"
+        self._record("show_login")
+
+    def show_lobby(self):
+        self.screen = "LOBBY"
+        self._record("show_lobby")
+
+    def show_game(self):
+        self.screen = "GAME"
+        self._record("show_game")
+
+    # Lobby
+
+    def set_admin(self, is_admin):
+        self._record("set_admin", is_admin)
+
+    def update_player_list(self, players, admin_username=None):
+        self._record("update_player_list", players, admin_username)
+
+    def update_lobby_settings(self, mode, num_extra_categories, round_time=None):
+        self._record("update_lobby_settings", mode, num_extra_categories, round_time)
+
+    # Game
+
+    def start_round(self, letter, categories, round_number, duration,
+                    is_recovery=False, deadline=None):
+        self.screen = "GAME"
+        self._record("start_round", letter, categories, round_number, duration)
+
+    def show_voting_phase(self, words_to_vote, my_username, duration,
+                          is_recovery=False, deadline=None):
+        self.screen = "GAME"
+        self._record("show_voting_phase", words_to_vote, duration)
+
+    def update_game_letter(self, letter):
+        self._record("update_game_letter", letter)
+
+    def update_round_info(self, round_number):
+        self._record("update_round_info", round_number)
+
+    def update_game_status(self, status):
+        self._record("update_game_status", status)
+
+    def set_inputs_enabled(self, enabled):
+        self._record("set_inputs_enabled", enabled)
+
+    def update_scoreboard(self, scores, round_scores=None):
+        self._record("update_scoreboard", scores, round_scores)
+
+    def update_peer_vote(self, target_user, category, voter, is_valid):
+        self._record("update_peer_vote", target_user, category, voter, is_valid)
+
+    def append_log(self, text):
+        self._record("append_log", text)
+
+    def get_answers(self) -> dict:
+        return dict(self.answers)
+
+    # Dialogs and connection state
+
+    def show_info(self, title, text):
+        self._record("show_info", title, text)
+
+    def show_error(self, title, text):
+        self._record("show_error", title, text)
+
+    def show_warning(self, title, text):
+        self._record("show_warning", title, text)
+
+    def show_reconnecting(self, reason):
+        self._record("show_reconnecting", reason)
+
+    def hide_reconnecting(self):
+        self._record("hide_reconnecting")
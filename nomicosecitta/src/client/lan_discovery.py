@@ -0,0 +1,185 @@
+"""
+LAN server discovery.
+
+Servers broadcast "NOMI_COSE_CITTA:<tcp port>:<players>" every few seconds.
+LanDiscovery listens on the asyncio loop, probes every server it hears,
+and ranks them; the ranking is cached on disk so the next launch can try
+the best known server straight away.
+"""
+import asyncio
+import json
+import os
+import socket
+import time
+from dataclasses import dataclass, asdict
+from typing import Optional, Tuple
+
+from src.common.constants import (
+    DISCOVERY_PREFIX, DISCOVERY_PROBE_TIMEOUT, DISCOVERY_LOAD_PENALTY, DISCOVERY_CACHE_TTL
+)
+
+
+@dataclass
+class ServerCandidate:
+    host: str
+    port: int
+    load: int = 0                  # players on the server when it last announced
+    rtt:  Optional[float] = None   # TCP connect time in seconds; None = unreachable
+    seen: float = 0.0              # wall-clock time of the last announcement
+
+    @property
+    def address(self) -> Tuple[str, int]:
+        return (self.host, self.port)
+
+    @property
+    def score(self) -> float:
+        """Lower is better: connect time plus a small penalty per player."""
+        if self.rtt is None:
+            return float("inf")
+        return self.rtt + self.load * DISCOVERY_LOAD_PENALTY
+
+
+def parse_announcement(data: bytes) -> Optional[Tuple[int, int]]:
+    """(tcp port, load) from an announcement, or None if it isn't one. Load is 0 if not sent."""
+    try:
+        parts = data.decode("utf-8").strip().split(":")
+        if parts[0] != DISCOVERY_PREFIX:
+            return None
+        port = int(parts[1])
+        load = int(parts[2]) if len(parts) > 2 else 0
+    except (UnicodeDecodeError, IndexError, ValueError):
+        return None
+    return port, load
+
+
+def rank(candidates) -> list[ServerCandidate]:
+    """Reachable servers, best first."""
+    return sorted((c for c in candidates if c.rtt is not None), key=lambda c: c.score)
+
+
+async def probe(host: str, port: int, timeout: float = DISCOVERY_PROBE_TIMEOUT) -> Optional[float]:
+    """Time a TCP connection to the server; None if it can't be reached."""
+    start = time.monotonic()
+    try:
+        _, writer = await asyncio.wait_for(asyncio.open_connection(host, port), timeout)
+    except (OSError, asyncio.TimeoutError):
+        return None
+    rtt = time.monotonic() - start
+    writer.close()
+    try:
+        await writer.wait_closed()
+    except OSError:
+        pass
+    return rtt
+
+
+class DiscoveryCache:
+    """Last ranking, as JSON; entries older than DISCOVERY_CACHE_TTL are ignored."""
+
+    def __init__(self, path: str):
+        self.path = path
+
+    def load(self) -> list[ServerCandidate]:
+        try:
+            with open(self.path, encoding="utf-8") as fh:
+                entries = json.load(fh)
+            oldest = time.time() - DISCOVERY_CACHE_TTL
+            return rank(ServerCandidate(**e) for e in entries if e.get("seen", 0) >= oldest)
+        except (OSError, ValueError, TypeError):
+            return []
+
+    def save(self, candidates: list[ServerCandidate]) -> None:
+        try:
+            os.makedirs(os.path.dirname(self.path) or ".", exist_ok=True)
+            tmp = self.path + ".tmp"
+            with open(tmp, "w", encoding="utf-8") as fh:
+                json.dump([asdict(c) for c in candidates], fh)
+            os.replace(tmp, self.path)
+        except OSError as e:
+            print(f"[DISCOVERY] Could not write {self.path}: {e}")
+
+
+class _AnnouncementListener(asyncio.DatagramProtocol):
+    def __init__(self, on_announcement):
+        self._on_announcement = on_announcement
+
+    def datagram_received(self, data, addr):
+        parsed = parse_announcement(data)
+        if parsed:
+            self._on_announcement(addr[0], *parsed)
+
+
+class LanDiscovery:
+    """
+    One discovery pass: listen for `window` seconds and probe each server
+    as soon as it is first heard.
+
+    run() returns the full ranking (and caches it); first_reachable()
+    resolves as soon as any server answers a probe, so a client with an
+    empty cache doesn't have to wait for the whole window.
+    """
+
+    def __init__(self, udp_port: int, window: float, cache: DiscoveryCache):
+        self.udp_port = udp_port
+        self.window   = window
+        self.cache    = cache
+        self.candidates: dict[Tuple[str, int], ServerCandidate] = {}
+        self._probes: list[asyncio.Task] = []
+        self._first: Optional[asyncio.Future] = None
+
+    async def run(self) -> list[ServerCandidate]:
+        loop = asyncio.get_running_loop()
+        self._first_future()
+
+        sock = socket.socket(socket.AF_INET, socket.SOCK_DGRAM, socket.IPPROTO_UDP)
+        sock.setsockopt(socket.SOL_SOCKET, socket.SO_REUSEADDR, 1)
+        sock.setsockopt(socket.SOL_SOCKET, socket.SO_BROADCAST, 1)
+        transport = None
+        try:
+            sock.bind(('', self.udp_port))
+            transport, _ = await loop.create_datagram_endpoint(
+                lambda: _AnnouncementListener(self._on_announcement), sock=sock)
+            await asyncio.sleep(self.window)
+        except OSError as e:
+            print(f"[DISCOVERY] Error during discovery: {e}")
+            sock.close()
+        finally:
+            if transport:
+                transport.close()
+
+        if self._probes:
+            await asyncio.gather(*self._probes)
+        ranked = rank(self.candidates.values())
+        if ranked:
+            self.cache.save(ranked)
+            print("[DISCOVERY] Found: " + ", ".join(
+                f"{c.host}:{c.port} ({c.rtt * 1000:.0f} ms, {c.load} players)" for c in ranked))
+        else:
+            print("[DISCOVERY] No servers found on the local network.")
+        if not self._first.done():
+            self._first.set_result(None)
+        return ranked
+
+    async def first_reachable(self) -> Optional[ServerCandidate]:
+        """The first server that answered a probe, or None once run() found nothing."""
+        return await asyncio.shield(self._first_future())
+
+    def _first_future(self) -> asyncio.Future:
+        if self._first is None:
+            self._first = asyncio.get_running_loop().create_future()
+        return self._first
+
+    def _on_announcement(self, host: str, port: int, load: int):
+        known = self.candidates.get((host, port))
+        if known:
+            known.load, known.seen = load, time.time()
+            return
+        candidate = ServerCandidate(host, port, load, seen=time.time())
+        self.candidates[(host, port)] = candidate
+        print(f"[DISCOVERY] Server found at {host}:{port}!")
+        self._probes.append(asyncio.ensure_future(self._probe(candidate)))
+
+    async def _probe(self, candidate: ServerCandidate):
+        candidate.rtt = await probe(candidate.host, candidate.port)
+        if candidate.rtt is not None and not self._first.done():
+            self._first.set_result(candidate)
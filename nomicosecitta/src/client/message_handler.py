@@ -1,12 +1,12 @@
 import asyncio
-from tkinter import messagebox
+import time
 from typing import TYPE_CHECKING
 
 from src.common.message import Message, MessageType
 from src.common.constants import GAME_MODE_CLASSIC
 
 if TYPE_CHECKING:
-    from src.client.main import ClientController
+    from src.client.core import ClientCore
 
 
 class MessageHandler:
@@ -15,7 +15,7 @@ class MessageHandler:
     Holds no mutable state of its own — all state lives in the controller.
     """
 
-    def __init__(self, controller: "ClientController"):
+    def __init__(self, controller: "ClientCore"):
         self._ctrl = controller
         self._dispatch = {
             MessageType.EVT_LOBBY_UPDATE:  self._on_lobby_update,
@@ -26,77 +26,111 @@ class MessageHandler:
             MessageType.EVT_SCORE_UPDATE:  self._on_score_update,
             MessageType.EVT_GAME_OVER:     self._on_game_over,
             MessageType.EVT_ERROR:         self._on_error,
+            MessageType.EVT_TOPOLOGY:      self._on_topology,
+            MessageType.EVT_RELAY:         self._on_relay,
             MessageType.MSG_CHAT:          self._on_chat,
             MessageType.MSG_VOTE:          self._on_vote,
+            MessageType.MSG_VOTE_BATCH:    self._on_vote_batch,
+            MessageType.MSG_GOSSIP:        self._on_gossip,
+            MessageType.MSG_GOSSIP_DIGEST: self._on_gossip_digest,
         }
 
     def handle(self, msg: Message) -> None:
         """Dispatch a message to its handler. Unknown types are logged."""
+        if msg.sender == "SERVER":
+            self._ctrl.clock.observe(msg.timestamp)
+        elif self._ctrl.p2p_broadcaster.is_duplicate(msg):
+            return
         handler = self._dispatch.get(msg.type)
         if handler:
             handler(msg)
         else:
-            self._after(lambda: self._ctrl.gui.append_log(
+            self._after(lambda: self._ctrl.frontend.append_log(
                 f"[{msg.sender}] {msg.type}"))
 
     # Server to client
 
     def _on_lobby_update(self, msg: Message) -> None:
         c = self._ctrl
-        if c.gui._current_screen.name in ("LOBBY", "LOGIN"):
-            self._after(c.gui.show_lobby)
+        if c.frontend.current_screen_name() in ("LOBBY", "LOGIN"):
+            self._after(c.frontend.show_lobby)
 
         players  = msg.payload.get("players", [])
         admin    = msg.payload.get("admin")
         settings = msg.payload.get("settings", {})
         is_admin = (admin == c.username)
 
-        self._after(lambda: c.gui.set_admin(is_admin))
-        self._after(lambda: c.gui.update_player_list(players, admin_username=admin))
+        self._after(lambda: c.frontend.set_admin(is_admin), key="admin")
+        self._after(lambda: c.frontend.update_player_list(players, admin_username=admin), key="players")
 
         if settings:
             mode      = settings.get("mode", GAME_MODE_CLASSIC)
             num_extra = settings.get("num_extra_categories", 2)
             rt        = settings.get("round_time")
             self._after(lambda m=mode, n=num_extra, r=rt:
-                        c.gui.update_lobby_settings(m, n, r))
+                        c.frontend.update_lobby_settings(m, n, r), key="lobby_settings")
 
     def _on_peer_map(self, msg: Message) -> None:
         self._ctrl.peer_map = msg.payload.get("peermap", {})
         print(f"[MSG_HANDLER] Peer map: {self._ctrl.peer_map}")
 
+    def _on_relay(self, msg: Message) -> None:
+        # A peer message that came through the server instead of a direct connection
+        try:
+            inner = Message.from_dict(msg.payload.get("message"))
+        except ValueError as e:
+            print(f"[MSG_HANDLER] Invalid relayed message: {e}")
+            return
+        if not inner.type.name.startswith("MSG_"):
+            print(f"[MSG_HANDLER] Ignoring relayed {inner.type} from {inner.sender}")
+            return
+        self.handle(inner)
+
+    def _on_topology(self, msg: Message) -> None:
+        self._ctrl.reconnection_manager.update_topology(
+            primary=msg.payload.get("primary", ""),
+            replicas=msg.payload.get("replicas", []),
+            epoch=msg.payload.get("epoch", 0),
+        )
+
     def _on_round_start(self, msg: Message) -> None:
         c = self._ctrl
-        self._after(c.gui.show_game)
+        self._after(c.frontend.show_game)
         letter       = msg.payload.get("letter", "?")
         categories   = msg.payload.get("categories", [])
         duration     = msg.payload.get("duration", 60)
         round_number = msg.payload.get("round_number", 1)
         is_recovery  = msg.payload.get("is_recovery", False)
-        self._after(lambda: c.gui.start_round(letter, categories, round_number, duration, is_recovery))
+        deadline     = self._local_deadline(msg.payload, duration)
+        self._after(lambda: c.frontend.start_round(letter, categories, round_number, duration,
+                                                   is_recovery, deadline))
 
     def _on_round_end(self, msg: Message) -> None:
         c = self._ctrl
-        self._after(lambda: c.gui.update_game_status("Time's up! Voting phase starting…"))
-        self._after(lambda: c.gui.set_inputs_enabled(False))
+        self._after(lambda: c.frontend.update_game_status("Time's up! Voting phase starting…"), key="status")
+        self._after(lambda: c.frontend.set_inputs_enabled(False))
         c.submit_answers()
 
     def _on_voting_start(self, msg: Message) -> None:
         c               = self._ctrl
         words_to_vote   = msg.payload.get("words_to_vote", {})
         c.my_votes      = {cat: {} for cat in words_to_vote}
+        c.reviewers     = msg.payload.get("reviewers")
+        c.peer_vote_seqs = {}
         duration        = msg.payload.get("duration", 180)
         letter          = msg.payload.get("letter")
         round_number    = msg.payload.get("round_number")
         is_recovery     = msg.payload.get("is_recovery", False)
+        deadline        = self._local_deadline(msg.payload, duration)
 
         if letter:
-            self._after(lambda: c.gui.update_game_letter(letter))
+            self._after(lambda: c.frontend.update_game_letter(letter), key="letter")
         if round_number:
-            self._after(lambda: c.gui.update_round_info(round_number))
+            self._after(lambda: c.frontend.update_round_info(round_number), key="round_info")
 
         print(f"[MSG_HANDLER] Voting phase")
-        self._after(lambda: c.gui.show_voting_phase(words_to_vote, c.username, duration, is_recovery))
+        self._after(lambda: c.frontend.show_voting_phase(words_to_vote, c.username, duration,
+                                                         is_recovery, deadline))
 
     def _on_score_update(self, msg: Message) -> None:
         c             = self._ctrl
@@ -108,7 +142,7 @@ class MessageHandler:
         if is_recovery:
             return
 
-        self._after(lambda: c.gui.update_scoreboard(global_scores, round_scores))
+        self._after(lambda: c.frontend.update_scoreboard(global_scores, round_scores), key="scoreboard")
 
         if round_scores:
             max_score = max(round_scores.values())
@@ -126,29 +160,30 @@ class MessageHandler:
         else:
             summary = f"── Round {round_number} done ──"
 
-        self._after(lambda: c.gui.append_log(summary))
-        self._after(lambda: c.gui.update_game_status(
-            "Round ended — next round starting soon…"))
+        self._after(lambda: c.frontend.append_log(summary))
+        self._after(lambda: c.frontend.update_game_status(
+            "Round ended — next round starting soon…"), key="status")
 
     def _on_game_over(self, msg: Message) -> None:
         c      = self._ctrl
         winner = msg.payload.get("winner", "Unknown")
         scores = msg.payload.get("scores", {})
 
-        self._after(lambda: c.gui.update_scoreboard(scores))
+        self._after(lambda: c.frontend.update_scoreboard(scores), key="scoreboard")
+        c.p2p_broadcaster.gossip.stop()
 
         lines   = ["GAME OVER", f"Winner: {winner}", ""]
         lines  += [f"  {u}: {p} pts"
                    for u, p in sorted(scores.items(), key=lambda kv: kv[1], reverse=True)]
         message = "\n".join(lines)
 
-        self._after(lambda: messagebox.showinfo("Game Over", message))
-        self._after(c.gui.show_lobby)
+        self._after(lambda: c.frontend.show_info("Game Over", message))
+        self._after(c.frontend.show_lobby)
         print(f"[MSG_HANDLER] Game over — winner: {winner}")
 
     def _on_error(self, msg: Message) -> None:
         err = msg.payload.get("error", "Generic error")
-        self._after(lambda: messagebox.showerror("Error", err))
+        self._after(lambda: self._ctrl.frontend.show_error("Error", err))
         asyncio.run_coroutine_threadsafe(
             self._ctrl.network.disconnect(), self._ctrl.loop
         )
@@ -156,8 +191,15 @@ class MessageHandler:
     # Peer to client
 
     def _on_chat(self, msg: Message) -> None:
+        limiter = self._ctrl.chat_limiter
+        if not limiter.allow(msg.sender):
+            return
+        hidden = limiter.dropped.pop(msg.sender, 0)
+        if hidden:
+            note = f"[{hidden} messages from {msg.sender} hidden: too many at once]"
+            self._after(lambda: self._ctrl.frontend.append_log(note))
         text = f"{msg.sender}: {msg.payload.get('text', '')}"
-        self._after(lambda: self._ctrl.gui.append_log(text))
+        self._after(lambda: self._ctrl.frontend.append_log(text))
 
     def _on_vote(self, msg: Message) -> None:
         c        = self._ctrl
@@ -166,11 +208,42 @@ class MessageHandler:
         is_valid = msg.payload["valid"]
         voter    = msg.sender
         print(f"[P2P] Vote from {voter}: {target} → {category} = {is_valid}")
-        self._after(lambda: c.gui.update_peer_vote(
-            target_user=target, category=category, voter=voter, is_valid=is_valid))
+        self._after(lambda: c.frontend.update_peer_vote(
+            target_user=target, category=category, voter=voter, is_valid=is_valid),
+            key=("peer_vote", category, target, voter))
+
+    def _on_vote_batch(self, msg: Message) -> None:
+        c     = self._ctrl
+        seq   = msg.payload.get("seq", 0)
+        voter = msg.sender
+        for category, target, is_valid in msg.payload.get("votes", []):
+            # A late batch must not overwrite a newer vote on the same row
+            key = (voter, category, target)
+            if seq <= c.peer_vote_seqs.get(key, -1):
+                continue
+            c.peer_vote_seqs[key] = seq
+            self._after(lambda t=target, cat=category, v=is_valid: c.frontend.update_peer_vote(
+                target_user=t, category=cat, voter=voter, is_valid=v),
+                key=("peer_vote", category, target, voter))
+
+    def _on_gossip(self, msg: Message) -> None:
+        # Envelopes are unwrapped by the engine, which hands new ones back to handle()
+        self._ctrl.p2p_broadcaster.gossip.receive(msg)
+
+    def _on_gossip_digest(self, msg: Message) -> None:
+        self._ctrl.p2p_broadcaster.gossip.receive_digest(msg)
 
     # Utility
 
-    def _after(self, fn) -> None:
-        """Schedule a callable on the Tkinter main thread."""
-        self._ctrl.root.after(0, fn)
\ No newline at end of file
+    def _local_deadline(self, payload: dict, duration: float) -> float:
+        """The phase's end on this machine's monotonic clock (server deadline if sent)."""
+        if "deadline" in payload:
+            return self._ctrl.clock.to_monotonic(payload["deadline"])
+        return time.monotonic() + duration
+
+    def _after(self, fn, key=None) -> None:
+        """
+        Schedule a callable on the front-end's thread (the Tk main thread in
+        the GUI client). A keyed update replaces a pending one with the same key.
+        """
+        self._ctrl.post(fn, key)
\ No newline at end of file
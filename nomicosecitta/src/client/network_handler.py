@@ -1,7 +1,10 @@
 import asyncio
 
-from src.common.constants import BUFFER_SIZE, ENCODING, DEFAULT_SERVER_HOST, DEFAULT_SERVER_PORT
+from src.common.constants import (
+    BUFFER_SIZE, ENCODING, DEFAULT_SERVER_HOST, DEFAULT_SERVER_PORT, P2P_IDLE_TIMEOUT
+)
 from src.common.message import Message
+from src.client.p2p_pool import P2PConnectionPool
 
 class NetworkHandler:
     """
@@ -30,6 +33,7 @@ class NetworkHandler:
 
         self.p2p_server = None
         self.p2p_port = None
+        self.p2p_pool = P2PConnectionPool()
 
         # Callbacks
         self.on_message = None  # called when a message is received: on_message(data: str)
@@ -74,6 +78,7 @@ class NetworkHandler:
             return
         
         self.running = False
+        await self.p2p_pool.close_all()
 
         if self.receive_task:
             self.receive_task.cancel()
@@ -168,22 +173,36 @@ class NetworkHandler:
 
     async def _handle_p2p_connection(self, reader, writer):
         """Handle incoming P2P connections from other players for voting.
+
+        Peers keep the connection open and send one message per line, so
+        lines are read until the peer closes it or stays idle too long.
+        Each message with an id is acknowledged by writing the id back.
         Args:            
             reader: AsyncIO StreamReader for the P2P connection.
             writer: AsyncIO StreamWriter for the P2P connection.
         """
         peer_addr = writer.get_extra_info('peername')
         try:
-            data = await reader.readline()
-            if data:
+            while True:
+                data = await asyncio.wait_for(reader.readline(), 2 * P2P_IDLE_TIMEOUT)
+                if not data:
+                    break
                 json_msg = data.decode(ENCODING).strip()
-                if json_msg:
+                if not json_msg:
+                    continue
+                try:
                     message = Message.from_json(json_msg)
-                    if self.on_message:
-                        self.on_message(message)
-                        
-        except ValueError as e:
-            print(f"[P2P] JSON error {peer_addr}: {e}")
+                except ValueError as e:
+                    print(f"[P2P] JSON error {peer_addr}: {e}")
+                    continue
+                if self.on_message:
+                    self.on_message(message)
+                if message.msg_id:
+                    writer.write((message.msg_id + "\n").encode(ENCODING))
+                    await writer.drain()
+
+        except asyncio.TimeoutError:
+            pass
         except Exception as e:
             print(f"[P2P] Error receiving from {peer_addr}: {e}")
         finally:
@@ -192,7 +211,8 @@ class NetworkHandler:
 
     async def send_p2p(self, peer_address: str, message: Message):
         """
-        Open a temporary connection to a peer and send a message.
+        Send a message to a peer over its pooled connection; a message
+        with an id also waits for the peer's acknowledgement.
         
         Args:
             peer_address: Address of the peer in "ip:port" format.
@@ -200,21 +220,8 @@ class NetworkHandler:
         Returns:        
         bool: True if sent successfully, False otherwise.
         """
-        try:
-            ip, port_str = peer_address.split(':')
-            port = int(port_str)
-            _, writer = await asyncio.open_connection(ip, port)
-            json_str = message.to_json()
-            data = (json_str + "\n").encode(ENCODING)
-            writer.write(data)
-            await writer.drain()
-            writer.close()
-            await writer.wait_closed()
-            return True
-            
-        except Exception as e:
-            print(f"[P2P] Error sending to {peer_address}: {e}")
-            return False
+        data = (message.to_json() + "\n").encode(ENCODING)
+        return await self.p2p_pool.send(peer_address, data, ack=message.msg_id)
 
     async def _handle_disconnect(self, reason):
         """
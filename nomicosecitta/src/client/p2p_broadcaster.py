@@ -1,40 +1,195 @@
-from typing import Callable
+import asyncio
+import time
+import uuid
+from collections import OrderedDict
+from typing import Callable, Optional
+
+from src.common.constants import (
+    P2P_FANOUT_CONCURRENCY, P2P_SEND_TIMEOUT, P2P_MAX_FAILURES, P2P_PEER_COOLDOWN,
+    P2P_SLOW_RTT, P2P_GOSSIP_MIN_PEERS, P2P_SEEN_IDS,
+)
 from src.common.message import Message, MessageType
+from src.client.gossip import GossipEngine
+
+
+class PeerPaths:
+    """
+    Direct-path reachability and RTT per peer.
+
+    Every direct send feeds an exponentially weighted RTT average, measured
+    from the write to the peer's acknowledgement. After
+    max_failures failures in a row, or once the average exceeds slow_rtt,
+    the peer is reached through the server relay for cooldown seconds; the
+    first direct send after that is a probe that starts a fresh average.
+    """
+
+    ALPHA = 0.3  # weight of the newest RTT sample
+
+    def __init__(self, max_failures: int = P2P_MAX_FAILURES, cooldown: float = P2P_PEER_COOLDOWN,
+                 slow_rtt: float = P2P_SLOW_RTT):
+        self.max_failures = max_failures
+        self.cooldown     = cooldown
+        self.slow_rtt     = slow_rtt
+        self._failures:    dict[str, int]   = {}
+        self._rtt:         dict[str, float] = {}
+        self._relay_until: dict[str, float] = {}
+
+    def prefers_direct(self, peer_name: str) -> bool:
+        return time.monotonic() >= self._relay_until.get(peer_name, 0.0)
+
+    def rtt(self, peer_name: str) -> Optional[float]:
+        return self._rtt.get(peer_name)
+
+    def record(self, peer_name: str, ok: bool, rtt: float = 0.0):
+        """Record the outcome of one direct send that took rtt seconds."""
+        if peer_name in self._relay_until and self.prefers_direct(peer_name):
+            # Probe after a relay period: old samples no longer describe the path
+            del self._relay_until[peer_name]
+            self._rtt.pop(peer_name, None)
+
+        if not ok:
+            failures = self._failures[peer_name] = self._failures.get(peer_name, 0) + 1
+            if failures >= self.max_failures:
+                self._use_relay(peer_name, f"failed {failures} times")
+            return
+
+        self._failures.pop(peer_name, None)
+        previous = self._rtt.get(peer_name)
+        average  = self._rtt[peer_name] = rtt if previous is None else (
+            self.ALPHA * rtt + (1 - self.ALPHA) * previous)
+        if average > self.slow_rtt:
+            self._use_relay(peer_name, f"RTT {average * 1000:.0f} ms")
+
+    def _use_relay(self, peer_name: str, reason: str):
+        self._relay_until[peer_name] = time.monotonic() + self.cooldown
+        print(f"[P2P] {peer_name}: {reason} — relaying through the server for {self.cooldown}s")
+
 
 class P2PBroadcaster:
-    def __init__(self, get_network: Callable, get_peer_map: Callable, get_username: Callable):
+    """
+    Sends chat and votes to the other players.
+
+    Small rooms use a full mesh (one copy per peer). From
+    P2P_GOSSIP_MIN_PEERS peers on, messages are published through the
+    GossipEngine instead; deliver() receives the messages it relays to us.
+    Each copy goes to its peer directly or, when PeerPaths says the direct
+    path is down or slow, through the server (CMD_RELAY). Every message
+    carries an id, so a receiver drops the relayed copy of a direct send
+    that did arrive but was acknowledged too late.
+    """
+
+    def __init__(self, get_network: Callable, get_peer_map: Callable, get_username: Callable,
+                 get_reviewers: Optional[Callable] = None, deliver: Optional[Callable] = None,
+                 send_timeout: float = P2P_SEND_TIMEOUT, max_concurrency: int = P2P_FANOUT_CONCURRENCY):
         self.get_network = get_network
         self.get_peer_map = get_peer_map
         self.get_username = get_username
+        self.get_reviewers = get_reviewers
+        self.send_timeout = send_timeout
+        self.paths = PeerPaths()
+        self.gossip = GossipEngine(self._send, get_peer_map, get_username,
+                                   deliver=lambda msg: deliver(msg) if deliver else None)
+        self._slots = asyncio.Semaphore(max_concurrency)
+        self._seen: OrderedDict[tuple[str, str], None] = OrderedDict()
 
-    async def broadcast_vote(self, target_user: str, category: str, is_valid: bool):
+    def is_duplicate(self, msg: Message) -> bool:
+        """True if this peer message was already received (directly or relayed)."""
+        if not msg.msg_id:
+            return False
+        key = (msg.sender, msg.msg_id)
+        if key in self._seen:
+            return True
+        self._seen[key] = None
+        if len(self._seen) > P2P_SEEN_IDS:
+            self._seen.popitem(last=False)
+        return False
+
+    def gossip_mode(self) -> bool:
+        return len(self.get_peer_map()) - 1 >= P2P_GOSSIP_MIN_PEERS
+
+    async def broadcast_vote_batch(self, seq: int, votes: list[list]):
+        """Send one MSG_VOTE_BATCH of [category, target, valid] votes to each peer."""
         network = self.get_network()
         if not network:
             return
-            
-        username = self.get_username()
-        vote_msg = Message(
-            type=MessageType.MSG_VOTE,
-            sender=username,
-            payload={"target": target_user, "category": category, "valid": is_valid},
-        )
-        
+
+        username  = self.get_username()
+        if self.gossip_mode():
+            await self.gossip.publish(Message(
+                type=MessageType.MSG_VOTE_BATCH,
+                sender=username,
+                payload={"seq": seq, "votes": votes},
+            ))
+            return
+        reviewers = self.get_reviewers() if self.get_reviewers else None
+
+        deliveries = []
         for peer_name, peer_address in self.get_peer_map().items():
-            if peer_name != username:
-                await network.send_p2p(peer_address, vote_msg)
+            if peer_name == username:
+                continue
+            # With sharded review a peer only needs the votes on answers it also reviews
+            peer_votes = votes if not reviewers else [
+                vote for vote in votes
+                if peer_name in reviewers.get(vote[0], {}).get(vote[1], ())
+            ]
+            if peer_votes:
+                deliveries.append((peer_name, peer_address, Message(
+                    type=MessageType.MSG_VOTE_BATCH,
+                    sender=username,
+                    payload={"seq": seq, "votes": peer_votes},
+                )))
+        await self._fan_out(network, deliveries)
 
     async def broadcast_chat(self, msg_text: str):
         network = self.get_network()
         if not network:
             return
-            
+
         username = self.get_username()
         chat_msg = Message(
             type=MessageType.MSG_CHAT,
             sender=username,
             payload={"text": msg_text},
         )
-        
-        for peer_name, peer_address in self.get_peer_map().items():
-            if peer_name != username:
-                await network.send_p2p(peer_address, chat_msg)
\ No newline at end of file
+        if self.gossip_mode():
+            await self.gossip.publish(chat_msg)
+            return
+        await self._fan_out(network, [
+            (peer_name, peer_address, chat_msg)
+            for peer_name, peer_address in self.get_peer_map().items()
+            if peer_name != username
+        ])
+
+    async def _send(self, deliveries: list[tuple[str, str, Message]]):
+        network = self.get_network()
+        if network:
+            await self._fan_out(network, deliveries)
+
+    async def _fan_out(self, network, deliveries: list[tuple[str, str, Message]]):
+        """Send to all peers concurrently; a slow or dead peer only costs its own deadline."""
+        async def deliver(peer_name: str, peer_address: str, message: Message):
+            if not message.msg_id:
+                message.msg_id = uuid.uuid4().hex
+            if self.paths.prefers_direct(peer_name):
+                async with self._slots:
+                    started = time.monotonic()
+                    try:
+                        ok = await asyncio.wait_for(network.send_p2p(peer_address, message), self.send_timeout)
+                    except asyncio.TimeoutError:
+                        print(f"[P2P] {peer_name} did not answer within {self.send_timeout}s")
+                        ok = False
+                self.paths.record(peer_name, bool(ok), time.monotonic() - started)
+                if ok:
+                    return
+            await self._relay(network, peer_name, message)
+
+        await asyncio.gather(*(deliver(*delivery) for delivery in deliveries))
+
+    async def _relay(self, network, peer_name: str, message: Message):
+        sent = await network.send(Message(
+            type=MessageType.CMD_RELAY,
+            sender=self.get_username(),
+            payload={"target": peer_name, "message": message.to_dict()},
+        ))
+        if not sent:
+            print(f"[P2P] Could not relay {message.type} to {peer_name}")
@@ -0,0 +1,106 @@
+import asyncio
+
+from src.common.constants import P2P_IDLE_TIMEOUT, ENCODING
+
+
+class _PeerConnection:
+    def __init__(self, reader: asyncio.StreamReader, writer: asyncio.StreamWriter):
+        self.reader     = reader
+        self.writer     = writer
+        self.idle_timer: asyncio.TimerHandle | None = None
+
+    def is_usable(self) -> bool:
+        return not self.writer.is_closing() and not self.reader.at_eof()
+
+    async def close(self):
+        if self.idle_timer:
+            self.idle_timer.cancel()
+        try:
+            self.writer.close()
+            await self.writer.wait_closed()
+        except Exception:
+            pass
+
+
+class P2PConnectionPool:
+    """
+    Long-lived outgoing connections to peers, keyed by "ip:port".
+
+    Messages to the same peer share one stream (newline framed, in order).
+    A send with an ack id only succeeds once the peer has written that id
+    back. A connection is closed after idle_timeout seconds without traffic,
+    and a send on a connection the peer has dropped reconnects once and
+    retries.
+    """
+
+    def __init__(self, idle_timeout: float = P2P_IDLE_TIMEOUT):
+        self.idle_timeout = idle_timeout
+        self._connections: dict[str, _PeerConnection] = {}
+        self._locks:       dict[str, asyncio.Lock]    = {}
+
+    async def send(self, peer_address: str, data: bytes, ack: str = "") -> bool:
+        """Write one framed message to the peer. Returns False if it could not be delivered."""
+        lock = self._locks.setdefault(peer_address, asyncio.Lock())
+        async with lock:
+            while True:
+                reused = peer_address in self._connections
+                try:
+                    conn = await self._get(peer_address)
+                    conn.writer.write(data)
+                    await conn.writer.drain()
+                    if ack:
+                        await self._await_ack(conn, ack)
+                    self._touch(peer_address, conn)
+                    return True
+                except Exception as e:
+                    await self._drop(peer_address)
+                    # A pooled stream may have died while idle: retry once on a new one
+                    if not reused:
+                        print(f"[P2P] Error sending to {peer_address}: {e}")
+                        return False
+
+    async def close_all(self):
+        for address in list(self._connections):
+            await self._drop(address)
+
+    def __len__(self) -> int:
+        return len(self._connections)
+
+    async def _get(self, peer_address: str) -> _PeerConnection:
+        conn = self._connections.get(peer_address)
+        if conn and not conn.is_usable():
+            await self._drop(peer_address)
+            conn = None
+        if conn is None:
+            ip, port_str = peer_address.split(':')
+            reader, writer = await asyncio.open_connection(ip, int(port_str))
+            conn = self._connections[peer_address] = _PeerConnection(reader, writer)
+        return conn
+
+    @staticmethod
+    async def _await_ack(conn: _PeerConnection, ack: str):
+        # Acks of sends that timed out earlier may still be queued: skip them
+        while True:
+            line = await conn.reader.readline()
+            if not line:
+                raise ConnectionResetError("peer closed the connection before acknowledging")
+            if line.decode(ENCODING).strip() == ack:
+                return
+
+    def _touch(self, peer_address: str, conn: _PeerConnection):
+        if conn.idle_timer:
+            conn.idle_timer.cancel()
+        conn.idle_timer = asyncio.get_running_loop().call_later(
+            self.idle_timeout,
+            lambda: asyncio.ensure_future(self._expire(peer_address, conn)),
+        )
+
+    async def _expire(self, peer_address: str, conn: _PeerConnection):
+        async with self._locks.setdefault(peer_address, asyncio.Lock()):
+            if self._connections.get(peer_address) is conn:
+                await self._drop(peer_address)
+
+    async def _drop(self, peer_address: str):
+        conn = self._connections.pop(peer_address, None)
+        if conn:
+            await conn.close()
@@ -0,0 +1,29 @@
+import time
+
+from src.common.constants import CHAT_RATE_LIMIT, CHAT_BURST
+
+
+class RateLimiter:
+    """
+    Token bucket per key: up to `burst` events at once, refilled at `rate`
+    events per second. A rate of 0 lets everything through.
+    """
+
+    def __init__(self, rate: float = CHAT_RATE_LIMIT, burst: int = CHAT_BURST):
+        self.rate  = rate
+        self.burst = burst
+        self._buckets: dict[str, tuple[float, float]] = {}  # key -> (tokens, last refill)
+        self.dropped:  dict[str, int] = {}
+
+    def allow(self, key: str) -> bool:
+        if self.rate <= 0:
+            return True
+        now = time.monotonic()
+        tokens, last = self._buckets.get(key, (self.burst, now))
+        tokens = min(self.burst, tokens + (now - last) * self.rate)
+        if tokens < 1:
+            self._buckets[key] = (tokens, now)
+            self.dropped[key] = self.dropped.get(key, 0) + 1
+            return False
+        self._buckets[key] = (tokens - 1, now)
+        return True
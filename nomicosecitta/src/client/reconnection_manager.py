@@ -1,9 +1,12 @@
 import asyncio
 import json
 import os
-import socket
+import random
 from typing import Callable, Optional, Tuple
 
+from src.client.lan_discovery import LanDiscovery, DiscoveryCache
+from src.common.constants import DISCOVERY_UDP_PORT, DISCOVERY_CACHE_FILE
+
 class ReconnectionManager:
     """
     Manages automatic reconnection with circular server retry.
@@ -12,6 +15,9 @@ class ReconnectionManager:
     _DEFAULT_FALLBACK_SERVERS = ["127.0.0.1:5000"]
     _DEFAULT_MAX_RETRIES = 6
     _DEFAULT_RETRY_DELAY = 2.0
+    _DEFAULT_MAX_RETRY_DELAY = 10.0
+    _DEFAULT_STAGGER = 0.25
+    _DEFAULT_CONNECT_TIMEOUT = 3.0
 
     def __init__(self, config_path: Optional[str] = None):
         resolved = config_path or self._find_config()
@@ -25,15 +31,26 @@ class ReconnectionManager:
         ]
         self.max_retries: int = recon_cfg.get(
             "max_retries_per_server", self._DEFAULT_MAX_RETRIES)
+        # Every round races all servers, so N rounds try each server N times
+        self.max_rounds: int = recon_cfg.get("max_rounds", self.max_retries)
         self.retry_delay: float = recon_cfg.get(
             "retry_delay_seconds", self._DEFAULT_RETRY_DELAY)
+        self.max_retry_delay: float = recon_cfg.get(
+            "max_retry_delay_seconds", self._DEFAULT_MAX_RETRY_DELAY)
+        self.stagger: float = recon_cfg.get(
+            "stagger_seconds", self._DEFAULT_STAGGER)
+        self.connect_timeout: float = recon_cfg.get(
+            "connect_timeout_seconds", self._DEFAULT_CONNECT_TIMEOUT)
         
         self._index: int = 0
         self._active: bool = False
+        self._epoch: int = -1
+        self._discovery: Optional[asyncio.Task] = None
+        self._lan: Optional[LanDiscovery] = None
 
         print(f"[ReconnectionManager] Fallback Servers: {self.server_list}")
-        print(f"[ReconnectionManager] Retries/server: {self.max_retries}, "
-              f"delay: {self.retry_delay}s")
+        print(f"[ReconnectionManager] Rounds: {self.max_rounds} (each tries every server once), "
+              f"delay: {self.retry_delay}-{self.max_retry_delay}s, stagger: {self.stagger}s")
         
     def _find_config(self) -> str:
         here = os.path.dirname(os.path.abspath(__file__))
@@ -72,14 +89,102 @@ class ReconnectionManager:
         port = int(parts[1]) if len(parts) > 1 else 5000
         return (host, port)
     
-    def set_discovered_server(self, host: str, port: int):
+    def set_discovered_servers(self, servers: list[Tuple[str, int]]):
         """
-        Forces the manager to exclusively use the discovered LAN server,
+        Forces the manager to use the discovered LAN servers (best first),
         wiping out any static fallback configurations.
         """
-        self.servers = [(host, port)]
+        self.servers = list(servers)
+        self._index = 0
+        print(f"[ReconnectionManager] Locked connection target to discovered servers: {self.server_list}")
+
+    def update_topology(self, primary: str, replicas: list[str], epoch: int) -> bool:
+        """
+        Replace the rotation with the replica set advertised by the server.
+
+        Topologies older than the last one seen (lower epoch) are ignored.
+        Returns True if the rotation was updated.
+        """
+        if epoch < self._epoch or not primary:
+            return False
+
+        ordered = [self._parse_address(primary)]
+        for addr in replicas:
+            parsed = self._parse_address(addr)
+            if parsed not in ordered:
+                ordered.append(parsed)
+
+        self._epoch = epoch
+        self.servers = ordered
         self._index = 0
-        print(f"[ReconnectionManager] Locked connection target to discovered server: {host}:{port}")
+        print(f"[ReconnectionManager] Topology epoch {epoch}: {self.server_list}")
+        return True
+
+    def _candidates(self) -> list[Tuple[str, int]]:
+        """
+        Servers ordered by how likely they are to be the new primary.
+
+        The server we just lost is the least likely one, so every other
+        replica is tried before it.
+        """
+        current = self.servers[self._index]
+        others  = [s for s in self.servers if s != current]
+        return others + [current]
+
+    async def _race(self, candidates: list[Tuple[str, int]], network_factory: Callable):
+        """
+        Happy-eyeballs race: connect to the candidates in order, starting
+        each one `stagger` seconds after the previous (or as soon as it
+        fails), and keep the first that succeeds. Attempts still running
+        are cancelled; the whole race gives up after `connect_timeout`.
+
+        Returns (server, handler) or (None, None) if every attempt failed.
+        """
+        loop     = asyncio.get_running_loop()
+        deadline = loop.time() + self.connect_timeout
+        queue    = list(candidates)
+        attempts = {}
+
+        winner = (None, None)
+        pending = set()
+        losers = []
+        try:
+            while (queue or pending) and winner[1] is None:
+                if queue:
+                    server  = queue.pop(0)
+                    handler = network_factory(*server)
+                    task    = asyncio.ensure_future(handler.connect())
+                    attempts[task] = (server, handler)
+                    pending.add(task)
+
+                remaining = deadline - loop.time()
+                if remaining <= 0:
+                    break
+                done, pending = await asyncio.wait(
+                    pending,
+                    timeout=min(self.stagger, remaining) if queue else remaining,
+                    return_when=asyncio.FIRST_COMPLETED,
+                )
+                for task in (t for t in attempts if t in done):
+                    if task.exception() is None and task.result():
+                        if winner[1] is None:
+                            winner = attempts[task]
+                        else:
+                            losers.append(attempts[task][1])
+        finally:
+            for task in pending:
+                task.cancel()
+        for handler in losers:
+            await handler.disconnect()
+        return winner
+
+    def _backoff(self, attempt: int) -> float:
+        """
+        Pause after the given failed round: doubles from retry_delay up to
+        max_retry_delay, half of it random so clients don't retry in lockstep.
+        """
+        delay = min(self.retry_delay * 2 ** (attempt - 1), self.max_retry_delay)
+        return delay / 2 + random.uniform(0, delay / 2)
 
     def get_initial_server(self) -> Tuple[str, int]:
         return self.servers[0]
@@ -103,14 +208,19 @@ class ReconnectionManager:
             on_status: Optional[Callable[[str], None]] = None,
     ) -> Optional[object]:
         """
-        Attempt reconnection in circular order until success or exhaustion.
+        Attempt reconnection until success or exhaustion.
+
+        Each attempt races every known server (staggered, most likely new
+        primary first) and keeps the first successful connection; failed
+        attempts back off exponentially, with jitter. There are max_rounds
+        attempts, i.e. that many tries per server.
         """
         if self._active:
             print("[ReconnectionManager] Reconnect already in progress — ignoring.")
             return None
         
         self._active = True
-        total_attempts = len(self.servers) * self.max_retries
+        total_attempts = self.max_rounds
 
         def _notify(msg: str):
             print(f"[ReconnectionManager] {msg}")
@@ -119,27 +229,27 @@ class ReconnectionManager:
 
         try:
             for attempt in range(1, total_attempts + 1):
-                host, port = self.servers[self._index]
-                _notify(
-                    f"Reconnecting [{attempt}/{total_attempts}] → {host}:{port} …"
-                )
+                candidates = self._candidates()
+                targets = ", ".join(f"{h}:{p}" for h, p in candidates)
+                _notify(f"Reconnecting [{attempt}/{total_attempts}] → {targets} …")
 
-                handler = network_factory(host, port)
-                connected = await handler.connect()
+                server, handler = await self._race(candidates, network_factory)
 
-                if connected:
-                    _notify(f"Reconnected successfully to {host}:{port}")
+                if handler is not None:
+                    self._index = self.servers.index(server)
+                    _notify(f"Reconnected successfully to {server[0]}:{server[1]}")
                     return handler
-                
-                _notify(f"✗ {host}:{port} unreachable.")
-                self.advance()
 
                 if attempt < total_attempts:
-                    await asyncio.sleep(self.retry_delay)
+                    wait = self._backoff(attempt)
+                    _notify(f"✗ {targets} unreachable — retrying in {wait:.1f}s.")
+                    await asyncio.sleep(wait)
+                else:
+                    _notify(f"✗ {targets} unreachable.")
 
             _notify("All reconnection attempts exhausted.")
             return None
-        
+
         finally:
             self._active = False
 
@@ -151,40 +261,65 @@ class ReconnectionManager:
     def server_list(self) -> list[str]:
         return [f"{h}:{p}" for h, p in self.servers]
     
-    def discover_server_on_lan(self):
+    async def locate_servers(self) -> bool:
+        """
+        Start LAN discovery and point the rotation at the ranking cached by
+        the last launch, without waiting for the discovery window.
+
+        With no cache this returns straight away, so the configured servers
+        are tried first; await_lan_server() waits for discovery if they
+        fail. The full ranking joins the rotation when discovery ends,
+        unless the server has sent its topology by then.
+        Returns False if no cached server was found (the fallback list stays).
+        """
         disc_cfg = self.raw_cfg.get("discovery", {})
         if not disc_cfg.get("enabled", True):
             print("[DISCOVERY] UDP Discovery is disabled in config.json")
-            return None, None
-            
-        broadcast_port = disc_cfg.get("udp_port", 50000)
-        timeout_seconds = disc_cfg.get("timeout_seconds", 3.0)
-        
+            return False
+
+        discovery = LanDiscovery(
+            udp_port=disc_cfg.get("udp_port", DISCOVERY_UDP_PORT),
+            window=disc_cfg.get("timeout_seconds", 3.0),
+            cache=DiscoveryCache(disc_cfg.get("cache_file", DISCOVERY_CACHE_FILE)),
+        )
         print("[DISCOVERY] Scanning for servers on the local network...")
-        
-        sock = socket.socket(socket.AF_INET, socket.SOCK_DGRAM, socket.IPPROTO_UDP)
-        sock.setsockopt(socket.SOL_SOCKET, socket.SO_REUSEADDR, 1)
-        sock.setsockopt(socket.SOL_SOCKET, socket.SO_BROADCAST, 1)
-        
-        sock.bind(('', broadcast_port))
-        sock.settimeout(timeout_seconds)
-        
-        try:
-            data, addr = sock.recvfrom(1024)
-            msg = data.decode('utf-8')
-            
-            if msg.startswith("NOMI_COSE_CITTA:"):
-                server_ip = addr[0]
-                tcp_port = int(msg.split(":")[1])
-                
-                print(f"[DISCOVERY] Server found at {server_ip}:{tcp_port}!")
-                return server_ip, tcp_port
-                
-        except socket.timeout:
-            print("[DISCOVERY] No servers found on the local network.")
-        except Exception as e:
-            print(f"[DISCOVERY] Error during discovery: {e}")
-        finally:
-            sock.close()
-            
-        return None, None
\ No newline at end of file
+        cached = discovery.cache.load()
+        self._lan = discovery
+        self._discovery = asyncio.ensure_future(discovery.run())
+        self._discovery.add_done_callback(self._on_discovery_done)
+
+        if not cached:
+            return False
+        print(f"[DISCOVERY] Trying cached servers first: "
+              f"{', '.join(f'{c.host}:{c.port}' for c in cached)}")
+        self.set_discovered_servers([c.address for c in cached])
+        return True
+
+    async def await_lan_server(self) -> None:
+        """
+        Wait until a running discovery reaches a server or ends; what it
+        found is then in the rotation, ahead of the server in use.
+        """
+        if self._discovery is None or self._discovery.done():
+            return
+        first = await self._lan.first_reachable()
+        if first and not self._discovery.done() and self._epoch < 0:
+            self._adopt_discovered([first.address])
+
+    def _adopt_discovered(self, servers: list[Tuple[str, int]]):
+        # Keep pointing at the server in use (or that just failed), so that
+        # a reconnect still tries it last
+        current = self.get_current_server()
+        self.set_discovered_servers(servers)
+        if current not in self.servers:
+            self.servers.append(current)
+        self._index = self.servers.index(current)
+
+    def _on_discovery_done(self, task: asyncio.Task):
+        if task.cancelled() or task.exception() is not None:
+            return
+        ranked = task.result()
+        # The server's own topology is authoritative, and a reconnect in
+        # progress is iterating the current rotation
+        if ranked and self._epoch < 0 and not self._active:
+            self._adopt_discovered([c.address for c in ranked])
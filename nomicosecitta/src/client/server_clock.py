@@ -0,0 +1,34 @@
+import time
+from collections import deque
+
+from src.common.constants import CLOCK_OFFSET_WINDOW
+
+
+class ServerClock:
+    """
+    Maps server wall-clock times onto this machine's monotonic clock.
+
+    Every server message carries the server's time.time() at send; minus
+    our time.time() at receipt, that is the clock offset minus the network
+    delay. The delay is never negative, so the largest recent sample is
+    the best estimate of the offset.
+    """
+
+    def __init__(self, window: int = CLOCK_OFFSET_WINDOW):
+        self._samples: deque[float] = deque(maxlen=window)
+
+    def observe(self, server_timestamp: float, received_at: float | None = None):
+        self._samples.append(server_timestamp - (received_at or time.time()))
+
+    @property
+    def offset(self) -> float:
+        """Seconds to add to local wall-clock time to get the server's."""
+        return max(self._samples) if self._samples else 0.0
+
+    def reset(self):
+        """Forget the samples (e.g. after switching to another server)."""
+        self._samples.clear()
+
+    def to_monotonic(self, server_time: float) -> float:
+        """The time.monotonic() value at which the server clock reads server_time."""
+        return time.monotonic() + (server_time - (time.time() + self.offset))
@@ -0,0 +1,91 @@
+import sys
+import os
+import argparse
+import statistics
+import subprocess
+import time
+
+current_dir = os.path.dirname(os.path.abspath(__file__))
+root_dir = os.path.dirname(os.path.dirname(current_dir))
+sys.path.append(root_dir)
+
+READY = "READY"
+
+
+def parse_args():
+    """Parse command line arguments."""
+
+    parser = argparse.ArgumentParser(
+        description="Nomi, Cose, Città - Time from launch to an interactive login window"
+    )
+    parser.add_argument(
+        "--runs", "-n",
+        type = int,
+        default = 10,
+        help = "Number of fresh client processes to time (default: 10)"
+    )
+    parser.add_argument(
+        "--child",
+        action = "store_true",
+        help = argparse.SUPPRESS
+    )
+    return parser.parse_args()
+
+def child():
+    """
+    One client start: import, build the controller, draw the login window,
+    then report and exit. Timings are relative to the start of the import.
+    """
+    t0 = time.perf_counter()
+    from src.client.main import ClientController
+    t_import = time.perf_counter()
+
+    controller = ClientController()
+    t_built = time.perf_counter()
+
+    controller.root.update()
+    controller.gui.login.frame.wait_visibility()
+    t_ready = time.perf_counter()
+
+    print(f"{READY} {t_import - t0:.6f} {t_built - t_import:.6f} {t_ready - t_built:.6f}", flush=True)
+    controller.root.destroy()
+
+def run_once() -> tuple[float, list[float]]:
+    """Launch a client process; wall time until its login window was drawn, plus its own split."""
+    start = time.perf_counter()
+    proc = subprocess.Popen(
+        [sys.executable, os.path.abspath(__file__), "--child"],
+        stdout=subprocess.PIPE, text=True,
+    )
+    split = None
+    for line in proc.stdout:
+        if line.startswith(READY):
+            elapsed = time.perf_counter() - start
+            split = [float(x) for x in line.split()[1:]]
+            break
+    proc.wait()
+    if split is None:
+        raise RuntimeError(f"client exited with code {proc.returncode} before showing a window")
+    return elapsed, split
+
+def main():
+    args = parse_args()
+    if args.child:
+        child()
+        return
+
+    totals, splits = [], []
+    for _ in range(args.runs):
+        total, split = run_once()
+        totals.append(total)
+        splits.append(split)
+
+    ms = lambda values: f"{statistics.median(values) * 1000:7.1f} ms"
+    print(f"[STARTUP] {args.runs} runs, median (min {min(totals) * 1000:.1f} ms)")
+    print(f"[STARTUP]   launch -> login window: {ms(totals)}")
+    print(f"[STARTUP]   imports:                {ms([s[0] for s in splits])}")
+    print(f"[STARTUP]   controller + screens:   {ms([s[1] for s in splits])}")
+    print(f"[STARTUP]   first draw:             {ms([s[2] for s in splits])}")
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,160 @@
+import sys
+import os
+import argparse
+
+current_dir = os.path.dirname(os.path.abspath(__file__))
+root_dir    = os.path.dirname(os.path.dirname(current_dir))
+sys.path.append(root_dir)
+
+from src.client.core     import ClientCore
+from src.client.frontend import FrontEnd
+from src.common.constants import GAME_MODE_CLASSIC
+
+HELP = """Commands:
+  <text>                       chat with the other players
+  /start [round_time]          start the game (admin only)
+  /a <category>=<answer>       set an answer for the current round
+  /submit                      submit your answers now
+  /v <category> <player> y|n   vote on another player's answer
+  /ready                       submit your votes
+  /quit                        leave"""
+
+
+class TerminalFrontEnd(FrontEnd):
+    """Plain-text front-end: prints what happens and keeps the typed answers."""
+
+    def __init__(self):
+        self.screen  = "LOGIN"
+        self.answers: dict[str, str] = {}
+
+    def current_screen_name(self) -> str:
+        return self.screen
+
+    def show_login(self):
+        self.screen = "LOGIN"
+        print("[*] Back to login. Type /quit to leave.")
+
+    def show_lobby(self):
+        if self.screen != "LOBBY":
+            print("[*] In the lobby.")
+        self.screen = "LOBBY"
+
+    def show_game(self):
+        self.screen = "GAME"
+
+    def set_admin(self, is_admin):
+        if is_admin:
+            print("[*] You are the admin: /start begins the game.")
+
+    def update_player_list(self, players, admin_username=None):
+        print(f"[*] Players: {', '.join(players)} (admin: {admin_username})")
+
+    def start_round(self, letter, categories, round_number, duration,
+                    is_recovery=False, deadline=None):
+        self.screen  = "GAME"
+        self.answers = {c: "" for c in categories}
+        print(f"\n=== Round {round_number}: letter {letter}, {duration}s ===")
+        print(f"    Categories: {', '.join(categories)}")
+
+    def show_voting_phase(self, words_to_vote, my_username, duration,
+                          is_recovery=False, deadline=None):
+        print(f"\n=== Voting ({duration}s) ===")
+        for category, words in words_to_vote.items():
+            for player, word in words.items():
+                if player != my_username:
+                    print(f"    {category} / {player}: {word or '-'}")
+
+    def update_game_status(self, status):
+        print(f"[*] {status}")
+
+    def update_scoreboard(self, scores, round_scores=None):
+        ranking = sorted(scores.items(), key=lambda kv: kv[1], reverse=True)
+        print("[*] Scores: " + ", ".join(f"{u} {p}" for u, p in ranking))
+
+    def update_peer_vote(self, target_user, category, voter, is_valid):
+        print(f"    {voter} votes {category}/{target_user}: {'✓' if is_valid else '✗'}")
+
+    def append_log(self, text):
+        print(text)
+
+    def get_answers(self) -> dict:
+        return dict(self.answers)
+
+    def show_info(self, title, text):
+        print(f"\n[{title}]\n{text}")
+
+    def show_error(self, title, text):
+        print(f"[{title.upper()}] {text}")
+
+    def show_warning(self, title, text):
+        print(f"[{title.upper()}] {text}")
+
+    def set_busy(self, status):
+        if status:
+            print(f"[*] {status}")
+
+    def show_reconnecting(self, reason):
+        print(f"[!] Connection lost ({reason}), reconnecting…")
+
+    def update_reconnect_status(self, text):
+        print(f"[!] {text}")
+
+    def hide_reconnecting(self):
+        pass
+
+
+def run_command(client: ClientCore, line: str) -> bool:
+    """Handle one line typed by the user; False means quit."""
+    ui = client.frontend
+    if not line.startswith("/"):
+        client.send_message(line)
+        return True
+
+    cmd, *args = line.split()
+    if cmd == "/quit":
+        return False
+    if cmd == "/start":
+        round_time = int(args[0]) if args else 60
+        client.request_game_start({"mode": GAME_MODE_CLASSIC,
+                                   "num_extra_categories": 0,
+                                   "round_time": round_time})
+    elif cmd == "/a" and "=" in line:
+        # Categories and answers may both contain spaces ("Famous People=Dante Alighieri")
+        category, answer = line[len(cmd):].split("=", 1)
+        ui.answers[category.strip()] = answer.strip()
+    elif cmd == "/submit":
+        client.submit_answers()
+    elif cmd == "/v" and len(args) >= 3:
+        category = " ".join(args[:-2])
+        client.handle_user_vote(args[-2], category, args[-1].lower() in ("y", "yes", "1"))
+    elif cmd == "/ready":
+        client.submit_final_votes()
+    else:
+        print(HELP)
+    return True
+
+
+def main():
+    parser = argparse.ArgumentParser(
+        description="Nomi, Cose, Città - Terminal Client"
+    )
+    parser.add_argument("username", type=str, help="Your player name")
+    args = parser.parse_args()
+
+    client = ClientCore(TerminalFrontEnd())
+    client.start()
+    client.connect_to_server("", args.username)
+    print(HELP)
+    try:
+        for line in sys.stdin:
+            line = line.strip()
+            if line and not run_command(client, line):
+                break
+    except KeyboardInterrupt:
+        pass
+    finally:
+        client.shutdown()
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,48 @@
+import itertools
+import threading
+from typing import Callable, Hashable, Optional
+
+from src.common.constants import UI_FRAME_MS
+
+
+class UIDispatcher:
+    """
+    Thread-safe bridge from the network thread to the Tkinter main thread.
+
+    post() queues a callable and, if nothing is pending yet, asks Tk for one
+    drain after frame_ms; everything posted until then runs in that single
+    pass, in posting order. A callable posted with a key replaces the pending
+    one with the same key and moves to the end of the queue, so bursts of
+    scoreboard or lobby refreshes collapse into the newest one, which still
+    runs after any screen switch posted before it.
+    """
+
+    def __init__(self, root, frame_ms: int = UI_FRAME_MS):
+        self.root     = root
+        self.frame_ms = frame_ms
+        self._lock      = threading.Lock()
+        self._pending:  dict[Hashable, Callable] = {}
+        self._scheduled = False
+        self._unkeyed   = itertools.count()
+
+    def post(self, fn: Callable, key: Optional[Hashable] = None) -> None:
+        with self._lock:
+            if key is None:
+                key = ("_", next(self._unkeyed))
+            else:
+                self._pending.pop(key, None)
+            self._pending[key] = fn
+            if self._scheduled:
+                return
+            self._scheduled = True
+        self.root.after(self.frame_ms, self._drain)
+
+    def _drain(self) -> None:
+        with self._lock:
+            batch, self._pending = self._pending, {}
+            self._scheduled = False
+        for fn in batch.values():
+            try:
+                fn()
+            except Exception as e:
+                print(f"[UI] Error in scheduled update: {e}")
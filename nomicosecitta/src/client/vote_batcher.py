@@ -0,0 +1,49 @@
+import asyncio
+from typing import Awaitable, Callable
+
+from src.common.constants import VOTE_BATCH_WINDOW
+
+
+class VoteBatcher:
+    """
+    Buffers the votes cast during a short window and hands them over as one batch.
+
+    Clicking the same row again inside the window only keeps the last vote.
+    Every batch gets the next sequence number of this voter, so receivers can
+    drop batches that arrive late or twice. Batches are sent one at a time:
+    votes cast while a batch is on its way open a new window, and flush()
+    waits for that batch instead of cutting it short. Must be used from the
+    event loop.
+    """
+
+    def __init__(self, send_batch: Callable[[int, list[list]], Awaitable[None]],
+                 window: float = VOTE_BATCH_WINDOW):
+        self.send_batch = send_batch
+        self.window     = window
+        self._pending:  dict[tuple[str, str], bool] = {}
+        self._seq:      int = 0
+        self._timer:    asyncio.Task | None = None   # sleeping out the window
+        self._sending   = asyncio.Lock()
+
+    def add(self, category: str, target_user: str, is_valid: bool) -> None:
+        self._pending[(category, target_user)] = is_valid
+        if self._timer is None or self._timer.done():
+            self._timer = asyncio.ensure_future(self._flush_later())
+
+    async def flush(self) -> None:
+        """Send the buffered votes now (no-op if there are none), after any batch already on its way."""
+        if self._timer and not self._timer.done():
+            self._timer.cancel()
+        async with self._sending:
+            if not self._pending:
+                return
+
+            votes = [[category, target, valid] for (category, target), valid in self._pending.items()]
+            self._pending.clear()
+            self._seq += 1
+            await self.send_batch(self._seq, votes)
+
+    async def _flush_later(self) -> None:
+        await asyncio.sleep(self.window)
+        self._timer = None   # from here on add() schedules the next batch
+        await self.flush()
@@ -4,15 +4,52 @@ DEFAULT_SERVER_PORT = 5000
 BUFFER_SIZE = 1024
 ENCODING = 'utf-8'
 
+# P2P connections are kept open between messages and closed after this many
+# idle seconds (the receiving side waits twice as long before giving up)
+P2P_IDLE_TIMEOUT = 30
+
+# P2P fan-out: peers contacted in parallel and deadline (seconds) per peer.
+# A message the direct path fails to deliver is relayed through the server;
+# after P2P_MAX_FAILURES consecutive failures, or when the smoothed direct
+# RTT exceeds P2P_SLOW_RTT seconds, a peer is reached through the server for
+# P2P_PEER_COOLDOWN seconds before the direct path is probed again
+P2P_FANOUT_CONCURRENCY = 16
+P2P_SEND_TIMEOUT = 2.0
+P2P_MAX_FAILURES = 3
+P2P_PEER_COOLDOWN = 10
+P2P_SLOW_RTT = 0.5
+P2P_SEEN_IDS = 1000   # recent peer message ids kept to drop a copy that arrives twice
+
+# Gossip mode: with at least this many peers, chat and votes are relayed
+# epidemically (each client forwards new messages to GOSSIP_FANOUT random peers)
+P2P_GOSSIP_MIN_PEERS = 12
+GOSSIP_FANOUT = 3
+GOSSIP_DIGEST_INTERVAL = 2   # seconds between anti-entropy exchanges
+GOSSIP_HISTORY = 1000        # recent messages kept to repair peers that missed them
+
 # File Paths
 import os
 BASE_DIR = os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
 SHARED_DATA_PATH = os.path.join(BASE_DIR, "shared_data")
+DICTIONARIES_PATH = os.path.join(BASE_DIR, "dictionaries")
+
+# LAN discovery: servers broadcast "NOMI_COSE_CITTA:<tcp port>:<players>" every
+# DISCOVERY_ANNOUNCE_INTERVAL seconds. Clients rank the servers they hear by
+# TCP connect time plus DISCOVERY_LOAD_PENALTY seconds per player, and keep
+# the ranking in DISCOVERY_CACHE_FILE for DISCOVERY_CACHE_TTL seconds
+DISCOVERY_PREFIX = "NOMI_COSE_CITTA"
+DISCOVERY_UDP_PORT = 50000
+DISCOVERY_ANNOUNCE_INTERVAL = 2
+DISCOVERY_PROBE_TIMEOUT = 1.0
+DISCOVERY_LOAD_PENALTY = 0.005
+DISCOVERY_CACHE_TTL = 7 * 24 * 3600
+DISCOVERY_CACHE_FILE = os.path.join(os.path.expanduser("~"), ".nomicosecitta", "servers.json")
 
 # Replication Configuration
 HEARTBEAT_FILE = os.path.join(SHARED_DATA_PATH, "heartbeat.json")
 HEARTBEAT_INTERVAL = 2 #write heartbeat every 2 seconds
 HEARTBEAT_TIMEOUT = 6 
+REPLICAS_DIR = os.path.join(SHARED_DATA_PATH, "replicas")  # one <pid>.json per replica
 
 # Game Configuration
 DEFAULT_CATEGORIES = ["Name", "Things", "City"]
@@ -74,6 +111,44 @@ POINTS_UNIQUE_WORD = 10
 POINTS_SHARED_WORD = 5
 POINTS_INVALID = 0 
 
+# Rooms with at least this many players are scored by the columnar engine
+COLUMNAR_SCORING_MIN_PLAYERS = 32
+
+# Fuzzy shared words (optional): answers that sound alike, or words of at least
+# FUZZY_MIN_WORD_LENGTH letters that differ by up to FUZZY_MAX_DISTANCE typos,
+# score as shared. Words with a different last letter are never merged, so
+# MARIO/MARCO and PAOLO/PAOLA stay distinct answers.
+FUZZY_MATCHING = False
+FUZZY_MAX_DISTANCE = 1
+FUZZY_MIN_WORD_LENGTH = 8
+
+# Sharded peer review: from this many players on, each answer is reviewed
+# by REVIEWERS_PER_ANSWER players instead of everyone
+REVIEW_SHARDING_MIN_PLAYERS = 8
+REVIEWERS_PER_ANSWER = 3
+
+# Votes cast within this window (seconds) are sent together as one batch
+VOTE_BATCH_WINDOW = 0.3
+
+# GUI updates coming from the network thread are applied once per frame (ms)
+UI_FRAME_MS = 16
+
+# Countdowns follow absolute server deadlines; the client's offset to the
+# server clock is estimated from the timestamps of the last N server messages
+CLOCK_OFFSET_WINDOW = 32
+
+# Chat log: lines kept in the scrollback, and peer chat lines shown per
+# second per sender (bursts up to CHAT_BURST); 0 disables the rate limit
+CHAT_MAX_LINES = 500
+CHAT_RATE_LIMIT = 3
+CHAT_BURST = 8
+
+# Verdicts learned from past votes (per category and normalized word)
+VERDICTS_FILE = os.path.join(SHARED_DATA_PATH, "verdicts.json")
+VERDICT_CACHE_SIZE = 20000   # words remembered, least recently used are evicted
+VERDICT_MIN_VOTES = 4        # votes needed before a word is decided automatically
+VERDICT_CONFIDENCE = 0.85    # share of agreeing votes needed to accept/reject it
+
 # Win condition
 TARGET_SCORE = 100
 
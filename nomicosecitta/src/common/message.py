@@ -10,6 +10,7 @@ class MessageType(StrEnum):
     CMD_START_GAME = auto()
     CMD_SUBMIT = auto()
     CMD_LOBBY_ACTION = auto()
+    CMD_RELAY = auto()
 
     # server -> client
     EVT_LOBBY_UPDATE = auto()
@@ -20,10 +21,15 @@ class MessageType(StrEnum):
     EVT_ROUND_END = auto()
     EVT_GAME_OVER = auto()
     EVT_ERROR = auto()
+    EVT_TOPOLOGY = auto()
+    EVT_RELAY = auto()
 
     # client <-> client
     MSG_CHAT = auto()
     MSG_VOTE = auto()
+    MSG_VOTE_BATCH = auto()
+    MSG_GOSSIP = auto()
+    MSG_GOSSIP_DIGEST = auto()
 
 
 class GameState(StrEnum):
@@ -46,6 +52,11 @@ class Message:
     sender: str
     payload: dict[str, Any] = field(default_factory=dict)
     timestamp: float = field(default_factory=time.time)
+    msg_id: str = ""  # P2P only: acknowledged by the receiver, and identifies relayed copies
+
+    def to_dict(self) -> dict[str, Any]:
+        """Plain dict form, e.g. to nest a message inside another one's payload."""
+        return asdict(self)
 
     def to_json(self) -> str:
         """Serializes the object to a JSON string."""
@@ -60,15 +71,23 @@ class Message:
     def from_json(cls, json_str: str) -> 'Message':
         """Creates a Message object from a JSON string."""
         try:
-            data = json.loads(json_str)
+            return cls.from_dict(json.loads(json_str))
+        except json.JSONDecodeError as e:
+            raise ValueError(f"Invalid message format: {e}")
+
+    @classmethod
+    def from_dict(cls, data: dict) -> 'Message':
+        """Creates a Message object from its to_dict() form."""
+        try:
             msg_type = MessageType(data['type'])
             return cls(
                 type=msg_type,
                 sender=data['sender'],
                 payload=data.get('payload', {}),
-                timestamp=data.get('timestamp', time.time())
+                timestamp=data.get('timestamp', time.time()),
+                msg_id=data.get('msg_id', "")
             )
-        except (json.JSONDecodeError, ValueError, KeyError) as e:
+        except (TypeError, ValueError, KeyError) as e:
             raise ValueError(f"Invalid message format: {e}")
 
     @classmethod
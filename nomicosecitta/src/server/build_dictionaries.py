@@ -0,0 +1,76 @@
+import sys
+import os
+import argparse
+
+current_dir = os.path.dirname(os.path.abspath(__file__))
+root_dir = os.path.dirname(os.path.dirname(current_dir))
+sys.path.append(root_dir)
+
+from src.common.constants import DEFAULT_CATEGORIES, AVAILABLE_EXTRA_CATEGORIES, DICTIONARIES_PATH
+from src.server.session.compiled_dictionary import compile_words, dictionary_path, dictionary_versions
+from src.server.session.word_index import category_slug, read_word_list
+
+
+def parse_args():
+    """Parse command line arguments."""
+
+    parser = argparse.ArgumentParser(
+        description="Nomi, Cose, Città - Compile category word lists into memory-mappable dictionaries"
+    )
+    parser.add_argument(
+        "--source", "-s",
+        type = str,
+        default = DICTIONARIES_PATH,
+        help = f"Directory with the <category>.txt word lists (default: {DICTIONARIES_PATH})"
+    )
+    parser.add_argument(
+        "--output", "-o",
+        type = str,
+        default = None,
+        help = "Directory for the compiled <category>[.<version>].dict files (default: same as --source)"
+    )
+    return parser.parse_args()
+
+def build_dictionaries(source: str, output: str) -> dict[str, int]:
+    """
+    Compile the word list of every game category found in source.
+
+    Each build writes a new version next to the old ones instead of
+    overwriting them, since a running server may have a file mapped (and
+    Windows won't replace a mapped file). Older versions are removed when
+    nothing holds them; servers pick up the new one when they restart.
+
+    Returns:
+        Number of distinct words written, by category slug.
+    """
+
+    os.makedirs(output, exist_ok=True)
+    built = {}
+    for category in [*DEFAULT_CATEGORIES, *AVAILABLE_EXTRA_CATEGORIES]:
+        slug = category_slug(category)
+        if slug in built:
+            continue
+        try:
+            words = read_word_list(os.path.join(source, f"{slug}.txt"))
+        except FileNotFoundError:
+            print(f"[DICTIONARY] No word list for '{category}' ({slug}.txt), skipped.")
+            continue
+
+        versions    = dictionary_versions(output, slug)
+        path        = dictionary_path(output, slug, versions[-1][0] + 1 if versions else 0)
+        built[slug] = compile_words(words, path)
+        print(f"[DICTIONARY] {category}: {built[slug]} words -> {os.path.basename(path)}")
+
+        for _, old_path in versions:
+            try:
+                os.remove(old_path)
+            except OSError:
+                pass  # Still mapped by a server on Windows; the next build retries
+    return built
+
+def main():
+    args = parse_args()
+    build_dictionaries(args.source, args.output or args.source)
+
+if __name__ == "__main__":
+    main()
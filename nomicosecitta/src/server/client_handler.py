@@ -2,7 +2,7 @@ import asyncio
 import sys
 import os
 
-from src.common.constants import BUFFER_SIZE, ENCODING
+from src.common.constants import ENCODING
 from src.common.message import Message, MessageType
 
 # action_type values for CMD_LOBBY_ACTION
@@ -30,10 +30,13 @@ class ClientHandler:
         try:
             while self.running:
                 try:
-                    data = await self.reader.read(BUFFER_SIZE)
+                    # One JSON message per line: relayed P2P messages easily exceed a single read
+                    data = await self.reader.readline()
                     if not data:
                         print(f"[DEBUG] {self.addr} closed the connection.")
                         break
+                    if not data.strip():
+                        continue
 
                     msg_obj = Message.from_bytes(data)
 
@@ -45,6 +48,8 @@ class ClientHandler:
                         await self._handle_submit(msg_obj.payload)
                     elif msg_obj.type == MessageType.CMD_LOBBY_ACTION:
                         await self._handle_lobby_action(msg_obj.payload)
+                    elif msg_obj.type == MessageType.CMD_RELAY:
+                        await self._handle_relay(msg_obj.payload)
 
                 except ValueError as e:
                     print(f"[ERROR] Invalid message from {self.addr}: {e}")
@@ -69,6 +74,10 @@ class ClientHandler:
             print(f"[SUBMIT_VOTES] Received from {self.username}")
             await self.server.session.receive_votes(self.username, votes)
 
+        elif "vote_batch" in payload:
+            await self.server.session.receive_vote_batch(
+                self.username, int(payload.get("seq", 0)), payload.get("vote_batch", []))
+
         else:
             print(f"[WARN] CMD_SUBMIT from {self.username} with unknown payload keys: "
                   f"{list(payload.keys())}")
@@ -107,6 +116,7 @@ class ClientHandler:
 
         print(f"[JOIN] {self.addr} -> {username} (p2p={self.p2p_address})")
         await self._broadcast_lobby_update()
+        await self.send_topology()
 
         if self.server.session.state.name != "LOBBY":
             await self.server.session.sync_reconnecting_client(self)
@@ -145,6 +155,25 @@ class ClientHandler:
         else:
             print(f"[WARN] Unknown CMD_LOBBY_ACTION action_type={action_type!r}")
 
+    async def _handle_relay(self, payload: dict):
+        """Forward a P2P message to a peer the sender cannot reach directly."""
+        if not self.username:
+            return
+
+        target = self.server.get_client_by_username(payload.get("target"))
+        inner  = payload.get("message")
+        if target is None or not isinstance(inner, dict):
+            print(f"[RELAY] Dropped message from {self.username} to {payload.get('target')!r}")
+            return
+
+        # The sender is the authenticated connection, not whatever the client wrote
+        inner = {**inner, "sender": self.username}
+        await target.send(Message(
+            type=MessageType.EVT_RELAY,
+            sender="SERVER",
+            payload={"message": inner},
+        ).to_bytes())
+
     async def _broadcast_lobby_update(self):
         await self.server.broadcast(Message(
             type=MessageType.EVT_LOBBY_UPDATE,
@@ -156,6 +185,16 @@ class ClientHandler:
             }
         ))
 
+    async def send_topology(self):
+        """Advertise the current replica set so the client can fail over directly."""
+        sockname   = self.writer.get_extra_info('sockname')
+        local_host = sockname[0] if isinstance(sockname, tuple) else None
+        await self.send(Message(
+            type=MessageType.EVT_TOPOLOGY,
+            sender="SERVER",
+            payload=self.server.get_topology(local_host),
+        ).to_bytes())
+
     async def send(self, data: bytes):
         if self.running:
             try:
@@ -4,12 +4,15 @@ import socket
 
 from src.common.constants import (
     DEFAULT_SERVER_HOST, DEFAULT_SERVER_PORT,
-    GAME_MODE_CLASSIC, DEFAULT_ROUND_TIME
+    GAME_MODE_CLASSIC, DEFAULT_ROUND_TIME, HEARTBEAT_INTERVAL,
+    DISCOVERY_PREFIX, DISCOVERY_UDP_PORT, DISCOVERY_ANNOUNCE_INTERVAL
 )
 from src.common.message import Message
 from src.server.client_handler import ClientHandler
 from src.server.session.game_session import GameSession
+from src.server.session.verdict_cache import VerdictCache
 from src.server.state_manager import StateManager
+from src.server.topology import TopologyRegistry
 
 class GameServer:
     """
@@ -28,13 +31,14 @@ class GameServer:
         self.is_shutting_down: bool = False
         self.admin_username: str | None = None
 
-        self.session        = GameSession(self)
+        self.session        = GameSession(self, VerdictCache())
         self.lobby_settings = {
             "mode":                 GAME_MODE_CLASSIC,
             "num_extra_categories": 2,
             "round_time":           DEFAULT_ROUND_TIME,
         }
         self.state_manager     = StateManager()
+        self.topology          = TopologyRegistry()
         self._expected_players: set[str] = set()
         self.category_votes:    dict[str, list] = {}
 
@@ -46,6 +50,7 @@ class GameServer:
         )
         self.running = True
         asyncio.create_task(self._udp_broadcaster())
+        asyncio.create_task(self._topology_pusher())
         print("[SERVER] Listening…")
 
         try:
@@ -87,7 +92,8 @@ class GameServer:
                 del self.category_votes[handler.username]
         if was_admin:
             self._elect_new_admin()
-        self.save_state()
+        if handler.username:   # discovery probes connect and leave without joining
+            self.save_state()
 
     def get_client_by_username(self, username: str) -> ClientHandler | None:
         return next((c for c in self.clients if c.username == username), None)
@@ -136,6 +142,23 @@ class GameServer:
         print("[SERVER] No players remaining — admin slot vacant.")
         self.save_state()
 
+    def get_topology(self, local_host: str | None = None) -> dict:
+        """Current replica set and primary epoch, as advertised to clients."""
+        return self.topology.snapshot(f"{self.host}:{self.port}", local_host)
+
+    async def _topology_pusher(self):
+        """Pushes the replica set to every client whenever it changes (e.g. a Backup joins)."""
+        last = self.get_topology()
+        while self.running:
+            await asyncio.sleep(HEARTBEAT_INTERVAL)
+            current = self.get_topology()
+            if current != last:
+                last = current
+                print(f"[TOPOLOGY] Replica set changed: {current}")
+                for client in list(self.clients):
+                    if client.username:
+                        await client.send_topology()
+
     # Lobby / category votes
     
     def update_lobby_settings(self, settings: dict):
@@ -191,12 +214,14 @@ class GameServer:
         sock    = socket.socket(socket.AF_INET, socket.SOCK_DGRAM, socket.IPPROTO_UDP)
         sock.setsockopt(socket.SOL_SOCKET, socket.SO_BROADCAST, 1)
         sock.setblocking(False)
-        message = f"NOMI_COSE_CITTA:{self.port}".encode('utf-8')
         print(f"[DISCOVERY] UDP broadcaster active on port {self.port}")
 
         while self.running:
+            # The player count lets clients prefer the less busy of several servers
+            players = sum(1 for c in self.clients if c.username)
+            message = f"{DISCOVERY_PREFIX}:{self.port}:{players}".encode('utf-8')
             try:
-                await loop.sock_sendto(sock, message, ('255.255.255.255', 50000))
+                await loop.sock_sendto(sock, message, ('255.255.255.255', DISCOVERY_UDP_PORT))
             except Exception:
                 pass
-            await asyncio.sleep(2)
+            await asyncio.sleep(DISCOVERY_ANNOUNCE_INTERVAL)
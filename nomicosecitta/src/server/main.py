@@ -59,7 +59,7 @@ async def run_with_replication(host, port):
     async def start_server():
         await run_server(host, port)
         
-    replication = ReplicationManager(start_server)
+    replication = ReplicationManager(start_server, address=f"{host}:{port}")
     try:
         await replication.start()
     except asyncio.CancelledError:
@@ -4,14 +4,18 @@ import time
 import os
 
 from src.common.constants import HEARTBEAT_FILE, HEARTBEAT_INTERVAL, HEARTBEAT_TIMEOUT
+from src.server.topology import TopologyRegistry
 
 class ReplicationManager:
-    def __init__(self, server_factory):
+    def __init__(self, server_factory, address: str | None = None):
         self.server_factory = server_factory
+        self.address = address
         self.is_primary = False
+        self.epoch = 0
         self._running = False
         self._server_task = None
         self._heartbeat_task = None
+        self.topology = TopologyRegistry()
 
     async def start(self):
         self._running = True
@@ -30,6 +34,8 @@ class ReplicationManager:
                 await self._server_task
             except asyncio.CancelledError:
                 pass
+        if self.address:
+            self.topology.unregister()
         print("[REPLICATION] Manager stopped.")
 
     async def _auto_assign_role(self):
@@ -41,6 +47,18 @@ class ReplicationManager:
             print("[REPLICATION] No active Primary detected. Starting as Primary...")
             await self._become_primary()
 
+    def _read_heartbeat(self) -> dict:
+        try:
+            with open(HEARTBEAT_FILE, "r") as f:
+                return json.load(f)
+        except (json.JSONDecodeError, IOError):
+            return {}
+
+    def _register(self):
+        """Refresh this replica's entry in the shared replica registry."""
+        if self.address:
+            self.topology.register(self.address, "primary" if self.is_primary else "backup")
+
     def _is_primary_alive(self):
         """Read the heartbeat file to check if the Primary is alive."""
         if not os.path.exists(HEARTBEAT_FILE):
@@ -61,7 +79,8 @@ class ReplicationManager:
     async def _become_primary(self):
         """Assume the Primary role and start the game server."""
         self.is_primary = True
-        print("[REPLICATION] Assuming primary role. Starting game server...")
+        self.epoch = int(self._read_heartbeat().get("epoch", 0)) + 1
+        print(f"[REPLICATION] Assuming primary role (epoch {self.epoch}). Starting game server...")
         self._heartbeat_task = asyncio.create_task(self._heartbeat_loop())
         try:
             self._server_task = asyncio.create_task(self.server_factory())
@@ -83,6 +102,7 @@ class ReplicationManager:
         print("[REPLICATION] Running as backup. Monitoring primary heartbeat...")
         
         while self._running:
+            self._register()
             if not self._is_primary_alive():
                 print("\n[REPLICATION] Primary heartbeat lost. Promoting to Primary...")
                 await self._become_primary()
@@ -95,7 +115,9 @@ class ReplicationManager:
         while self._running and self.is_primary:
             data = {
                 "timestamp": time.time(),
-                "pid": os.getpid()
+                "pid": os.getpid(),
+                "epoch": self.epoch,
+                "address": self.address,
             }
             try:
                 with open(temp_file, "w") as f:
@@ -103,4 +125,5 @@ class ReplicationManager:
                 os.replace(temp_file, HEARTBEAT_FILE)
             except IOError as e:
                 print(f"[REPLICATION] Error writing heartbeat: {e}")
+            self._register()
             await asyncio.sleep(HEARTBEAT_INTERVAL)
\ No newline at end of file
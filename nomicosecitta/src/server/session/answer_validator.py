@@ -1,30 +1,71 @@
+from src.server.session.verdict_cache import VerdictCache
+from src.server.session.word_index import WordIndex
+from src.server.session.word_normalizer import normalize_word
+
+
 class AnswerValidator:
-    """Performs syntactic (first-letter) validation on submitted answers."""
+    """
+    Performs syntactic (first-letter) validation on submitted answers.
+
+    Answers found in the category dictionary, or confidently decided by
+    past votes, are marked "VALID"/"INVALID" straight away and never sent
+    to the peer vote.
+    """
+
+    def __init__(self, word_index: WordIndex | None = None, verdicts: VerdictCache | None = None):
+        self._word_index = word_index
+        self._verdicts   = verdicts
 
     def validate(self, received_answers: dict[str, dict], categories: list[str], letter: str) -> tuple[dict, dict]:
+        round_data:    dict = {category: {} for category in categories}
+        words_to_vote: dict = {category: {} for category in categories}
+
+        for user, user_words in received_answers.items():
+            self.validate_submission(round_data, words_to_vote, user, user_words, categories, letter)
+
+        return round_data, words_to_vote
+
+    def validate_submission(self, round_data: dict, words_to_vote: dict, user: str,
+                            user_words: dict, categories: list[str], letter: str) -> None:
+        """Validate one player's answers, updating round_data and words_to_vote in place."""
         target = letter.upper()
-        round_data: dict = {}
-        words_to_vote: dict = {}
 
         for category in categories:
-            round_data[category] = {}
-            words_to_vote[category] = {}
-
-            for user, user_words in received_answers.items():
-                word = str(user_words.get(category, "")).strip().upper()
-
-                if not word or not word.startswith(target):
-                    round_data[category][user] = {
-                        "word": word,
-                        "status": "INVALID",
-                        "score": 0,
-                    }
-                else:
-                    round_data[category][user] = {
-                        "word": word,
-                        "status": "PENDING_VOTE",
-                        "score": 0,
-                    }
-                    words_to_vote[category][user] = word
-
-        return round_data, words_to_vote
\ No newline at end of file
+            word          = str(user_words.get(category, "")).strip().upper()
+            norm          = normalize_word(word)
+            category_data = round_data.setdefault(category, {})
+            category_vote = words_to_vote.setdefault(category, {})
+
+            if not norm or not norm.startswith(target):
+                verdict = False
+            elif self._word_index and self._word_index.contains(category, norm):
+                verdict = True
+            elif self._verdicts:
+                verdict = self._verdicts.lookup(category, norm)
+            else:
+                verdict = None
+
+            if verdict is False:
+                category_data[user] = {
+                    "word": word,
+                    "norm": norm,
+                    "status": "INVALID",
+                    "score": 0,
+                }
+                category_vote.pop(user, None)
+            elif verdict:
+                category_data[user] = {
+                    "word": word,
+                    "norm": norm,
+                    "status": "VALID",
+                    "score": 0,
+                }
+                category_vote.pop(user, None)
+            else:
+                category_data[user] = {
+                    "word": word,
+                    "norm": norm,
+                    "status": "PENDING_VOTE",
+                    "score": 0,
+                }
+                category_vote[user] = word
@@ -0,0 +1,103 @@
+from array import array
+
+from src.common.constants import (
+    POINTS_UNIQUE_CATEGORY,
+    POINTS_UNIQUE_WORD,
+    POINTS_SHARED_WORD,
+)
+from src.server.session.fuzzy_matcher import FuzzyMatcher
+from src.server.session.word_normalizer import WordInterner, word_id
+
+try:
+    import numpy as np
+except ImportError:  # NumPy is optional: fall back to the stdlib array module.
+    np = None
+
+
+class ColumnarScoringEngine:
+    """
+    Alternative to ScoringEngine for large rooms.
+
+    Players and (category, normalized word) pairs are interned to integer ids
+    and the round is held as a category × player matrix of word ids
+    (-1 = not valid).
+    Word frequencies are counted once per round, so every cell is scored in
+    constant time instead of rescanning the category for each player.
+    With a FuzzyMatcher, each word is replaced by its cluster leader first.
+    """
+
+    def __init__(self, fuzzy: FuzzyMatcher | None = None):
+        self._fuzzy = fuzzy
+
+    def calculate_points(self, round_data: dict, validated: dict[str, dict[str, bool]], active_usernames: set[str]) -> dict[str, int]:
+        players = list(dict.fromkeys(
+            [*active_usernames, *(u for users in validated.values() for u in users)]))
+        player_ids = {user: i for i, user in enumerate(players)}
+        categories = list(validated)
+        n_players  = len(players)
+
+        words    = WordInterner()
+        word_ids: dict[tuple[str, int], int] = {}
+        matrix = array("l", [-1]) * (len(categories) * n_players)
+        for c, category in enumerate(categories):
+            base  = c * n_players
+            valid = {user: word_id(round_data[category][user], words)
+                     for user, is_valid in validated[category].items() if is_valid}
+            if self._fuzzy:
+                valid = self._fuzzy.cluster(valid, words)
+            for user, wid in valid.items():
+                matrix[base + player_ids[user]] = word_ids.setdefault((category, wid), len(word_ids))
+
+        if np is not None:
+            points = self._points_numpy(matrix, len(categories), n_players, len(word_ids))
+        else:
+            points = self._points_python(matrix, len(categories), n_players, len(word_ids))
+
+        round_scores: dict[str, int] = {user: 0 for user in active_usernames}
+        for c, category in enumerate(categories):
+            base = c * n_players
+            for user, is_valid in validated[category].items():
+                if is_valid:
+                    pts = int(points[base + player_ids[user]])
+                    round_scores[user] = round_scores.get(user, 0) + pts
+                    round_data[category][user]["score"] = pts
+
+        return round_scores
+
+    @staticmethod
+    def _points_numpy(matrix: array, n_categories: int, n_players: int, n_words: int):
+        ids   = np.frombuffer(matrix, dtype=np.dtype(matrix.typecode)).reshape(n_categories, n_players)
+        valid = ids >= 0
+        if n_words == 0:   # nothing valid this round: counts[] would be empty
+            return np.zeros(len(matrix), dtype=np.int64)
+
+        counts     = np.bincount(ids[valid], minlength=n_words)
+        same_count = np.where(valid, counts[np.where(valid, ids, 0)], 0)
+        num_valid  = valid.sum(axis=1, keepdims=True)
+
+        points = np.where(same_count > 1, POINTS_SHARED_WORD, POINTS_UNIQUE_WORD)
+        points = np.where(num_valid == 1, POINTS_UNIQUE_CATEGORY, points)
+        return np.where(valid, points, 0).ravel()
+
+    @staticmethod
+    def _points_python(matrix: array, n_categories: int, n_players: int, n_words: int) -> array:
+        counts = array("l", [0]) * n_words
+        for word_id in matrix:
+            if word_id >= 0:
+                counts[word_id] += 1
+
+        points = array("l", [0]) * len(matrix)
+        for c in range(n_categories):
+            base      = c * n_players
+            row       = matrix[base:base + n_players]
+            num_valid = n_players - row.count(-1)
+            for p, word_id in enumerate(row):
+                if word_id < 0:
+                    continue
+                if num_valid == 1:
+                    points[base + p] = POINTS_UNIQUE_CATEGORY
+                elif counts[word_id] > 1:
+                    points[base + p] = POINTS_SHARED_WORD
+                else:
+                    points[base + p] = POINTS_UNIQUE_WORD
+        return points
@@ -0,0 +1,127 @@
+import mmap
+import os
+import struct
+from collections.abc import Iterable
+
+from src.server.session.word_normalizer import normalize_word
+
+# File layout (all integers little-endian uint32):
+#   header      MAGIC, n_letters, n_words
+#   letters     n_letters × (first letter code point, first word slot, word count)
+#   offsets     n_words × byte offset of the word in the blob
+#   blob        normalized words, UTF-8, each terminated by NUL
+# Words are sorted by their UTF-8 bytes, so each letter is a contiguous run of slots.
+MAGIC       = b"NCCDICT1"
+DICT_SUFFIX = ".dict"
+_HEADER     = struct.Struct("<8sII")
+_LETTER     = struct.Struct("<III")
+_OFFSET     = struct.Struct("<I")
+
+
+def compile_words(words: Iterable[str], path: str) -> int:
+    """Write the normalized, de-duplicated words to path; returns the number of words."""
+    encoded = sorted({norm.encode("utf-8") for norm in map(normalize_word.__wrapped__, words) if norm})
+
+    letters: list[tuple[int, int, int]] = []
+    for slot, word in enumerate(encoded):
+        code = ord(word.decode("utf-8")[0])
+        if letters and letters[-1][0] == code:
+            letters[-1] = (code, letters[-1][1], letters[-1][2] + 1)
+        else:
+            letters.append((code, slot, 1))
+
+    offsets, blob = [], bytearray()
+    for word in encoded:
+        offsets.append(len(blob))
+        blob += word + b"\0"
+
+    # Readers must never see a half-written file: write aside, then rename into place
+    tmp_path = path + ".tmp"
+    with open(tmp_path, "wb") as f:
+        f.write(_HEADER.pack(MAGIC, len(letters), len(encoded)))
+        for entry in letters:
+            f.write(_LETTER.pack(*entry))
+        f.write(struct.pack(f"<{len(offsets)}I", *offsets))
+        f.write(blob)
+    os.replace(tmp_path, path)
+    return len(encoded)
+
+
+def dictionary_path(directory: str, slug: str, version: int = 0) -> str:
+    """<slug>.dict for the first build, <slug>.<version>.dict for later ones."""
+    name = f"{slug}.{version}{DICT_SUFFIX}" if version else slug + DICT_SUFFIX
+    return os.path.join(directory, name)
+
+
+def dictionary_versions(directory: str, slug: str) -> list[tuple[int, str]]:
+    """(version, path) of every compiled file of a category, oldest first."""
+    try:
+        names = os.listdir(directory)
+    except OSError:
+        return []
+
+    found = []
+    for name in names:
+        if not (name.startswith(slug + ".") and name.endswith(DICT_SUFFIX)):
+            continue
+        version = name[len(slug) + 1:-len(DICT_SUFFIX)]
+        if version == "" or version.isdigit():
+            found.append((int(version or 0), os.path.join(directory, name)))
+    return sorted(found)
+
+
+class CompiledDictionary:
+    """
+    Read-only view of a compiled word list.
+
+    The file is memory-mapped, so opening it costs one small header read and
+    server processes mapping the same file share its pages. Lookups
+    binary-search the slots of the word's first letter directly in the map.
+    """
+
+    def __init__(self, path: str):
+        with open(path, "rb") as f:
+            self._mm = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+
+        magic, n_letters, self._n_words = (_HEADER.unpack_from(self._mm, 0)
+                                           if len(self._mm) >= _HEADER.size else (b"", 0, 0))
+        if magic != MAGIC or len(self._mm) < _HEADER.size + n_letters * _LETTER.size + self._n_words * _OFFSET.size:
+            self._mm.close()
+            raise ValueError(f"{path} is not a compiled dictionary")
+
+        self._letters: dict[int, tuple[int, int]] = {}
+        for i in range(n_letters):
+            code, first, count = _LETTER.unpack_from(self._mm, _HEADER.size + i * _LETTER.size)
+            self._letters[code] = (first, count)
+
+        self._offsets = _HEADER.size + n_letters * _LETTER.size
+        self._blob    = self._offsets + self._n_words * _OFFSET.size
+
+    def __len__(self) -> int:
+        return self._n_words
+
+    def __contains__(self, norm: str) -> bool:
+        bounds = self._letters.get(ord(norm[0])) if norm else None
+        if bounds is None:
+            return False
+        lo, count = bounds
+        hi        = lo + count
+        target    = norm.encode("utf-8")
+
+        while lo < hi:
+            mid  = (lo + hi) // 2
+            word = self._word_at(mid)
+            if word == target:
+                return True
+            if word < target:
+                lo = mid + 1
+            else:
+                hi = mid
+        return False
+
+    def close(self) -> None:
+        self._mm.close()
+
+    def _word_at(self, slot: int) -> bytes:
+        start = self._blob + _OFFSET.unpack_from(self._mm, self._offsets + slot * _OFFSET.size)[0]
+        return self._mm[start:self._mm.find(b"\0", start)]
@@ -0,0 +1,132 @@
+import re
+
+from src.common.constants import FUZZY_MAX_DISTANCE, FUZZY_MIN_WORD_LENGTH
+from src.server.session.word_normalizer import WordInterner
+
+# Italian spelling -> sound, applied in order to a normalized (uppercase, unaccented)
+# word. Lowercase letters mark sounds already decided, so later rules skip them.
+_PHONETIC_RULES = [
+    (re.compile(r"[^A-Z]"),        ""),
+    (re.compile(r"X"),             "KS"),
+    (re.compile(r"W"),             "V"),
+    (re.compile(r"[JY]"),          "I"),
+    (re.compile(r"(.)\1+"),        r"\1"),  # doubles: Milanno -> Milano
+    (re.compile(r"CH|K|QU|Q"),     "k"),     # chiesa, kiwi, quadro
+    (re.compile(r"GH"),            "g"),     # ghiro
+    (re.compile(r"SCI(?=[AOU])"),  "s"),     # sciarpa
+    (re.compile(r"SC(?=[EI])"),    "s"),     # scena
+    (re.compile(r"GLI"),           "l"),     # figli
+    (re.compile(r"GN"),            "n"),     # gnomo
+    (re.compile(r"CI(?=[AOU])|C(?=[EI])"), "c"),  # ciao, cena
+    (re.compile(r"GI(?=[AOU])|G(?=[EI])"), "j"),  # giallo, gelato
+    (re.compile(r"C"),             "k"),     # casa
+    (re.compile(r"H"),             ""),      # hotel
+]
+
+
+def phonetic_key(norm: str) -> str:
+    """Rough Italian pronunciation of a normalized word ("CHIARA" and "KIARA" -> "KIARA")."""
+    for pattern, repl in _PHONETIC_RULES:
+        norm = pattern.sub(repl, norm)
+    return norm
+
+
+def edit_distance(a: str, b: str, limit: int) -> int:
+    """Levenshtein distance, or limit + 1 as soon as it is known to exceed limit."""
+    if abs(len(a) - len(b)) > limit:
+        return limit + 1
+    previous = list(range(len(b) + 1))
+    for i, ca in enumerate(a, 1):
+        current = [i]
+        for j, cb in enumerate(b, 1):
+            current.append(min(previous[j] + 1, current[j - 1] + 1, previous[j - 1] + (ca != cb)))
+        if min(current) > limit:
+            return limit + 1
+        previous = current
+    return previous[-1]
+
+
+def _deletes(word: str, distance: int) -> set[str]:
+    """word and every string obtained from it by removing up to distance letters."""
+    variants, frontier = {word}, {word}
+    for _ in range(distance):
+        frontier = {w[:i] + w[i + 1:] for w in frontier for i in range(len(w))} - variants
+        variants |= frontier
+    return variants
+
+
+class DeletionIndex:
+    """
+    SymSpell-style edit-distance index.
+
+    Every stored word is indexed under all its variants with up to
+    max_distance letters deleted. Two words within distance d always share
+    such a variant, so a search only verifies the few words found under
+    the query's own deletions: its cost depends on the word's length, not
+    on how many words are stored.
+    """
+
+    def __init__(self, max_distance: int):
+        self.max_distance = max_distance
+        self._index: dict[str, list[str]] = {}
+
+    def add(self, word: str) -> None:
+        for variant in _deletes(word, self.max_distance):
+            self._index.setdefault(variant, []).append(word)
+
+    def search(self, word: str, tolerance: int) -> list[tuple[int, str]]:
+        """(distance, word) of every stored word within tolerance, closest first."""
+        candidates = {found for variant in _deletes(word, tolerance)
+                      for found in self._index.get(variant, ())}
+        matches = ((edit_distance(word, found, tolerance), found) for found in candidates)
+        return sorted(match for match in matches if match[0] <= tolerance)
+
+
+class FuzzyMatcher:
+    """
+    Groups near-identical answers of a category, so typos count as shared words.
+
+    Two words match if they sound the same (phonetic_key), or if both are
+    at least min_length characters long, end with the same letter and are
+    within max_distance edits. A different last letter usually means a
+    different name or form (MARIO/MARIA, GATTO/GATTI), not a typo.
+    Each distinct word joins the cluster of the closest earlier leader or
+    starts a new one; leaders are indexed by phonetic key and in a DeletionIndex.
+    """
+
+    def __init__(self, max_distance: int = FUZZY_MAX_DISTANCE, min_length: int = FUZZY_MIN_WORD_LENGTH):
+        self.max_distance = max_distance
+        self.min_length   = min_length
+
+    def tolerance(self, word: str) -> int:
+        return self.max_distance if len(word) >= self.min_length else 0
+
+    def cluster(self, word_ids: dict[str, int], interner: WordInterner) -> dict[str, int]:
+        """Map each user's word id (from interner) to the id of its cluster leader."""
+        frequency: dict[int, int] = {}
+        for wid in word_ids.values():
+            frequency[wid] = frequency.get(wid, 0) + 1
+
+        index      = DeletionIndex(self.max_distance)
+        by_key:    dict[str, int] = {}
+        by_leader: dict[str, int] = {}
+        leader:    dict[int, int] = {}
+        # Most common spelling first, so it becomes the leader of its cluster
+        for wid in sorted(frequency, key=lambda w: (-frequency[w], interner.word(w))):
+            word = interner.word(wid)
+            key  = phonetic_key(word)
+            if key in by_key:
+                leader[wid] = by_key[key]
+                continue
+
+            tolerance = self.tolerance(word)
+            matches   = [m for m in index.search(word, tolerance)
+                         if len(m[1]) >= self.min_length and m[1][-1] == word[-1]] if tolerance else []
+            if matches:
+                leader[wid] = by_leader[matches[0][1]]
+            else:
+                leader[wid] = by_leader[word] = wid
+                index.add(word)
+            by_key[key] = leader[wid]
+
+        return {user: leader[wid] for user, wid in word_ids.items()}
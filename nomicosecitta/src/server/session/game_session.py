@@ -3,15 +3,21 @@ import time
 
 from src.common.constants import (
     GAME_MODE_CLASSIC, GAME_MODE_CLASSIC_PLUS, GAME_MODE_FREE,
-    TARGET_SCORE, SCORE_DISPLAY_DELAY,
+    TARGET_SCORE, SCORE_DISPLAY_DELAY, COLUMNAR_SCORING_MIN_PLAYERS, FUZZY_MATCHING,
+    REVIEW_SHARDING_MIN_PLAYERS, REVIEWERS_PER_ANSWER,
     VOTING_SMALL_DURATION, VOTING_MEDIUM_DURATION,
     VOTING_LONG_DURATION, VOTING_LONG_LONG_DURATION
 )
 from src.common.message import Message, MessageType, GameState
 from src.server.round_manager import RoundManager
 from src.server.session.answer_validator import AnswerValidator
+from src.server.session.review_assigner import ReviewAssigner
+from src.server.session.verdict_cache import VerdictCache
+from src.server.session.word_index import WordIndex
 from src.server.session.voting_aggregator import VotingAggregator
 from src.server.session.scoring_engine import ScoringEngine
+from src.server.session.columnar_scoring_engine import ColumnarScoringEngine
+from src.server.session.fuzzy_matcher import FuzzyMatcher
 from src.server.session.timer_manager import TimerManager
 
 
@@ -20,19 +26,26 @@ class GameSession:
     Handle game logic.
     """
 
-    def __init__(self, server):
+    def __init__(self, server, verdicts: VerdictCache | None = None):
         self.server = server
 
-        self._validator  = AnswerValidator()
+        self._verdicts   = verdicts
+        self._validator  = AnswerValidator(WordIndex(), verdicts)
         self._aggregator = VotingAggregator()
-        self._scorer     = ScoringEngine()
+        self._assigner   = ReviewAssigner()
+        fuzzy            = FuzzyMatcher() if FUZZY_MATCHING else None
+        self._scorer     = ScoringEngine(fuzzy)
+        self._columnar_scorer = ColumnarScoringEngine(fuzzy)
         self._timers     = TimerManager()
 
         self.current_round:    RoundManager | None = None
         self.received_answers: dict[str, dict]     = {}
         self.received_votes:   dict[str, dict]     = {}
+        self.submitted_voters: set[str]            = set()
+        self._vote_seq:        dict[str, int]      = {}
         self.round_data:       dict[str, dict]     = {}
         self.words_to_vote:    dict[str, dict]     = {}
+        self.reviewers:        dict[str, dict] | None = None
 
         self.state                   = GameState.LOBBY
         self.scores:                 dict[str, int] = {}
@@ -88,13 +101,16 @@ class GameSession:
             return
 
         self.received_answers[username] = words
+        self._validator.validate_submission(
+            self.round_data, self.words_to_vote, username, words,
+            self.current_round.categories, self.current_round.letter,
+        )
         print(f"[SESSION] Answers from {username} "
               f"({len(self.received_answers)}/{self.server.get_active_count()})")
 
         if len(self.received_answers) >= self.server.get_active_count():
             print("[SESSION] All players submitted — cancelling timer.")
             self._timers.cancel_round_timer()
-            self._run_initial_validation()
             await self._start_voting_phase()
 
     async def receive_votes(self, username: str, votes: dict):
@@ -103,14 +119,41 @@ class GameSession:
             return
 
         self.received_votes[username] = votes
+        self.submitted_voters.add(username)
+        self._aggregator.record(username, votes)
         print(f"[SESSION] Votes from {username} "
-              f"({len(self.received_votes)}/{self.server.get_active_count()})")
+              f"({len(self.submitted_voters)}/{self.server.get_active_count()})")
         self.server.save_state()
+        await self._check_voting_complete()
+
+    async def receive_vote_batch(self, username: str, seq: int, votes: list):
+        """
+        Merge an incremental batch of [category, target, valid] votes into username's ballot.
+
+        Batches carry a per-voter sequence number; stale or repeated ones are ignored.
+        The voter still counts as pending until its final receive_votes().
+        """
+        if self.state != GameState.VOTING or username in self.submitted_voters:
+            return
+        if seq <= self._vote_seq.get(username, -1):
+            return
+        self._vote_seq[username] = seq
 
-        if len(self.received_votes) >= self.server.get_active_count():
+        ballot = self.received_votes.setdefault(username, {})
+        for category, target, is_valid in votes:
+            ballot.setdefault(category, {})[target] = bool(is_valid)
+        self._aggregator.record(username, ballot)
+        await self._check_voting_complete()
+
+    async def _check_voting_complete(self):
+        if len(self.submitted_voters) >= self.server.get_active_count():
             print("[SESSION] All players voted — finalising round.")
             self._timers.cancel_voting_timer()
             await self._finalise_round()
+        elif self._aggregator.is_decided(self._pending_voters()):
+            print("[SESSION] Every outcome is decided — finalising round early.")
+            self._timers.cancel_voting_timer()
+            await self._finalise_round()
 
     async def handle_player_disconnection(self, username: str):
         print(f"[SESSION] {username} disconnected during state={self.state}.")
@@ -129,7 +172,8 @@ class GameSession:
                 await self._start_voting_phase()
 
         elif self.state == GameState.VOTING:
-            if len(self.received_votes) >= active_count:
+            if (len(self.submitted_voters) >= active_count
+                    or self._aggregator.is_decided(self._pending_voters())):
                 self._timers.cancel_voting_timer()
                 await self._finalise_round()
 
@@ -150,6 +194,7 @@ class GameSession:
                     "letter":       self.current_round.letter,
                     "categories":   self.current_round.categories,
                     "duration":     time_left,
+                    "deadline":     self.round_start_time + self.round_time,
                     "round_number": self.current_round_number,
                     "is_recovery":  True,
                 },
@@ -175,8 +220,9 @@ class GameSession:
                 type=MessageType.EVT_VOTING_START,
                 sender="SERVER",
                 payload={
-                    "words_to_vote": self.words_to_vote,
+                    **self._voting_payload(client_handler.username),
                     "duration":      time_left,
+                    "deadline":      self._voting_deadline(),
                     "is_recovery":  True,
                     "letter":        self.current_round.letter,
                     "round_number":  self.current_round_number
@@ -214,8 +260,11 @@ class GameSession:
 
         self.received_answers = session_data.get("received_answers", {})
         self.received_votes   = session_data.get("received_votes",   {})
+        self.submitted_voters = set(session_data.get("submitted_voters", self.received_votes))
         self.round_data       = session_data.get("round_data",       {})
         self.words_to_vote    = session_data.get("words_to_vote",    {})
+        self.reviewers        = session_data.get("reviewers")
+        self._aggregator.aggregate(self.round_data, self.received_votes, self.reviewers)
 
         DOWNTIME_COMPENSATION = 5.0
         now = time.time()
@@ -287,6 +336,8 @@ class GameSession:
 
         self.current_round            = RoundManager(settings_for_round, self.old_letters)
         self.current_round.categories = final_categories
+        self.round_data, self.words_to_vote = self._validator.validate(
+            {}, final_categories, self.current_round.letter)
         self.old_letters.add(self.current_round.letter)
         self.round_time            = int(settings.get("round_time", 60))
         self.current_round_number += 1
@@ -307,20 +358,42 @@ class GameSession:
                 "letter":       self.current_round.letter,
                 "categories":   final_categories,
                 "duration":     self.round_time,
+                "deadline":     self.round_start_time + self.round_time,
                 "round_number": self.current_round_number,
             },
         ))
 
     def _run_initial_validation(self):
-        self.round_data, self.words_to_vote = self._validator.validate(
-            self.received_answers,
-            self.current_round.categories,
-            self.current_round.letter,
-        )
-        print(f"[SESSION] Validation done. Sending words to vote.")
+        """
+        Validate the answers that were not folded in on arrival.
+
+        Answers are validated one by one in receive_answers, so this is
+        normally a no-op; it only catches up on answers restored from a
+        snapshot taken before they were validated.
+        """
+        categories = self.current_round.categories
+        pending = {
+            user: words for user, words in self.received_answers.items()
+            if any(user not in self.round_data.get(c, {}) for c in categories)
+        }
+        for user, words in pending.items():
+            self._validator.validate_submission(
+                self.round_data, self.words_to_vote, user, words,
+                categories, self.current_round.letter,
+            )
+        print(f"[SESSION] Validation done ({len(pending)} late). Sending words to vote.")
+
+    def _learn_verdicts(self):
+        """Feed this round's vote counts to the verdict cache for future games."""
+        if self._verdicts is None:
+            return
+        for (category, user), (valid, invalid) in self._aggregator.tallies().items():
+            self._verdicts.record(category, self.round_data[category][user].get("norm", ""), valid, invalid)
+        self._verdicts.save()
 
     def _get_voting_duration(self) -> int:
-        n = len(self.current_round.categories)
+        # Only categories with words left to vote on (dictionary hits skip the vote)
+        n = sum(1 for words in self.words_to_vote.values() if words)
         if n <= 3: return VOTING_SMALL_DURATION
         if n <= 5: return VOTING_MEDIUM_DURATION
         if n <= 7: return VOTING_LONG_DURATION
@@ -331,14 +404,26 @@ class GameSession:
         self.voting_start_time       = time.time()
         self.current_voting_duration = self._get_voting_duration()
 
-        await self.server.broadcast(Message(
-            type=MessageType.EVT_VOTING_START,
-            sender="SERVER",
-            payload={
-                "words_to_vote": self.words_to_vote,
-                "duration":      self.current_voting_duration,
-            },
-        ))
+        active = self.server.get_active_usernames()
+        if len(active) >= REVIEW_SHARDING_MIN_PLAYERS:
+            self.reviewers = self._assigner.assign(self.words_to_vote, active, REVIEWERS_PER_ANSWER)
+        else:
+            self.reviewers = None
+        self._aggregator.start(self.round_data, self.reviewers)
+
+        if self.reviewers is None:
+            await self.server.broadcast(Message(
+                type=MessageType.EVT_VOTING_START,
+                sender="SERVER",
+                payload={
+                    "words_to_vote": self.words_to_vote,
+                    "duration":      self.current_voting_duration,
+                    "deadline":      self._voting_deadline(),
+                },
+            ))
+        else:
+            print(f"[SESSION] Sharded review: {REVIEWERS_PER_ANSWER} reviewers per answer.")
+            await self._send_voting_shards()
         self.server.save_state()
         self._timers.start_voting_timer(
             self.current_voting_duration, self._on_voting_timeout
@@ -373,10 +458,12 @@ class GameSession:
         self.state = GameState.SCORING
 
         try:
-            validated    = self._aggregator.aggregate(self.round_data, self.received_votes)
-            round_scores = self._scorer.calculate_points(
-                self.round_data, validated, self.server.get_active_usernames()
-            )
+            validated    = self._aggregator.result()
+            active       = self.server.get_active_usernames()
+            scorer       = (self._columnar_scorer
+                            if len(active) >= COLUMNAR_SCORING_MIN_PLAYERS
+                            else self._scorer)
+            round_scores = scorer.calculate_points(self.round_data, validated, active)
         except Exception as e:
             import traceback
             print(f"[SESSION] CRITICAL ERROR during scoring: {e}")
@@ -389,6 +476,7 @@ class GameSession:
             self.scores[user] = self.scores.get(user, 0) + pts
 
         self.server.save_state()
+        self._learn_verdicts()
 
         await self.server.broadcast(Message(
             type=MessageType.EVT_SCORE_UPDATE,
@@ -419,11 +507,51 @@ class GameSession:
             await asyncio.sleep(SCORE_DISPLAY_DELAY)
             await self._launch_round(self.current_settings)
 
+    def _voting_payload(self, username: str) -> dict:
+        """words_to_vote as seen by username: everything, or only its review shard."""
+        if self.reviewers is None:
+            return {"words_to_vote": self.words_to_vote}
+        shard = self._assigner.shard(self.words_to_vote, self.reviewers, username)
+        return {
+            "words_to_vote": shard,
+            "reviewers": {
+                category: {author: self.reviewers[category][author] for author in authors}
+                for category, authors in shard.items()
+            },
+        }
+
+    def _voting_deadline(self) -> float:
+        """Server wall-clock time at which the voting phase ends."""
+        return self.voting_start_time + self.current_voting_duration
+
+    async def _send_voting_shards(self):
+        sends = []
+        for username in self.server.get_active_usernames():
+            client = self.server.get_client_by_username(username)
+            if client:
+                sends.append(client.send(Message(
+                    type=MessageType.EVT_VOTING_START,
+                    sender="SERVER",
+                    payload={
+                        **self._voting_payload(username),
+                        "duration": self.current_voting_duration,
+                        "deadline": self._voting_deadline(),
+                    },
+                ).to_bytes()))
+        await asyncio.gather(*sends, return_exceptions=True)
+
+    def _pending_voters(self) -> set[str]:
+        """Connected players who have not submitted their votes yet."""
+        return set(self.server.get_active_usernames()) - self.submitted_voters
+
     def _reset_round_state(self):
         self.received_answers = {}
         self.received_votes   = {}
+        self.submitted_voters = set()
+        self._vote_seq        = {}
         self.round_data       = {}
         self.words_to_vote    = {}
+        self.reviewers        = None
 
     async def _delayed_reset(self):
         await asyncio.sleep(2)
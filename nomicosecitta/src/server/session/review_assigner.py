@@ -0,0 +1,47 @@
+import heapq
+
+
+class ReviewAssigner:
+    """
+    Splits the voting phase so that each answer is reviewed by k players.
+
+    Reviewers are picked greedily from a load heap, least loaded first, so
+    loads stay within a couple of answers of each other; nobody reviews
+    their own answer.
+    Assignments use the same {category: {author: ...}} shape as words_to_vote.
+    """
+
+    def assign(self, words_to_vote: dict, voters: set[str], k: int) -> dict[str, dict[str, list[str]]]:
+        ordered = sorted(voters)
+        heap    = [(0, i, voter) for i, voter in enumerate(ordered)]
+        turn    = len(ordered)
+
+        reviewers: dict[str, dict[str, list[str]]] = {}
+        for category, users_words in words_to_vote.items():
+            reviewers[category] = {}
+            for author in sorted(users_words):
+                picked, skipped = [], []
+                while heap and len(picked) < k:
+                    entry = heapq.heappop(heap)
+                    (skipped if entry[2] == author else picked).append(entry)
+
+                # Ties go to whoever waited longest, so load spreads round-robin
+                for load, _, voter in picked:
+                    heapq.heappush(heap, (load + 1, turn, voter))
+                    turn += 1
+                for entry in skipped:
+                    heapq.heappush(heap, entry)
+                reviewers[category][author] = sorted(voter for _, _, voter in picked)
+        return reviewers
+
+    @staticmethod
+    def shard(words_to_vote: dict, reviewers: dict, voter: str) -> dict[str, dict[str, str]]:
+        """The part of words_to_vote assigned to voter (every category is kept)."""
+        return {
+            category: {
+                author: word
+                for author, word in users_words.items()
+                if voter in reviewers.get(category, {}).get(author, ())
+            }
+            for category, users_words in words_to_vote.items()
+        }
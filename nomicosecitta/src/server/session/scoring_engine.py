@@ -1,32 +1,46 @@
+from collections import Counter
+
 from src.common.constants import (
     POINTS_UNIQUE_CATEGORY,
     POINTS_UNIQUE_WORD,
     POINTS_SHARED_WORD,
 )
+from src.server.session.fuzzy_matcher import FuzzyMatcher
+from src.server.session.word_normalizer import WordInterner, word_id
 
 
 class ScoringEngine:
-    """Calculates per-round scores based on validated answers."""
+    """
+    Calculates per-round scores based on validated answers.
+
+    With a FuzzyMatcher, words of the same cluster count as the same word.
+    """
+
+    def __init__(self, fuzzy: FuzzyMatcher | None = None):
+        self._fuzzy = fuzzy
 
     def calculate_points(self, round_data: dict, validated: dict[str, dict[str, bool]], active_usernames: set[str]) -> dict[str, int]:
         round_scores: dict[str, int] = {user: 0 for user in active_usernames}
+        words = WordInterner()
 
         for category, user_valid in validated.items():
-            valid_words: dict[str, str] = {
-                user: round_data[category][user]["word"]
+            valid_words: dict[str, int] = {
+                user: word_id(round_data[category][user], words)
                 for user, is_valid in user_valid.items()
                 if is_valid
             }
-            num_valid = len(valid_words)
+            if self._fuzzy:
+                valid_words = self._fuzzy.cluster(valid_words, words)
+            num_valid  = len(valid_words)
+            same_count = Counter(valid_words.values())
 
             for user, word in valid_words.items():
                 if num_valid == 1:
                     pts = POINTS_UNIQUE_CATEGORY
                 else:
-                    same_count = sum(1 for w in valid_words.values() if w == word)
-                    pts = POINTS_SHARED_WORD if same_count > 1 else POINTS_UNIQUE_WORD
+                    pts = POINTS_SHARED_WORD if same_count[word] > 1 else POINTS_UNIQUE_WORD
 
                 round_scores[user] = round_scores.get(user, 0) + pts
                 round_data[category][user]["score"] = pts
 
-        return round_scores
\ No newline at end of file
+        return round_scores
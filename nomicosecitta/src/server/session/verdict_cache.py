@@ -0,0 +1,90 @@
+import json
+import os
+from collections import OrderedDict
+
+from src.common.constants import (
+    VERDICTS_FILE, VERDICT_CACHE_SIZE,
+    VERDICT_MIN_VOTES, VERDICT_CONFIDENCE,
+)
+from src.server.session.word_index import category_slug
+
+
+class VerdictCache:
+    """
+    Vote counts of past games per (category, normalized word).
+
+    A word that was voted on often enough, with enough agreement, is
+    accepted or rejected by lookup() without asking the players again.
+    Entries are kept in LRU order and persisted to shared_data, so the
+    backup server inherits them on failover.
+    """
+
+    def __init__(self, filepath: str = VERDICTS_FILE, capacity: int = VERDICT_CACHE_SIZE,
+                 min_votes: int = VERDICT_MIN_VOTES, confidence: float = VERDICT_CONFIDENCE):
+        self.filepath   = filepath
+        self.capacity   = capacity
+        self.min_votes  = min_votes
+        self.confidence = confidence
+        self._counts: OrderedDict[tuple[str, str], list[int]] = OrderedDict()
+        self._load()
+
+    def lookup(self, category: str, norm: str) -> bool | None:
+        """True/False for a confidently decided word, None if it still needs a vote."""
+        key    = (category_slug(category), norm)
+        counts = self._counts.get(key)
+        if counts is None:
+            return None
+        self._counts.move_to_end(key)
+
+        valid, invalid = counts
+        total = valid + invalid
+        if total < self.min_votes:
+            return None
+        if valid >= total * self.confidence:
+            return True
+        if invalid >= total * self.confidence:
+            return False
+        return None
+
+    def record(self, category: str, norm: str, valid: int, invalid: int) -> None:
+        if not norm or valid + invalid == 0:
+            return
+        key    = (category_slug(category), norm)
+        counts = self._counts.setdefault(key, [0, 0])
+        counts[0] += valid
+        counts[1] += invalid
+        self._counts.move_to_end(key)
+        while len(self._counts) > self.capacity:
+            self._counts.popitem(last=False)
+
+    def __len__(self) -> int:
+        return len(self._counts)
+
+    def save(self) -> None:
+        """Write the cache atomically (least recently used first)."""
+        data = [[category, norm, valid, invalid]
+                for (category, norm), (valid, invalid) in self._counts.items()]
+
+        temp_filepath = self.filepath + ".tmp"
+        try:
+            os.makedirs(os.path.dirname(self.filepath), exist_ok=True)
+            with open(temp_filepath, "w", encoding="utf-8") as f:
+                json.dump(data, f, ensure_ascii=False)
+            os.replace(temp_filepath, self.filepath)
+        except OSError as e:
+            print(f"[VERDICTS] Error during saving: {e}")
+            if os.path.exists(temp_filepath):
+                os.remove(temp_filepath)
+
+    def _load(self) -> None:
+        if not os.path.exists(self.filepath):
+            return
+        try:
+            with open(self.filepath, "r", encoding="utf-8") as f:
+                data = json.load(f)
+            for category, norm, valid, invalid in data[-self.capacity:]:
+                self._counts[(category, norm)] = [int(valid), int(invalid)]
+            print(f"[VERDICTS] Loaded {len(self._counts)} verdicts")
+        except (OSError, ValueError, TypeError) as e:
+            print(f"[VERDICTS] Error during reading: {e}")
+            self._counts.clear()
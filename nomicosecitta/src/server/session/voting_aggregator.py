@@ -1,30 +1,113 @@
 class VotingAggregator:
-    """Aggregates peer votes using majority rule with benefit-of-doubt fallback."""
+    """
+    Aggregates peer votes using majority rule with benefit-of-doubt fallback.
 
-    def aggregate(self, round_data: dict, received_votes: dict) -> dict[str, dict[str, bool]]:
-        tally: dict[str, dict[str, list[bool]]] = {
-            category: {user: [] for user in users}
+    Votes are tallied as they arrive: record() keeps running
+    (valid, invalid) counters per (category, user), so the outcome of the
+    round is available at any time without rescanning every ballot.
+    When reviewers are assigned, only their votes count for an answer.
+    """
+
+    def __init__(self) -> None:
+        self._round_data: dict = {}
+        self._reviewers:  dict[tuple[str, str], set[str]] | None = None
+        self._ballots:    dict[str, dict[tuple[str, str], bool]] = {}
+        self._counts:     dict[tuple[str, str], list[int]]       = {}
+
+    #  Streaming API
+
+    def start(self, round_data: dict, reviewers: dict | None = None) -> None:
+        """Reset the tally for a new voting phase (reviewers: {category: {author: [voters]}})."""
+        self._round_data = round_data
+        self._reviewers  = None if reviewers is None else {
+            (category, author): set(voters)
+            for category, authors in reviewers.items()
+            for author, voters in authors.items()
+        }
+        self._ballots    = {}
+        self._counts     = {
+            (category, user): [0, 0]
             for category, users in round_data.items()
+            for user, entry in users.items()
+            if entry.get("status") == "PENDING_VOTE"
         }
 
-        for voter_votes in received_votes.values():
-            for category, user_votes in voter_votes.items():
-                if category not in tally:
-                    continue
-                for target_user, is_valid in user_votes.items():
-                    if target_user in tally[category]:
-                        tally[category][target_user].append(bool(is_valid))
+    def record(self, voter: str, votes: dict) -> None:
+        """Add (or replace) the ballot of a voter and update the counters."""
+        for key, is_valid in self._ballots.pop(voter, {}).items():
+            self._counts[key][0 if is_valid else 1] -= 1
+
+        ballot: dict[tuple[str, str], bool] = {}
+        for category, user_votes in votes.items():
+            for target_user, is_valid in user_votes.items():
+                key = (category, target_user)
+                if key in self._counts and self._may_review(voter, key):
+                    ballot[key] = bool(is_valid)
+                    self._counts[key][0 if ballot[key] else 1] += 1
+        self._ballots[voter] = ballot
+
+    def is_decided(self, pending_voters: set[str]) -> bool:
+        """
+        True if no combination of votes from pending_voters can change any outcome.
+
+        Ballots of pending voters (e.g. streamed vote batches) are provisional:
+        they can still change, so only submitted ballots count as fixed.
+        """
+        pending     = set(pending_voters)
+        provisional: dict[tuple[str, str], list[int]] = {}
+        for voter in pending & self._ballots.keys():
+            for key, is_valid in self._ballots[voter].items():
+                provisional.setdefault(key, [0, 0])[0 if is_valid else 1] += 1
 
+        for key, (valid, invalid) in self._counts.items():
+            movable_valid, movable_invalid = provisional.get(key, (0, 0))
+            valid   -= movable_valid
+            invalid -= movable_invalid
+            allowed   = pending if self._reviewers is None else pending & self._reviewers.get(key, set())
+            # The author never votes on their own answer, unless they already have
+            remaining = sum(1 for v in allowed
+                            if v != key[1] or key in self._ballots.get(v, {}))
+            if remaining == 0:
+                continue
+            if valid > invalid + remaining:
+                continue
+            if invalid > 0 and valid + remaining <= invalid:
+                continue
+            return False
+        return True
+
+    def result(self) -> dict[str, dict[str, bool]]:
+        """Current outcome for every answer of the round."""
         result: dict[str, dict[str, bool]] = {}
-        for category, users in tally.items():
+        for category, users in self._round_data.items():
             result[category] = {}
-            for user, vote_list in users.items():
-                if round_data[category][user]["status"] == "INVALID":
+            for user, entry in users.items():
+                if entry["status"] == "INVALID":
                     result[category][user] = False
-                elif not vote_list:
-                    result[category][user] = True
+                elif (category, user) in self._counts:
+                    result[category][user] = self._majority(*self._counts[(category, user)])
                 else:
-                    valid_count = sum(1 for v in vote_list if v)
-                    result[category][user] = valid_count > len(vote_list) / 2
+                    result[category][user] = True
+        return result
+
+    def tallies(self) -> dict[tuple[str, str], tuple[int, int]]:
+        """(valid, invalid) vote counts per (category, user) of the answers put to the vote."""
+        return {key: (valid, invalid) for key, (valid, invalid) in self._counts.items()}
+
+    #  Batch API
+
+    def aggregate(self, round_data: dict, received_votes: dict,
+                  reviewers: dict | None = None) -> dict[str, dict[str, bool]]:
+        self.start(round_data, reviewers)
+        for voter, votes in received_votes.items():
+            self.record(voter, votes)
+        return self.result()
+
+    def _may_review(self, voter: str, key: tuple[str, str]) -> bool:
+        return self._reviewers is None or voter in self._reviewers.get(key, ())
 
-        return result
\ No newline at end of file
+    @staticmethod
+    def _majority(valid: int, invalid: int) -> bool:
+        if valid + invalid == 0:
+            return True
+        return valid > (valid + invalid) / 2
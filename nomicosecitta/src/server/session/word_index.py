@@ -0,0 +1,76 @@
+import os
+from collections.abc import Container
+
+from src.common.constants import DICTIONARIES_PATH
+from src.server.session.compiled_dictionary import CompiledDictionary, dictionary_versions
+from src.server.session.word_normalizer import normalize_word
+
+
+# Categories whose word list is filed under another name
+_CATEGORY_FILES = {"cities": "city"}
+
+
+def category_slug(category: str) -> str:
+    """File name stem used for a category's word list ("Famous People" -> "famous_people")."""
+    slug = normalize_word(category).lower().replace(" ", "_")
+    return _CATEGORY_FILES.get(slug, slug)
+
+
+def read_word_list(path: str) -> list[str]:
+    """Entries of a plain word list, without comments and blank lines."""
+    with open(path, encoding="utf-8") as f:
+        entries = (line.split("#", 1)[0].strip() for line in f)
+        return [entry for entry in entries if entry]
+
+
+class WordIndex:
+    """
+    Known words per category, used to accept answers without a peer vote.
+
+    Each category is looked up on first use in the newest compiled file,
+    dictionaries/<slug>[.<version>].dict (built by build_dictionaries.py,
+    memory-mapped) or, failing that, in the plain list dictionaries/<slug>.txt
+    (one word per line, '#' for comments), which is parsed into a set of
+    normalized words. A category keeps the file it first mapped, so a
+    rebuild reaches running servers when they restart.
+    """
+
+    def __init__(self, directory: str = DICTIONARIES_PATH):
+        self.directory = directory
+        self._index: dict[str, Container[str]] = {}
+
+    def contains(self, category: str, word: str) -> bool:
+        norm = normalize_word(word)
+        if not norm:
+            return False
+        return norm in self._words(category)
+
+    def _words(self, category: str) -> Container[str]:
+        slug = category_slug(category)
+        if slug not in self._index:
+            self._index[slug] = self._load(slug)
+        return self._index[slug]
+
+    def _load(self, slug: str) -> Container[str]:
+        versions = dictionary_versions(self.directory, slug)
+        if versions:
+            newest = versions[-1][1]
+            try:
+                compiled = CompiledDictionary(newest)
+                print(f"[DICTIONARY] Mapped {len(compiled)} words from {os.path.basename(newest)}")
+                return compiled
+            except (OSError, ValueError) as e:
+                print(f"[DICTIONARY] Ignoring {os.path.basename(newest)}: {e}")
+
+        path = os.path.join(self.directory, slug + ".txt")
+        try:
+            # Bypass the LRU cache: dictionary words would evict live answers
+            words = set(map(normalize_word.__wrapped__, read_word_list(path)))
+        except FileNotFoundError:
+            return set()
+        except OSError as e:
+            print(f"[DICTIONARY] Error reading {path}: {e}")
+            return set()
+
+        print(f"[DICTIONARY] Loaded {len(words)} words from {os.path.basename(path)}")
+        return words
@@ -0,0 +1,55 @@
+import re
+import unicodedata
+from functools import lru_cache
+
+# Straight and typographic apostrophes, plus the accents people type instead of them
+_APOSTROPHE = re.compile(r"['’‘ʼ`´]\s*")
+_WHITESPACE = re.compile(r"\s+")
+
+
+@lru_cache(maxsize=65536)
+def normalize_word(word: str) -> str:
+    """
+    Canonical form used to compare answers.
+
+    Applies NFKD, drops accents and apostrophes and collapses whitespace,
+    so "Città", "CITTA'" and " citta " all become "CITTA" and
+    "L'Aquila" / "L' Aquila" both become "LAQUILA".
+    """
+    decomposed = unicodedata.normalize("NFKD", str(word))
+    folded     = "".join(ch for ch in decomposed if not unicodedata.combining(ch))
+    folded     = _APOSTROPHE.sub("", folded)
+    return _WHITESPACE.sub(" ", folded).strip().upper()
+
+
+class WordInterner:
+    """
+    Maps normalized words to integer ids, so comparing two answers is an int comparison.
+
+    Ids are assigned in first-seen order and never reused for the lifetime
+    of the interner. The scoring engines use a fresh interner per round, so
+    the table only ever holds one round's answers.
+    """
+
+    def __init__(self) -> None:
+        self._ids:   dict[str, int] = {}
+        self._words: list[str]      = []
+
+    def intern(self, word: str) -> int:
+        norm    = normalize_word(word)
+        word_id = self._ids.get(norm)
+        if word_id is None:
+            word_id = self._ids[norm] = len(self._words)
+            self._words.append(norm)
+        return word_id
+
+    def word(self, word_id: int) -> str:
+        return self._words[word_id]
+
+    def __len__(self) -> int:
+        return len(self._words)
+
+
+def word_id(entry: dict, interner: WordInterner) -> int:
+    """Interned id of a round_data entry (entries restored from old snapshots lack "norm")."""
+    return interner.intern(entry.get("norm") or entry["word"])
@@ -46,8 +46,10 @@ class StateManager:
                 } if session.current_round else None,
                 "received_answers": session.received_answers,
                 "received_votes": session.received_votes,
+                "submitted_voters": list(session.submitted_voters),
                 "round_data": session.round_data,
-                "words_to_vote": session.words_to_vote
+                "words_to_vote": session.words_to_vote,
+                "reviewers": session.reviewers
             }
         }
 
@@ -0,0 +1,124 @@
+import glob
+import json
+import os
+import time
+
+from src.common.constants import HEARTBEAT_FILE, HEARTBEAT_TIMEOUT, REPLICAS_DIR
+
+_WILDCARD_HOSTS = ("", "0.0.0.0", "::")
+
+
+class TopologyRegistry:
+    """
+    Keeps track of the replica set (Primary + Backups) through a directory in shared_data.
+
+    Every replica owns one file, <replica id>.json, and refreshes it at each
+    heartbeat interval, so replicas never write the same file and a refresh
+    can't drop another replica's entry. Entries that have not been refreshed
+    within HEARTBEAT_TIMEOUT are considered dead and their files are removed
+    on the next read, so crashed replicas don't pile up. The current Primary
+    and its epoch are read from the heartbeat file.
+    """
+
+    def __init__(self, directory: str = REPLICAS_DIR, heartbeat_file: str = HEARTBEAT_FILE,
+                 replica_id: str | None = None):
+        self.directory      = directory
+        self.heartbeat_file = heartbeat_file
+        self.replica_id     = replica_id or str(os.getpid())
+        self._since: float | None = None
+
+    @property
+    def filepath(self) -> str:
+        return os.path.join(self.directory, f"{self.replica_id}.json")
+
+    def register(self, address: str, role: str):
+        """Insert or refresh the entry of the calling process."""
+        if self._since is None:
+            self._since = time.time()
+        self._save({"address": address, "role": role, "since": self._since, "last_seen": time.time()})
+
+    def unregister(self):
+        self._since = None
+        self._remove(self.filepath)
+
+    def get_replicas(self) -> list[str]:
+        """Addresses of the live replicas, oldest first, without duplicates."""
+        now   = time.time()
+        alive = []
+        for path, entry in self._load():
+            if now - entry.get("last_seen", 0) < HEARTBEAT_TIMEOUT:
+                alive.append(entry)
+            else:
+                self._remove(path)
+        alive.sort(key=lambda e: e.get("since", 0))
+        addresses: list[str] = []
+        for entry in alive:
+            if entry.get("address") and entry["address"] not in addresses:
+                addresses.append(entry["address"])
+        return addresses
+
+    def get_primary(self) -> tuple[str | None, int]:
+        """Return (address, epoch) of the Primary advertised in the heartbeat file."""
+        try:
+            with open(self.heartbeat_file, "r") as f:
+                data = json.load(f)
+        except (OSError, json.JSONDecodeError):
+            return None, 0
+        return data.get("address"), int(data.get("epoch", 0))
+
+    def snapshot(self, fallback_primary: str, local_host: str | None = None) -> dict:
+        """
+        Build the topology payload sent to clients.
+
+        Wildcard hosts (e.g. 0.0.0.0) are replaced with local_host, the address
+        the client used to reach this server.
+        """
+        primary, epoch = self.get_primary()
+        primary  = primary or fallback_primary
+        replicas = self.get_replicas()
+        if primary not in replicas:
+            replicas.insert(0, primary)
+
+        return {
+            "primary":  self._resolve(primary, local_host),
+            "replicas": list(dict.fromkeys(self._resolve(a, local_host) for a in replicas)),
+            "epoch":    epoch,
+        }
+
+    @staticmethod
+    def _resolve(address: str, local_host: str | None) -> str:
+        host, _, port = address.rpartition(":")
+        if host in _WILDCARD_HOSTS and local_host:
+            return f"{local_host}:{port}"
+        return address
+
+    def _load(self) -> list[tuple[str, dict]]:
+        entries = []
+        for path in glob.glob(os.path.join(self.directory, "*.json")):
+            try:
+                with open(path, "r", encoding="utf-8") as f:
+                    data = json.load(f)
+            except (OSError, json.JSONDecodeError):
+                continue
+            if isinstance(data, dict):
+                entries.append((path, data))
+        return entries
+
+    @staticmethod
+    def _remove(path: str):
+        try:
+            os.remove(path)
+        except FileNotFoundError:
+            pass
+        except OSError as e:
+            print(f"[TOPOLOGY] Error removing {path}: {e}")
+
+    def _save(self, entry: dict):
+        temp_file = self.filepath + ".tmp"
+        try:
+            os.makedirs(self.directory, exist_ok=True)
+            with open(temp_file, "w", encoding="utf-8") as f:
+                json.dump(entry, f)
+            os.replace(temp_file, self.filepath)
+        except OSError as e:
+            print(f"[TOPOLOGY] Error writing replica registry: {e}")
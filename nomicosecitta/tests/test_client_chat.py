@@ -1,3 +1,4 @@
+import asyncio
 import unittest
 from unittest.mock import AsyncMock, patch, MagicMock
 import sys
@@ -8,11 +9,13 @@ root_dir = os.path.dirname(current_dir)
 sys.path.append(root_dir)
 
 from src.client.main import ClientController
+from src.client.p2p_broadcaster import PeerPaths
+from src.client.vote_batcher import VoteBatcher
 from src.common.message import Message, MessageType
 
 class TestClientChat(unittest.IsolatedAsyncioTestCase):
 
-    @patch('src.client.main.threading.Thread')
+    @patch('src.client.core.threading.Thread')
     @patch('src.client.main.GUIManager')
     @patch('src.client.main.tk.Tk')
     async def asyncSetUp(self, mock_tk, mock_gui, mock_thread):
@@ -21,6 +24,7 @@ class TestClientChat(unittest.IsolatedAsyncioTestCase):
         
         self.controller.network = MagicMock()
         self.controller.network.send_p2p = AsyncMock()
+        self.controller.network.send = AsyncMock(return_value=True)
 
         self.controller.peer_map = {
             "Veri": "127.0.0.1:5000",
@@ -50,7 +54,168 @@ class TestClientChat(unittest.IsolatedAsyncioTestCase):
         self.assertEqual(msg_obj.sender, "Veri")
         self.assertEqual(msg_obj.payload["text"], "Hello everyone")
 
-    @patch('src.client.main.asyncio.run_coroutine_threadsafe')
+    async def test_sharded_vote_goes_to_co_reviewers_only(self):
+        self.controller.reviewers = {"City": {"Giovanni": ["Chiara", "Veri"]}}
+
+        await self.controller.p2p_broadcaster.broadcast_vote_batch(1, [["City", "Giovanni", True]])
+
+        self.controller.network.send_p2p.assert_awaited_once()
+        self.assertEqual(self.controller.network.send_p2p.call_args[0][0], "127.0.0.1:5001")
+
+    async def test_fan_out_is_concurrent_with_per_peer_deadline(self):
+        async def send_p2p(address, message):
+            if address == "127.0.0.1:5001":
+                await asyncio.sleep(10)           # unreachable peer
+            return True
+        self.controller.network.send_p2p = AsyncMock(side_effect=send_p2p)
+        self.controller.p2p_broadcaster.send_timeout = 0.05
+
+        start = asyncio.get_running_loop().time()
+        await self.controller.p2p_broadcaster.broadcast_chat("Hi")
+
+        self.assertLess(asyncio.get_running_loop().time() - start, 1)
+        self.assertEqual(self.controller.network.send_p2p.await_count, 2)
+        # The timed-out copy is not lost: it goes through the server instead
+        relayed = self.controller.network.send.call_args[0][0]
+        self.assertEqual(relayed.type, MessageType.CMD_RELAY)
+        self.assertEqual(relayed.payload["target"], "Chiara")
+        direct = self.controller.network.send_p2p.call_args_list[0][0][1]
+        self.assertTrue(direct.msg_id)
+        self.assertEqual(relayed.payload["message"]["msg_id"], direct.msg_id)
+
+    async def test_unreachable_peer_switches_to_server_relay(self):
+        self.controller.network.send_p2p = AsyncMock(
+            side_effect=lambda address, message: address != "127.0.0.1:5001")
+        broadcaster = self.controller.p2p_broadcaster
+        rounds = broadcaster.paths.max_failures + 2
+
+        for _ in range(rounds):
+            await broadcaster.broadcast_chat("Hi")
+
+        addresses = [c[0][0] for c in self.controller.network.send_p2p.call_args_list]
+        self.assertEqual(addresses.count("127.0.0.1:5001"), broadcaster.paths.max_failures)
+        self.assertEqual(addresses.count("127.0.0.1:5002"), rounds)
+        self.assertFalse(broadcaster.paths.prefers_direct("Chiara"))
+
+        relays = [c[0][0] for c in self.controller.network.send.call_args_list]
+        self.assertEqual(len(relays), rounds)
+        self.assertTrue(all(r.payload["target"] == "Chiara" for r in relays))
+        self.assertEqual(relays[0].payload["message"]["payload"], {"text": "Hi"})
+
+    def test_slow_direct_path_is_relayed_then_probed(self):
+        paths = PeerPaths(cooldown=0.0, slow_rtt=0.1)
+
+        paths.record("Chiara", True, 0.02)
+        self.assertTrue(paths.prefers_direct("Chiara"))
+        for _ in range(5):
+            paths.record("Chiara", True, 0.5)
+        self.assertIn("Chiara", paths._relay_until)
+
+        paths.record("Chiara", True, 0.01)        # probe after the cooldown
+        self.assertAlmostEqual(paths.rtt("Chiara"), 0.01)
+        self.assertNotIn("Chiara", paths._relay_until)
+
+    def test_relayed_copy_of_a_delivered_message_is_dropped(self):
+        self.controller.root.after = lambda _, fn: fn()
+        direct = Message(type=MessageType.MSG_CHAT, sender="Chiara", payload={"text": "once"}, msg_id="c1")
+
+        self.controller._msg_handler.handle(direct)
+        self.controller._msg_handler.handle(Message(
+            type=MessageType.EVT_RELAY, sender="SERVER", payload={"message": direct.to_dict()}))
+
+        self.controller.gui.append_log.assert_called_once_with("Chiara: once")
+
+    def test_relayed_peer_message_is_dispatched(self):
+        self.controller.root.after = lambda _, fn: fn()
+        inner = Message(type=MessageType.MSG_CHAT, sender="Chiara", payload={"text": "via server"})
+
+        self.controller._msg_handler.handle(Message(
+            type=MessageType.EVT_RELAY, sender="SERVER", payload={"message": inner.to_dict()}))
+
+        self.controller.gui.append_log.assert_called_once_with("Chiara: via server")
+
+    async def test_votes_are_batched_with_sequence_numbers(self):
+        sent = []
+        batcher = VoteBatcher(AsyncMock(side_effect=lambda seq, votes: sent.append((seq, votes))), window=0.01)
+
+        batcher.add("City", "Chiara", True)
+        batcher.add("City", "Giovanni", True)
+        batcher.add("City", "Chiara", False)
+        await asyncio.sleep(0.05)
+        batcher.add("Name", "Chiara", True)
+        await batcher.flush()
+
+        self.assertEqual(sent, [
+            (1, [["City", "Chiara", False], ["City", "Giovanni", True]]),
+            (2, [["Name", "Chiara", True]]),
+        ])
+
+    async def test_slow_peer_does_not_delay_the_server_copy(self):
+        release = asyncio.Event()
+        order   = []
+
+        async def broadcast_vote_batch(seq, votes):
+            await release.wait()
+            order.append(("p2p", seq))
+        self.controller.p2p_broadcaster.broadcast_vote_batch = broadcast_vote_batch
+        self.controller.network.is_connected = MagicMock(return_value=True)
+        self.controller.network.send = AsyncMock(side_effect=lambda m: order.append(("server", m.payload.get("seq"))))
+
+        await asyncio.wait_for(self.controller._send_vote_batch(1, [["City", "Chiara", True]]), 1)
+        await asyncio.wait_for(self.controller._send_vote_batch(2, [["City", "Chiara", False]]), 1)
+        self.assertEqual(order, [("server", 1), ("server", 2)])
+
+        release.set()
+        await self.controller._peer_votes
+        self.assertEqual(order[2:], [("p2p", 1), ("p2p", 2)])
+
+    async def test_votes_cast_during_a_send_are_not_lost(self):
+        sent, release = [], asyncio.Event()
+
+        async def send_batch(seq, votes):
+            await release.wait()
+            sent.append((seq, votes))
+
+        batcher = VoteBatcher(send_batch, window=0.01)
+        batcher.add("City", "Chiara", True)
+        await asyncio.sleep(0.05)                 # first batch is now in flight
+        batcher.add("City", "Giovanni", False)
+        release.set()
+        await asyncio.sleep(0.05)
+
+        self.assertEqual(sent, [(1, [["City", "Chiara", True]]), (2, [["City", "Giovanni", False]])])
+
+        release.clear()
+        batcher.add("Name", "Chiara", True)
+        await asyncio.sleep(0.05)
+        final = asyncio.ensure_future(batcher.flush())
+        await asyncio.sleep(0)
+        release.set()
+        await final
+
+        self.assertEqual(sent[-1], (3, [["Name", "Chiara", True]]))
+
+    def test_game_over_stops_gossip(self):
+        self.controller.root.after = lambda _, fn: fn()
+        self.controller.p2p_broadcaster.gossip.stop = MagicMock()
+
+        self.controller._msg_handler.handle(Message(
+            type=MessageType.EVT_GAME_OVER, sender="SERVER", payload={"winner": "Veri", "scores": {}}))
+
+        self.controller.p2p_broadcaster.gossip.stop.assert_called_once()
+
+    def test_stale_vote_batches_are_ignored(self):
+        self.controller.root.after = lambda _, fn: fn()
+        batch = lambda seq, valid: Message(type=MessageType.MSG_VOTE_BATCH, sender="Chiara",
+                                           payload={"seq": seq, "votes": [["City", "Giovanni", valid]]})
+
+        self.controller._msg_handler.handle(batch(2, False))
+        self.controller._msg_handler.handle(batch(1, True))
+
+        self.controller.gui.update_peer_vote.assert_called_once_with(
+            target_user="Giovanni", category="City", voter="Chiara", is_valid=False)
+
+    @patch('src.client.core.asyncio.run_coroutine_threadsafe')
     def test_send_message_updates_gui_and_broadcasts(self, mock_run_coroutine):
         self.controller.network.is_connected.return_value = True
 
@@ -98,3 +263,16 @@ class TestClientChat(unittest.IsolatedAsyncioTestCase):
         self.controller._msg_handler.handle(incoming_msg)
 
         self.assertEqual(self.controller.peer_map, fake_peer_map)
+
+    def test_chat_flood_from_one_peer_is_rate_limited(self):
+        self.controller.root.after = lambda _, fn: fn()
+        chat = lambda sender, i: Message(type=MessageType.MSG_CHAT, sender=sender, payload={"text": str(i)})
+        burst = self.controller.chat_limiter.burst
+
+        for i in range(burst + 20):
+            self.controller._msg_handler.handle(chat("Chiara", i))
+        self.controller._msg_handler.handle(chat("Giovanni", 0))
+
+        lines = [c[0][0] for c in self.controller.gui.append_log.call_args_list]
+        self.assertEqual(sum(line.startswith("Chiara:") for line in lines), burst)
+        self.assertIn("Giovanni: 0", lines)
@@ -0,0 +1,95 @@
+import time
+import unittest
+from unittest.mock import patch
+import sys
+import os
+
+current_dir = os.path.dirname(os.path.abspath(__file__))
+root_dir = os.path.dirname(current_dir)
+sys.path.append(root_dir)
+
+from src.client.server_clock import ServerClock
+from src.client.gui.countdown_ticker import CountdownTicker
+
+
+class FakeRoot:
+    """root.after() stand-in driven by a fake monotonic clock."""
+
+    def __init__(self):
+        self.now  = 1000.0
+        self.jobs = {}
+        self._ids = 0
+
+    def after(self, ms, fn):
+        self._ids += 1
+        self.jobs[self._ids] = (self.now + ms / 1000, fn)
+        return self._ids
+
+    def after_cancel(self, job):
+        self.jobs.pop(job, None)
+
+    def advance(self, seconds):
+        end = self.now + seconds
+        while self.jobs:
+            job, (when, fn) = min(self.jobs.items(), key=lambda kv: kv[1][0])
+            if when > end:
+                break
+            del self.jobs[job]
+            self.now = when
+            fn()
+        self.now = end
+
+
+class TestServerClock(unittest.TestCase):
+
+    def test_offset_is_the_sample_with_the_least_delay(self):
+        clock = ServerClock()
+        clock.observe(server_timestamp=110.0, received_at=100.3)   # 0.3s in flight
+        clock.observe(server_timestamp=120.0, received_at=110.05)  # 0.05s in flight
+        self.assertAlmostEqual(clock.offset, 9.95)
+
+    def test_server_deadline_maps_to_monotonic(self):
+        clock = ServerClock()
+        clock.observe(time.time() + 30.0)             # server clock 30s ahead
+        deadline = clock.to_monotonic(time.time() + 30.0 + 60.0)
+        self.assertAlmostEqual(deadline - time.monotonic(), 60.0, delta=0.1)
+
+
+class TestCountdownTicker(unittest.TestCase):
+
+    def setUp(self):
+        self.root = FakeRoot()
+        patcher = patch('src.client.gui.countdown_ticker.time.monotonic', lambda: self.root.now)
+        patcher.start()
+        self.addCleanup(patcher.stop)
+        self.ticker = CountdownTicker(self.root)
+
+    def test_counts_down_each_second_and_expires(self):
+        shown, expired = [], []
+        self.ticker.start("round", self.root.now + 3.5, shown.append, lambda: expired.append(True))
+
+        self.root.advance(10)
+
+        self.assertEqual(shown, [4, 3, 2, 1, 0])
+        self.assertEqual(expired, [True])
+        self.assertEqual(self.root.jobs, {})
+
+    def test_countdowns_share_one_scheduled_callback(self):
+        for name in ("round", "voting", "other"):
+            self.ticker.start(name, self.root.now + 30, lambda s: None)
+        self.assertEqual(len(self.root.jobs), 1)
+
+    def test_pause_stops_and_new_deadline_resumes(self):
+        shown = []
+        self.ticker.start("round", self.root.now + 60, shown.append)
+        self.ticker.pause()
+        self.root.advance(20)
+        self.assertEqual(shown, [60])
+
+        # After reconnecting the server re-sends the (unchanged) absolute deadline
+        self.ticker.start("round", self.root.now + 40, shown.append)
+        self.assertEqual(shown[-1], 40)
+
+
+if __name__ == "__main__":
+    unittest.main()
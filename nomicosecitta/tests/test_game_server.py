@@ -1,3 +1,7 @@
+import json
+import tempfile
+import threading
+import time
 import unittest
 import sys
 import os
@@ -8,6 +12,7 @@ root_dir = os.path.dirname(current_dir)
 sys.path.append(root_dir)
 
 from src.server.game_server import GameServer
+from src.server.topology import TopologyRegistry
 
 class TestGameServer(unittest.IsolatedAsyncioTestCase):
 
@@ -62,4 +67,57 @@ class TestGameServer(unittest.IsolatedAsyncioTestCase):
         empty_server.clients.append(mock_client)
 
         empty_server.set_admin("Giovanni")
-        self.assertEqual(empty_server.get_admin(), "Veri")
\ No newline at end of file
+        self.assertEqual(empty_server.get_admin(), "Veri")
+
+    def test_get_topology_resolves_wildcard_host(self):
+        with tempfile.TemporaryDirectory() as tmp:
+            heartbeat = os.path.join(tmp, "heartbeat.json")
+            with open(heartbeat, "w") as f:
+                json.dump({"timestamp": time.time(), "epoch": 4, "address": "0.0.0.0:5000"}, f)
+            registry = TopologyRegistry(os.path.join(tmp, "replicas"), heartbeat)
+            registry.register("0.0.0.0:5001", "backup")
+            self.server.topology = registry
+
+            topology = self.server.get_topology("192.168.1.20")
+
+        self.assertEqual(topology["epoch"], 4)
+        self.assertEqual(topology["primary"], "192.168.1.20:5000")
+        self.assertEqual(topology["replicas"], ["192.168.1.20:5000", "192.168.1.20:5001"])
+
+
+class TestTopologyRegistry(unittest.TestCase):
+
+    def setUp(self):
+        self.tmp = tempfile.TemporaryDirectory()
+        self.directory = os.path.join(self.tmp.name, "replicas")
+
+    def tearDown(self):
+        self.tmp.cleanup()
+
+    def test_concurrent_replicas_keep_each_other(self):
+        registries = [TopologyRegistry(self.directory, replica_id=str(i)) for i in range(8)]
+        threads = [threading.Thread(target=lambda r=r, i=i: [r.register(f"0.0.0.0:{5000 + i}", "backup")
+                                                              for _ in range(20)])
+                   for i, r in enumerate(registries)]
+        for t in threads:
+            t.start()
+        for t in threads:
+            t.join()
+
+        self.assertEqual(sorted(registries[0].get_replicas()), [f"0.0.0.0:{5000 + i}" for i in range(8)])
+
+        registries[3].unregister()
+        self.assertNotIn("0.0.0.0:5003", registries[0].get_replicas())
+        self.assertEqual(len(registries[0].get_replicas()), 7)
+
+    def test_stale_replicas_are_ignored(self):
+        registry = TopologyRegistry(self.directory, replica_id="old")
+        registry.register("0.0.0.0:5001", "backup")
+        with open(registry.filepath, encoding="utf-8") as f:
+            entry = json.load(f)
+        entry["last_seen"] -= 60
+        with open(registry.filepath, "w", encoding="utf-8") as f:
+            json.dump(entry, f)
+
+        self.assertEqual(TopologyRegistry(self.directory).get_replicas(), [])
+        self.assertFalse(os.path.exists(registry.filepath))
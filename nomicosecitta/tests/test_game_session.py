@@ -10,7 +10,7 @@ root_dir = os.path.dirname(current_dir)
 sys.path.append(root_dir)
 
 from src.server.session.game_session import GameSession
-from src.common.message import GameState
+from src.common.message import GameState, Message
 
 class TestGameSession(unittest.IsolatedAsyncioTestCase):
 
@@ -37,6 +37,9 @@ class TestGameSession(unittest.IsolatedAsyncioTestCase):
         self.assertIsNotNone(self.session.current_round)
 
         self.assertEqual(self.mock_server.broadcast.call_count, 2)
+        round_start = self.mock_server.broadcast.call_args[0][0]
+        self.assertAlmostEqual(round_start.payload["deadline"],
+                               self.session.round_start_time + 60)
 
     async def test_start_game_fail_not_admin(self):
         settings = {"mode": "classic", "round_time": 60}
@@ -67,6 +70,113 @@ class TestGameSession(unittest.IsolatedAsyncioTestCase):
         broadcast_msg = self.mock_server.broadcast.call_args[0][0]
         self.assertEqual(broadcast_msg.type.name, "EVT_VOTING_START")
 
+    async def test_receive_answers_validates_incrementally(self):
+        self.session.state = GameState.WAITING_INPUT
+        self.session.current_round = MagicMock()
+        self.session.current_round.letter = "R"
+        self.session.current_round.categories = ["Città"]
+
+        await self.session.receive_answers("AdminUser", {"Città": "Roma"})
+
+        self.assertEqual(self.session.round_data["Città"]["AdminUser"]["status"], "PENDING_VOTE")
+        self.assertEqual(self.session.words_to_vote["Città"], {"AdminUser": "ROMA"})
+
+        await self.session.receive_answers("AdminUser", {"Città": "Milano"})
+
+        self.assertEqual(self.session.round_data["Città"]["AdminUser"]["status"], "INVALID")
+        self.assertEqual(self.session.words_to_vote["Città"], {})
+
+    async def test_receive_votes_finalises_once_outcomes_are_decided(self):
+        self.session.state = GameState.VOTING
+        self.mock_server.get_active_usernames.return_value = {"AdminUser", "P2", "P3"}
+        self.session._finalise_round = AsyncMock()
+        self.session.round_data = {
+            "Nomi": {
+                "AdminUser": {"word": "", "status": "INVALID", "score": 0},
+                "P2": {"word": "", "status": "INVALID", "score": 0},
+                "P3": {"word": "ANNA", "status": "PENDING_VOTE", "score": 0},
+            }
+        }
+        self.session._aggregator.start(self.session.round_data)
+
+        await self.session.receive_votes("AdminUser", {"Nomi": {"P3": True}})
+        self.session._finalise_round.assert_not_awaited()
+
+        await self.session.receive_votes("P2", {"Nomi": {"P3": True}})
+        self.session._finalise_round.assert_awaited_once()
+        self.assertEqual(self.session._aggregator.result()["Nomi"],
+                         {"AdminUser": False, "P2": False, "P3": True})
+
+    async def test_vote_batches_are_merged_incrementally(self):
+        self.session.state = GameState.VOTING
+        self.mock_server.get_active_usernames.return_value = {"AdminUser", "P2", "P3"}
+        self.session._finalise_round = AsyncMock()
+        self.session.round_data = {
+            "Nomi": {u: {"word": f"A{u}", "status": "PENDING_VOTE", "score": 0}
+                     for u in ("AdminUser", "P2", "P3")}
+        }
+        self.session._aggregator.start(self.session.round_data)
+
+        await self.session.receive_vote_batch("AdminUser", 1, [["Nomi", "P2", True]])
+        await self.session.receive_vote_batch("AdminUser", 2, [["Nomi", "P3", False]])
+        await self.session.receive_vote_batch("AdminUser", 1, [["Nomi", "P2", False]])  # stale
+
+        self.assertEqual(self.session.received_votes["AdminUser"], {"Nomi": {"P2": True, "P3": False}})
+        self.assertEqual(self.session._aggregator.tallies()[("Nomi", "P2")], (1, 0))
+        self.assertNotIn("AdminUser", self.session.submitted_voters)
+        self.session._finalise_round.assert_not_awaited()
+
+    async def test_batched_votes_of_pending_voters_stay_provisional(self):
+        self.session.state = GameState.VOTING
+        self.mock_server.get_active_usernames.return_value = {"A", "B", "C", "D"}
+        self.mock_server.get_active_count.return_value = 4
+        self.session._finalise_round = AsyncMock()
+        self.session.round_data = {
+            "Nomi": {"D": {"word": "DINO", "status": "PENDING_VOTE", "score": 0}}
+        }
+        self.session._aggregator.start(self.session.round_data)
+
+        await self.session.receive_vote_batch("A", 1, [["Nomi", "D", True]])
+        await self.session.receive_vote_batch("B", 1, [["Nomi", "D", True]])
+        await self.session.receive_votes("C", {"Nomi": {"D": True}})
+
+        # A and B may still switch to invalid and reject the answer
+        self.assertFalse(self.session._aggregator.is_decided({"A", "B", "D"}))
+        self.session._finalise_round.assert_not_awaited()
+
+        await self.session.receive_votes("A", {"Nomi": {"D": True}})
+        self.session._finalise_round.assert_awaited_once()
+
+    async def test_sharded_review_sends_each_player_its_shard(self):
+        players = {f"P{i}" for i in range(9)}
+        clients = {user: MagicMock(send=AsyncMock()) for user in players}
+        self.mock_server.get_active_usernames.return_value = players
+        self.mock_server.get_client_by_username.side_effect = clients.get
+        self.session.current_round = MagicMock(categories=["Nomi"])
+        self.session.round_data    = {"Nomi": {u: {"word": f"A{u}", "status": "PENDING_VOTE", "score": 0}
+                                               for u in players}}
+        self.session.words_to_vote = {"Nomi": {u: f"A{u}" for u in players}}
+
+        await self.session._start_voting_phase()
+
+        self.mock_server.broadcast.assert_not_called()
+        loads = []
+        for user, client in clients.items():
+            payload = Message.from_json(client.send.call_args[0][0].decode()).payload
+            shard   = payload["words_to_vote"]["Nomi"]
+            loads.append(len(shard))
+            self.assertNotIn(user, shard)
+            for author in shard:
+                self.assertIn(user, payload["reviewers"]["Nomi"][author])
+        self.assertEqual(sum(loads), 9 * 3)
+        self.assertLessEqual(max(loads) - min(loads), 2)
+
+        reviewers = self.session.reviewers["Nomi"]["P0"]
+        outsider  = next(u for u in players if u not in reviewers and u != "P0")
+        self.session._aggregator.record(outsider, {"Nomi": {"P0": False}})
+        self.session._aggregator.record(reviewers[0], {"Nomi": {"P0": True}})
+        self.assertTrue(self.session._aggregator.result()["Nomi"]["P0"])
+
     async def test_start_game_fail_not_enough_players(self):
         self.mock_server.get_active_count.return_value = 0
         settings = {"mode": "classic", "round_time": 60}
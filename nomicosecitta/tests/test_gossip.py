@@ -0,0 +1,116 @@
+import asyncio
+import random
+import unittest
+import sys
+import os
+
+current_dir = os.path.dirname(os.path.abspath(__file__))
+root_dir = os.path.dirname(current_dir)
+sys.path.append(root_dir)
+
+from src.client.gossip import GossipEngine
+from src.common.message import Message, MessageType
+
+
+class TestGossipEngine(unittest.IsolatedAsyncioTestCase):
+
+    def _make_room(self, n: int, fanout: int = 3):
+        """n engines wired to each other in memory; returns (engines, delivered, sent)."""
+        peer_map  = {f"P{i}": f"10.0.0.{i}:9000" for i in range(n)}
+        engines   = {}
+        delivered = {name: [] for name in peer_map}
+        sent      = {name: 0 for name in peer_map}
+
+        def make_send(name):
+            async def send(deliveries):
+                for peer_name, _, message in deliveries:
+                    sent[name] += 1
+                    if peer_name in self.offline:
+                        continue
+                    if message.type == MessageType.MSG_GOSSIP:
+                        engines[peer_name].receive(message)
+                    else:
+                        engines[peer_name].receive_digest(message)
+            return send
+
+        for name in peer_map:
+            engines[name] = GossipEngine(make_send(name), lambda: peer_map, lambda n=name: n,
+                                         deliver=delivered[name].append, fanout=fanout,
+                                         digest_interval=3600)
+        return engines, delivered, sent
+
+    async def asyncSetUp(self):
+        self.offline = set()
+        random.seed(5)
+
+    async def asyncTearDown(self):
+        for task in asyncio.all_tasks() - {asyncio.current_task()}:
+            task.cancel()
+
+    async def _settle(self):
+        for _ in range(20):
+            await asyncio.sleep(0)
+
+    async def _anti_entropy_round(self, engines):
+        for name, engine in engines.items():
+            peer = random.choice([p for p in engines if p != name])
+            await engine.send([(peer, "", engine._digest(reply=True))])
+        await self._settle()
+
+    async def test_message_reaches_every_peer_once(self):
+        engines, delivered, sent = self._make_room(40)
+
+        await engines["P0"].publish(Message(type=MessageType.MSG_CHAT, sender="P0", payload={"text": "ciao"}))
+        await self._settle()
+
+        reached = sum(1 for messages in delivered.values() if messages)
+        self.assertGreater(reached, 30)                 # most peers by gossip alone
+        self.assertLessEqual(max(sent.values()), 3)     # constant upload per client
+
+        for _ in range(3):
+            await self._anti_entropy_round(engines)
+        for name, messages in delivered.items():
+            if name != "P0":
+                self.assertEqual([m.payload for m in messages], [{"text": "ciao"}], name)
+                self.assertEqual(messages[0].type, MessageType.MSG_CHAT)
+
+    async def test_anti_entropy_repairs_missed_messages(self):
+        engines, delivered, _ = self._make_room(5)
+        self.offline = {"P4"}
+
+        for i in range(3):
+            await engines["P0"].publish(Message(type=MessageType.MSG_CHAT, sender="P0", payload={"i": i}))
+        await self._settle()
+        self.assertEqual(delivered["P4"], [])
+
+        self.offline = set()
+        await engines["P4"].send([("P1", "10.0.0.1:9000", engines["P4"]._digest(reply=True))])
+        await self._settle()
+
+        self.assertEqual(sorted(m.payload["i"] for m in delivered["P4"]), [0, 1, 2])
+
+    async def test_restarted_client_is_not_mistaken_for_old_messages(self):
+        engines, delivered, _ = self._make_room(2)
+        for i in range(3):
+            await engines["P0"].publish(Message(type=MessageType.MSG_CHAT, sender="P0", payload={"i": i}))
+
+        restarted = GossipEngine(engines["P0"].send, lambda: {"P1": "10.0.0.1:9000"}, lambda: "P0",
+                                 deliver=delivered["P0"].append, digest_interval=3600)
+        await restarted.publish(Message(type=MessageType.MSG_CHAT, sender="P0", payload={"i": "again"}))
+
+        self.assertEqual([m.payload["i"] for m in delivered["P1"]], [0, 1, 2, "again"])
+
+    async def test_stop_cancels_anti_entropy(self):
+        engines, _, _ = self._make_room(2)
+        engines["P0"].start()
+        task = engines["P0"]._digest_task
+
+        engines["P0"].stop()
+        await self._settle()
+
+        self.assertTrue(task.cancelled())
+        self.assertIsNone(engines["P0"]._digest_task)
+
+
+if __name__ == "__main__":
+    unittest.main()
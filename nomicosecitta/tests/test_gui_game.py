@@ -0,0 +1,107 @@
+import unittest
+import tkinter as tk
+from unittest.mock import MagicMock
+import sys
+import os
+
+current_dir = os.path.dirname(os.path.abspath(__file__))
+root_dir = os.path.dirname(current_dir)
+sys.path.append(root_dir)
+
+from src.client.gui.screens.game import GameScreen
+
+class TestGameScreen(unittest.TestCase):
+    def setUp(self):
+        try:
+            self.root = tk.Tk()
+            self.root.withdraw()
+        except tk.TclError:
+            self.skipTest("Tkinter engine not available.")
+            return
+
+        self.mock_manager = MagicMock()
+        self.parent_frame = tk.Frame(self.root)
+        self.screen = GameScreen(self.parent_frame, self.mock_manager)
+        self.screen.show()
+
+    def tearDown(self):
+        self.root.update()
+        self.root.destroy()
+
+    def test_scoreboard_reuses_player_cards(self):
+        self.screen.update_scoreboard({"Veri": 10, "Chiara": 20}, {"Veri": 10, "Chiara": 20})
+        cards = dict(self.screen._lb_cards)
+
+        self.screen.update_scoreboard({"Veri": 40, "Chiara": 25}, {"Veri": 30, "Chiara": 5})
+
+        self.assertIs(self.screen._lb_cards["Veri"], cards["Veri"])
+        self.assertIs(self.screen._lb_cards["Chiara"], cards["Chiara"])
+        self.assertEqual(cards["Veri"].frame.grid_info()["column"], 0)
+        self.assertEqual(cards["Chiara"].frame.grid_info()["column"], 1)
+        self.assertEqual(cards["Veri"]._points.cget("text"), "40 pts")
+
+    def test_scoreboard_drops_players_who_left(self):
+        self.screen.update_scoreboard({"Veri": 10, "Chiara": 20})
+        self.screen.update_scoreboard({"Veri": 10})
+
+        self.assertEqual(list(self.screen._lb_cards), ["Veri"])
+
+        self.screen.update_scoreboard({})
+        self.assertEqual(self.screen._lb_cards, {})
+        self.assertTrue(self.screen._lb_empty.grid_info())
+
+    def test_voting_list_only_builds_visible_rows(self):
+        words = {f"Cat{c}": {f"P{p}": f"word{c}{p}" for p in range(30)} for c in range(13)}
+        self.screen.build_voting_ui(words, "P0")
+        self.root.update()
+
+        panel = self.screen._voting_panel
+        self.assertEqual(len(panel._items), 13 * 31)
+        self.assertLess(len(panel._visible), 60)
+
+        self.screen._canvas.yview_moveto(1.0)
+        self.root.update()
+        self.assertIn(len(panel._items) - 1, panel._visible)
+        self.assertLess(len(panel._visible), 60)
+
+    def test_vote_survives_row_recycling(self):
+        words = {f"Cat{c}": {f"P{p}": f"word{c}{p}" for p in range(30)} for c in range(13)}
+        self.screen.build_voting_ui(words, "P0")
+        panel = self.screen._voting_panel
+
+        panel._cast_vote("P1", "Cat0", False)
+        self.screen._canvas.yview_moveto(1.0)
+        self.root.update()
+        self.screen._canvas.yview_moveto(0.0)
+        self.root.update()
+
+        self.assertIs(panel._my_choice[("Cat0", "P1")], False)
+        self.assertEqual(panel._rows_by_key[("Cat0", "P1")].invalid_btn.cget("text"), "❌ 1")
+
+    def test_rounds_reuse_answer_and_vote_rows(self):
+        self.screen.start_round("A", ["Name", "City", "Thing"], 1, 60)
+        rows = list(self.screen._category_rows)
+        self.screen.build_voting_ui({"Name": {"P1": "Anna", "P2": "Aldo"}}, "P1")
+        self.root.update()
+        vote_rows = set(map(id, self.screen._voting_panel._visible.values()))
+
+        self.screen.start_round("B", ["Name", "City"], 2, 60)
+        self.assertEqual(self.screen._category_rows, rows[:2])
+        self.assertEqual(self.screen._spare_rows, rows[2:])
+        self.assertEqual(list(self.screen.get_answers()), ["Name", "City"])
+
+        self.screen.build_voting_ui({"Name": {"P1": "Bea", "P2": "Bruno"}}, "P1")
+        self.root.update()
+        self.assertEqual(set(map(id, self.screen._voting_panel._visible.values())), vote_rows)
+
+    def test_chat_lines_are_batched_and_trimmed(self):
+        chat = self.screen._chat
+        chat.max_lines = 50
+        for i in range(120):
+            chat.append(f"line {i}")
+        self.assertEqual(chat._log_area.get("1.0", "end-1c"), "")
+
+        chat._flush()
+        text = chat._log_area.get("1.0", "end-1c").splitlines()
+        self.assertEqual(len(text), 50)
+        self.assertEqual(text[-1], "line 119")
@@ -0,0 +1,61 @@
+import unittest
+import subprocess
+import tkinter as tk
+import sys
+import os
+
+current_dir = os.path.dirname(os.path.abspath(__file__))
+root_dir = os.path.dirname(current_dir)
+sys.path.append(root_dir)
+
+from src.client.gui import GUIManager, Screen
+
+
+class TestLazyImports(unittest.TestCase):
+    def test_lobby_and_game_modules_load_on_demand(self):
+        code = (
+            "import sys\n"
+            "from src.client.gui import GUIManager\n"
+            "from src.client.gui.screens import LoginScreen\n"
+            "print(sorted(m for m in ('src.client.gui.screens.lobby', 'src.client.gui.screens.game',\n"
+            "                         'src.client.gui.widgets.voting_panel') if m in sys.modules))\n"
+        )
+        out = subprocess.run([sys.executable, "-c", code], cwd=root_dir,
+                             capture_output=True, text=True, check=True).stdout
+        self.assertEqual(out.strip(), "[]")
+
+
+class TestGUIManager(unittest.TestCase):
+    def setUp(self):
+        try:
+            self.root = tk.Tk()
+            self.root.withdraw()
+        except tk.TclError:
+            self.skipTest("Tkinter engine not available.")
+            return
+        self.gui = GUIManager(self.root)
+
+    def tearDown(self):
+        self.root.update()
+        self.root.destroy()
+
+    def test_only_login_is_built_at_startup(self):
+        self.assertTrue(self.gui.is_built(Screen.LOGIN))
+        self.assertFalse(self.gui.is_built(Screen.LOBBY))
+        self.assertFalse(self.gui.is_built(Screen.GAME))
+        self.assertEqual(self.gui.get_answers(), {})
+
+    def test_screens_are_built_once_on_first_use(self):
+        self.gui.show_lobby()
+        lobby = self.gui.lobby
+        self.gui.update_player_list(["Veri"], "Veri")
+        self.gui.show_login()
+        self.gui.show_lobby()
+
+        self.assertIs(self.gui.lobby, lobby)
+        self.assertFalse(self.gui.is_built(Screen.GAME))
+        self.assertEqual(self.gui.current_screen_name(), "LOBBY")
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,84 @@
+import unittest
+import threading
+from unittest.mock import MagicMock, patch
+import sys
+import os
+
+current_dir = os.path.dirname(os.path.abspath(__file__))
+root_dir = os.path.dirname(current_dir)
+sys.path.append(root_dir)
+
+from src.client.core import ClientCore
+from src.client.headless import HeadlessFrontEnd
+from src.client.terminal import TerminalFrontEnd, run_command
+from src.common.message import Message, MessageType
+
+
+class TestHeadlessClient(unittest.TestCase):
+    def setUp(self):
+        self.ui = HeadlessFrontEnd(answers={"Nome": "Anna"})
+        self.client = ClientCore(self.ui)
+        self.client.username = "bot"
+        self.client.network = MagicMock()
+        self.client.network.is_connected.return_value = True
+
+    def tearDown(self):
+        self.client.loop.close()
+
+    def _server(self, msg_type, payload):
+        self.client._msg_handler.handle(Message(type=msg_type, sender="SERVER", payload=payload))
+
+    def test_lobby_update_reaches_frontend(self):
+        self._server(MessageType.EVT_LOBBY_UPDATE, {"players": ["bot", "Veri"], "admin": "bot"})
+
+        self.assertEqual(self.ui.screen, "LOBBY")
+        self.assertEqual(self.ui.wait_for("set_admin", timeout=0), (True,))
+        self.assertEqual(self.ui.wait_for("update_player_list", timeout=0), (["bot", "Veri"], "bot"))
+
+    def test_round_end_submits_frontend_answers(self):
+        self._server(MessageType.EVT_ROUND_START,
+                     {"letter": "A", "categories": ["Nome"], "duration": 30, "round_number": 1})
+        self.assertEqual(self.ui.screen, "GAME")
+
+        with patch("src.client.core.asyncio.run_coroutine_threadsafe") as run:
+            self._server(MessageType.EVT_ROUND_END, {})
+            run.call_args[0][0].close()
+
+        sent = self.client.network.send.call_args[0][0]
+        self.assertEqual(sent.type, MessageType.CMD_SUBMIT)
+        self.assertEqual(sent.payload, {"words": {"Nome": "Anna"}})
+        self.assertEqual(self.ui.wait_for("set_inputs_enabled", timeout=0), (False,))
+
+    def test_errors_become_events_not_dialogs(self):
+        with patch("src.client.message_handler.asyncio.run_coroutine_threadsafe") as run:
+            self._server(MessageType.EVT_ERROR, {"error": "Username taken"})
+            run.call_args[0][0].close()
+
+        self.assertEqual(self.ui.wait_for("show_error", timeout=0), ("Error", "Username taken"))
+
+    def test_wait_for_blocks_until_event(self):
+        threading.Timer(0.05, self.ui.show_lobby).start()
+
+        self.assertEqual(self.ui.wait_for("show_lobby", timeout=2), ())
+        self.assertIsNone(self.ui.wait_for("show_game", timeout=0.05))
+
+    def test_terminal_commands(self):
+        client = ClientCore(TerminalFrontEnd())
+        client.request_game_start = MagicMock()
+        client.handle_user_vote = MagicMock()
+        try:
+            self.assertTrue(run_command(client, "/a Città=Ancona"))
+            self.assertTrue(run_command(client, "/a Famous People = Dante Alighieri"))
+            self.assertTrue(run_command(client, "/start 90"))
+            self.assertTrue(run_command(client, "/v Famous People Veri n"))
+            self.assertFalse(run_command(client, "/quit"))
+        finally:
+            client.loop.close()
+
+        self.assertEqual(client.frontend.get_answers(), {"Città": "Ancona", "Famous People": "Dante Alighieri"})
+        self.assertEqual(client.request_game_start.call_args[0][0]["round_time"], 90)
+        client.handle_user_vote.assert_called_once_with("Veri", "Famous People", False)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -9,7 +9,7 @@ sys.path.append(root_dir)
 
 from src.server.game_server import GameServer
 from src.server.client_handler import ClientHandler
-from src.common.message import MessageType
+from src.common.message import Message, MessageType
 
 class TestLobbyLogic(unittest.IsolatedAsyncioTestCase):
 
@@ -22,6 +22,7 @@ class TestLobbyLogic(unittest.IsolatedAsyncioTestCase):
         self.mock_writer.get_extra_info = MagicMock(return_value=("192.168.1.100", 12345)) 
 
         self.mock_writer.close = MagicMock()
+        self.mock_writer.write = MagicMock()
 
         self.mock_reader = AsyncMock()
 
@@ -95,3 +96,17 @@ class TestLobbyLogic(unittest.IsolatedAsyncioTestCase):
         self.mock_writer.close.assert_called_once()
         self.server.broadcast.assert_called_once()
         self.assertEqual(self.server.broadcast.call_args[0][0].type, MessageType.EVT_LOBBY_UPDATE)
+
+    async def test_relay_forwards_message_with_authenticated_sender(self):
+        self.handler.username = "Chiara"
+        target = MagicMock(username="Giovanni", send=AsyncMock())
+        self.server.clients.append(target)
+        inner = Message(type=MessageType.MSG_CHAT, sender="Someone else", payload={"text": "ciao"})
+
+        await self.handler._handle_relay({"target": "Giovanni", "message": inner.to_dict()})
+
+        relayed = Message.from_bytes(target.send.call_args[0][0])
+        self.assertEqual(relayed.type, MessageType.EVT_RELAY)
+        self.assertEqual(relayed.payload["message"]["sender"], "Chiara")
+        self.assertEqual(relayed.payload["message"]["payload"], {"text": "ciao"})
+
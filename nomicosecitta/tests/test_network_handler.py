@@ -107,22 +107,75 @@ class TestNetworkHandler(unittest.IsolatedAsyncioTestCase):
         self.assertEqual(port, 12345)
         mock_start_server.assert_called_once()
 
-    @patch('asyncio.open_connection')
-    async def test_send_p2p_success(self, mock_open_connection):
+    def _mock_p2p_stream(self):
         mock_reader, mock_writer = AsyncMock(), AsyncMock()
+        mock_reader.at_eof = MagicMock(return_value=False)
         mock_writer.write = MagicMock()
         mock_writer.close = MagicMock()
+        mock_writer.is_closing = MagicMock(return_value=False)
+        return mock_reader, mock_writer
+
+    @patch('asyncio.open_connection')
+    async def test_send_p2p_success(self, mock_open_connection):
+        mock_reader, mock_writer = self._mock_p2p_stream()
         mock_open_connection.return_value = (mock_reader, mock_writer)
 
         msg = Message(type=MessageType.MSG_VOTE, sender="P1", payload={})
         result = await self.handler.send_p2p("192.168.1.5:9000", msg)
+        result_again = await self.handler.send_p2p("192.168.1.5:9000", msg)
 
         self.assertTrue(result)
+        self.assertTrue(result_again)
         mock_open_connection.assert_called_once_with("192.168.1.5", 9000)
-        mock_writer.write.assert_called_once()
-        mock_writer.drain.assert_awaited_once()
+        self.assertEqual(mock_writer.write.call_count, 2)
+        mock_writer.close.assert_not_called()
+
+        await self.handler.p2p_pool.close_all()
         mock_writer.close.assert_called_once()
-        mock_writer.wait_closed.assert_awaited_once()
+
+    @patch('asyncio.open_connection')
+    async def test_send_p2p_reconnects_dropped_connection(self, mock_open_connection):
+        stale_reader, stale_writer = self._mock_p2p_stream()
+        fresh_reader, fresh_writer = self._mock_p2p_stream()
+        stale_writer.drain.side_effect = ConnectionResetError()
+        mock_open_connection.side_effect = [(stale_reader, stale_writer), (fresh_reader, fresh_writer)]
+        msg = Message(type=MessageType.MSG_VOTE, sender="P1", payload={})
+
+        await self.handler.p2p_pool._get("192.168.1.5:9000")
+        result = await self.handler.send_p2p("192.168.1.5:9000", msg)
+
+        self.assertTrue(result)
+        stale_writer.close.assert_called_once()
+        fresh_writer.write.assert_called_once()
+        await self.handler.p2p_pool.close_all()
+
+    async def test_send_p2p_waits_for_the_peer_ack(self):
+        receiver = NetworkHandler(host="127.0.0.1", port=5000)
+        received = []
+        receiver.on_message = received.append
+        port = await receiver.start_p2p_listener()
+
+        msg = Message(type=MessageType.MSG_CHAT, sender="P1", payload={"text": "ciao"}, msg_id="m1")
+        result = await asyncio.wait_for(self.handler.send_p2p(f"127.0.0.1:{port}", msg), 2)
+
+        self.assertTrue(result)
+        self.assertEqual([m.msg_id for m in received], ["m1"])
+        await self.handler.p2p_pool.close_all()
+        receiver.p2p_server.close()
+        await receiver.p2p_server.wait_closed()
+
+    @patch('asyncio.open_connection')
+    async def test_send_p2p_skips_late_acks(self, mock_open_connection):
+        mock_reader, mock_writer = self._mock_p2p_stream()
+        mock_reader.readline.side_effect = [b"old\n", b"m2\n"]
+        mock_open_connection.return_value = (mock_reader, mock_writer)
+
+        msg = Message(type=MessageType.MSG_VOTE, sender="P1", payload={}, msg_id="m2")
+        result = await self.handler.send_p2p("192.168.1.5:9000", msg)
+
+        self.assertTrue(result)
+        self.assertEqual(mock_reader.readline.await_count, 2)
+        await self.handler.p2p_pool.close_all()
 
     async def test_handle_p2p_connection(self):
         mock_reader, mock_writer = AsyncMock(), AsyncMock()
@@ -130,9 +183,10 @@ class TestNetworkHandler(unittest.IsolatedAsyncioTestCase):
         mock_writer.get_extra_info = MagicMock(return_value="192.168.1.10:8000")
         
         msg = Message(type=MessageType.MSG_VOTE, sender="P2", payload={})
-        mock_reader.readline.return_value = (msg.to_json() + "\n").encode(ENCODING)
+        line = (msg.to_json() + "\n").encode(ENCODING)
+        mock_reader.readline.side_effect = [line, line, b""]
 
         await self.handler._handle_p2p_connection(mock_reader, mock_writer)
 
-        self.mock_on_message.assert_called_once()
+        self.assertEqual(self.mock_on_message.call_count, 2)
         mock_writer.close.assert_called_once()
\ No newline at end of file
@@ -1,6 +1,9 @@
+import asyncio
 import json
 import os
+import socket
 import tempfile
+import time
 import unittest
 from unittest.mock import AsyncMock, MagicMock, patch, call
 
@@ -11,6 +14,9 @@ root_dir    = os.path.dirname(current_dir)
 sys.path.insert(0, root_dir)
 
 from src.client.reconnection_manager import ReconnectionManager
+from src.client.lan_discovery import (
+    DiscoveryCache, LanDiscovery, ServerCandidate, parse_announcement, rank
+)
 from src.common.message import Message, MessageType
 
 """
@@ -62,6 +68,18 @@ class TestConfigLoading(unittest.TestCase):
         finally:
             os.unlink(path)
 
+    def test_rounds_default_to_retries_per_server(self):
+        cfg  = _make_config(["10.0.0.1:5000", "10.0.0.2:5001"], max_retries=4)
+        path = _write_config(cfg)
+        try:
+            self.assertEqual(ReconnectionManager(config_path=path).max_rounds, 4)
+            cfg["reconnection"]["max_rounds"] = 9
+            with open(path, "w", encoding="utf-8") as f:
+                json.dump(cfg, f)
+            self.assertEqual(ReconnectionManager(config_path=path).max_rounds, 9)
+        finally:
+            os.unlink(path)
+
     def test_missing_config_uses_defaults(self):
         mgr = ReconnectionManager(config_path="/nonexistent/path/config.json")
         self.assertEqual(mgr.servers, [("127.0.0.1", 5000)])
@@ -173,6 +191,17 @@ class TestReconnectLoop(unittest.IsolatedAsyncioTestCase):
         self.assertIsNone(result)
         self.assertFalse(mgr.is_active)
 
+    async def test_max_rounds_overrides_retries_per_server(self):
+        mgr      = self._make_mgr(["S1:5000", "S2:5001"], max_retries=2)
+        mgr.max_rounds = 4
+        factory  = _mock_handler_factory([])
+        statuses: list[str] = []
+        await mgr.reconnect(network_factory=factory, username="P", p2p_port=0,
+                            on_status=statuses.append)
+        rounds = [s for s in statuses if s.startswith("Reconnecting")]
+        self.assertEqual(len(rounds), 4)
+        self.assertIn("[4/4]", rounds[-1])
+
     async def test_concurrent_reconnect_ignored(self):
         mgr       = self._make_mgr(["S1:5000"])
         mgr._active = True   # simulate in-progress reconnect
@@ -212,6 +241,262 @@ class TestReconnectLoop(unittest.IsolatedAsyncioTestCase):
         await mgr.reconnect(network_factory=factory, username="U", p2p_port=0)
         self.assertFalse(mgr.is_active)
 
+class TestTopology(unittest.IsolatedAsyncioTestCase):
+    """Server-pushed replica topology drives the reconnection order."""
+
+    def setUp(self):
+        self._path = _write_config(_make_config(["S1:5000"], max_retries=1))
+        self.mgr   = ReconnectionManager(config_path=self._path)
+
+    def tearDown(self):
+        os.unlink(self._path)
+
+    def test_update_topology_puts_primary_first(self):
+        updated = self.mgr.update_topology("P:5000", ["B1:5001", "P:5000", "B2:5002"], epoch=1)
+        self.assertTrue(updated)
+        self.assertEqual(self.mgr.server_list, ["P:5000", "B1:5001", "B2:5002"])
+        self.assertEqual(self.mgr.get_current_server(), ("P", 5000))
+
+    def test_stale_epoch_ignored(self):
+        self.mgr.update_topology("P:5000", ["B1:5001"], epoch=3)
+        updated = self.mgr.update_topology("OLD:5000", [], epoch=2)
+        self.assertFalse(updated)
+        self.assertEqual(self.mgr.get_initial_server(), ("P", 5000))
+
+    async def test_backups_tried_before_lost_primary(self):
+        self.mgr.update_topology("P:5000", ["B1:5001", "B2:5002"], epoch=1)
+        order: list = []
+
+        def factory(host, port):
+            h = MagicMock()
+            h.connect = AsyncMock(side_effect=lambda: order.append(host) or host == "B2")
+            return h
+
+        result = await self.mgr.reconnect(network_factory=factory, username="U", p2p_port=0)
+        self.assertIsNotNone(result)
+        # B2 answered before the lost primary's turn came
+        self.assertEqual(order, ["B1", "B2"])
+        self.assertEqual(self.mgr.get_current_server(), ("B2", 5002))
+
+    async def test_race_disconnects_extra_winners(self):
+        self.mgr.update_topology("P:5000", ["B1:5001"], epoch=1)
+        self.mgr.stagger = 0.0   # both attempts start together
+        handlers: list = []
+
+        gate = asyncio.Event()   # released once, so both connections complete together
+        asyncio.get_running_loop().call_later(0.02, gate.set)
+
+        async def connect():
+            await gate.wait()
+            return True
+
+        def factory(host, port):
+            h = MagicMock()
+            h.connect    = AsyncMock(side_effect=connect)
+            h.disconnect = AsyncMock()
+            handlers.append(h)
+            return h
+
+        result = await self.mgr.reconnect(network_factory=factory, username="U", p2p_port=0)
+        self.assertIs(result, handlers[0])
+        handlers[0].disconnect.assert_not_awaited()
+        handlers[1].disconnect.assert_awaited_once()
+
+
+class TestStaggeredRace(unittest.IsolatedAsyncioTestCase):
+    """Happy-eyeballs connection race and backoff between rounds."""
+
+    def setUp(self):
+        self._path = _write_config(_make_config(["A:5000", "B:5001", "C:5002"], max_retries=1))
+        self.mgr = ReconnectionManager(config_path=self._path)
+        self.mgr.stagger = 0.05
+
+    def tearDown(self):
+        os.unlink(self._path)
+
+    def _factory(self, behaviour: dict, started: list):
+        def factory(host, port):
+            h = MagicMock()
+            h.disconnect = AsyncMock()
+
+            async def connect():
+                started.append(host)
+                delay, ok = behaviour[host]
+                await asyncio.sleep(delay)
+                return ok
+            h.connect = connect
+            return h
+        return factory
+
+    async def test_hanging_server_does_not_block_the_next(self):
+        started: list = []
+        factory = self._factory({"A": (10, True), "B": (0.01, True), "C": (0, True)}, started)
+
+        loop  = asyncio.get_running_loop()
+        begin = loop.time()
+        server, handler = await self.mgr._race(self.mgr.servers, factory)
+
+        self.assertEqual(server, ("B", 5001))
+        self.assertEqual(started, ["A", "B"])
+        self.assertLess(loop.time() - begin, 1)
+
+    async def test_failure_starts_next_attempt_without_waiting(self):
+        self.mgr.stagger = 10
+        started: list = []
+        factory = self._factory({"A": (0, False), "B": (0, False), "C": (0, True)}, started)
+
+        server, _ = await asyncio.wait_for(self.mgr._race(self.mgr.servers, factory), 1)
+        self.assertEqual(server, ("C", 5002))
+        self.assertEqual(started, ["A", "B", "C"])
+
+    async def test_round_gives_up_after_connect_timeout(self):
+        self.mgr.connect_timeout = 0.2
+        factory = self._factory({"A": (10, True), "B": (10, True), "C": (10, True)}, [])
+
+        server, handler = await asyncio.wait_for(self.mgr._race(self.mgr.servers, factory), 1)
+        self.assertIsNone(handler)
+
+    def test_backoff_grows_with_jitter_and_is_capped(self):
+        self.mgr.retry_delay, self.mgr.max_retry_delay = 1.0, 6.0
+        for attempt, full in [(1, 1.0), (2, 2.0), (3, 4.0), (4, 6.0), (9, 6.0)]:
+            waits = {self.mgr._backoff(attempt) for _ in range(20)}
+            self.assertTrue(all(full / 2 <= w <= full for w in waits))
+            self.assertGreater(len(waits), 1)
+
+
+class TestLanDiscovery(unittest.IsolatedAsyncioTestCase):
+    """Non-blocking LAN discovery: announcements, ranking and the cache."""
+
+    async def asyncSetUp(self):
+        self.tmp = tempfile.TemporaryDirectory()
+        self.cache_path = os.path.join(self.tmp.name, "servers.json")
+        self.servers = []
+
+    async def asyncTearDown(self):
+        for server in self.servers:
+            server.close()
+            await server.wait_closed()
+        self.tmp.cleanup()
+
+    async def _tcp_server(self) -> int:
+        server = await asyncio.start_server(lambda r, w: w.close(), "127.0.0.1", 0)
+        self.servers.append(server)
+        return server.sockets[0].getsockname()[1]
+
+    def _announce(self, udp_port: int, text: str):
+        with socket.socket(socket.AF_INET, socket.SOCK_DGRAM) as sock:
+            sock.sendto(text.encode(), ("127.0.0.1", udp_port))
+
+    @staticmethod
+    def _free_udp_port() -> int:
+        with socket.socket(socket.AF_INET, socket.SOCK_DGRAM) as sock:
+            sock.bind(("", 0))
+            return sock.getsockname()[1]
+
+    def test_parse_announcement(self):
+        self.assertEqual(parse_announcement(b"NOMI_COSE_CITTA:5000:4"), (5000, 4))
+        self.assertEqual(parse_announcement(b"NOMI_COSE_CITTA:5001"), (5001, 0))
+        self.assertIsNone(parse_announcement(b"SOMETHING_ELSE:5000"))
+        self.assertIsNone(parse_announcement(b"NOMI_COSE_CITTA:abc"))
+
+    def test_rank_prefers_fast_and_idle_servers(self):
+        ranked = rank([
+            ServerCandidate("busy", 5000, load=40, rtt=0.001),
+            ServerCandidate("idle", 5000, load=0, rtt=0.010),
+            ServerCandidate("down", 5000, load=0, rtt=None),
+        ])
+        self.assertEqual([c.host for c in ranked], ["idle", "busy"])
+
+    async def test_collects_every_server_and_caches_ranking(self):
+        udp_port = self._free_udp_port()
+        ports = [await self._tcp_server(), await self._tcp_server()]
+        discovery = LanDiscovery(udp_port, window=0.3, cache=DiscoveryCache(self.cache_path))
+
+        run = asyncio.ensure_future(discovery.run())
+        await asyncio.sleep(0.05)
+        self._announce(udp_port, f"NOMI_COSE_CITTA:{ports[0]}:9")
+        self._announce(udp_port, f"NOMI_COSE_CITTA:{ports[1]}:0")
+
+        first = await asyncio.wait_for(discovery.first_reachable(), 1)
+        self.assertFalse(run.done())
+        self.assertIn(first.port, ports)
+
+        ranked = await run
+        self.assertEqual(sorted(c.port for c in ranked), sorted(ports))
+        self.assertEqual(ranked[0].port, ports[1])   # 9 players outweigh loopback RTT noise
+        self.assertEqual([c.port for c in DiscoveryCache(self.cache_path).load()],
+                         [c.port for c in ranked])
+
+    async def test_locate_uses_cache_without_waiting(self):
+        DiscoveryCache(self.cache_path).save(
+            [ServerCandidate("10.0.0.7", 5000, rtt=0.002, seen=time.time())])
+        path = _write_config({"discovery": {"udp_port": self._free_udp_port(),
+                                            "timeout_seconds": 0.2,
+                                            "cache_file": self.cache_path}})
+        try:
+            mgr = ReconnectionManager(config_path=path)
+            found = await asyncio.wait_for(mgr.locate_servers(), 0.1)
+            self.assertTrue(found)
+            self.assertEqual(mgr.get_initial_server(), ("10.0.0.7", 5000))
+
+            # Nothing answered this time; the cached server is kept
+            await mgr.await_lan_server()
+            self.assertEqual(mgr.server_list, ["10.0.0.7:5000"])
+        finally:
+            os.unlink(path)
+
+    async def test_locate_without_cache_does_not_wait_for_discovery(self):
+        udp_port = self._free_udp_port()
+        port     = await self._tcp_server()
+        path = _write_config({"debug_fallback_servers": ["F:5000"],
+                              "discovery": {"udp_port": udp_port,
+                                            "timeout_seconds": 2.0,
+                                            "cache_file": self.cache_path}})
+        try:
+            mgr = ReconnectionManager(config_path=path)
+            self.assertFalse(await asyncio.wait_for(mgr.locate_servers(), 0.1))
+            self.assertEqual(mgr.get_initial_server(), ("F", 5000))
+
+            # F failed: the first LAN server to answer goes ahead of it
+            await asyncio.sleep(0.05)
+            self._announce(udp_port, f"NOMI_COSE_CITTA:{port}:0")
+            await asyncio.wait_for(mgr.await_lan_server(), 1)
+            self.assertEqual(mgr._candidates(), [("127.0.0.1", port), ("F", 5000)])
+        finally:
+            mgr._discovery.cancel()
+            os.unlink(path)
+
+    def test_late_discovery_keeps_the_connected_server_current(self):
+        path = _write_config(_make_config(["A:5000", "B:5001"]))
+        try:
+            mgr = ReconnectionManager(config_path=path)
+            mgr._index = 1                                   # connected to B
+            done = MagicMock()
+            done.cancelled.return_value = False
+            done.exception.return_value = None
+            done.result.return_value = [ServerCandidate("C", 5002, rtt=0.001),
+                                        ServerCandidate("B", 5001, rtt=0.002)]
+
+            mgr._on_discovery_done(done)
+
+            self.assertEqual(mgr.get_current_server(), ("B", 5001))
+            self.assertEqual(mgr._candidates(), [("C", 5002), ("B", 5001)])
+        finally:
+            os.unlink(path)
+
+    async def test_locate_keeps_fallback_when_nothing_found(self):
+        path = _write_config({"debug_fallback_servers": ["F:5000"],
+                              "discovery": {"udp_port": self._free_udp_port(),
+                                            "timeout_seconds": 0.1,
+                                            "cache_file": self.cache_path}})
+        try:
+            mgr = ReconnectionManager(config_path=path)
+            self.assertFalse(await mgr.locate_servers())
+            self.assertEqual(mgr.server_list, ["F:5000"])
+        finally:
+            os.unlink(path)
+
+
 class _FakeController:
     """
     Minimal stand-in for ClientController.
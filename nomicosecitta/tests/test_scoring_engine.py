@@ -0,0 +1,280 @@
+import copy
+import random
+import tempfile
+import unittest
+from unittest.mock import patch
+import sys
+import os
+
+current_dir = os.path.dirname(os.path.abspath(__file__))
+root_dir = os.path.dirname(current_dir)
+sys.path.append(root_dir)
+
+from src.server.session import columnar_scoring_engine
+from src.server.session.columnar_scoring_engine import ColumnarScoringEngine
+from src.server.session.scoring_engine import ScoringEngine
+from src.server.session.answer_validator import AnswerValidator
+from src.server.session.word_index import WordIndex, read_word_list
+from src.server.session.compiled_dictionary import CompiledDictionary, compile_words, dictionary_versions
+from src.server.build_dictionaries import build_dictionaries
+from src.common.constants import DICTIONARIES_PATH
+from src.server.session.word_normalizer import normalize_word, WordInterner, word_id
+from src.server.session.fuzzy_matcher import FuzzyMatcher, DeletionIndex, edit_distance, phonetic_key
+from src.common.constants import POINTS_UNIQUE_CATEGORY, POINTS_UNIQUE_WORD, POINTS_SHARED_WORD
+
+
+def _make_round(n_players: int, categories: list[str], seed: int = 7):
+    rng = random.Random(seed)
+    words = ["ANNA", "ALBA", "ASTI", "ANCONA", "AOSTA"]
+    round_data, validated = {}, {}
+    for category in categories:
+        round_data[category], validated[category] = {}, {}
+        for p in range(n_players):
+            user = f"P{p}"
+            round_data[category][user] = {"word": rng.choice(words), "status": "PENDING_VOTE", "score": 0}
+            validated[category][user] = rng.random() < 0.7
+    return round_data, validated
+
+
+class TestColumnarScoringEngine(unittest.TestCase):
+
+    def _assert_same_as_reference(self, n_players: int, categories: list[str]):
+        round_data, validated = _make_round(n_players, categories)
+        active = {f"P{p}" for p in range(n_players)} | {"Spectator"}
+
+        expected_data = copy.deepcopy(round_data)
+        expected = ScoringEngine().calculate_points(expected_data, validated, active)
+        result = ColumnarScoringEngine().calculate_points(round_data, validated, active)
+
+        self.assertEqual(result, expected)
+        self.assertEqual(round_data, expected_data)
+
+    def test_matches_reference_engine(self):
+        self._assert_same_as_reference(40, ["Name", "Things", "Cities", "Animals"])
+
+    def test_matches_reference_engine_without_numpy(self):
+        with patch.object(columnar_scoring_engine, "np", None):
+            self._assert_same_as_reference(40, ["Name", "Things", "Cities", "Animals"])
+
+    @unittest.skipIf(columnar_scoring_engine.np is None, "NumPy not installed.")
+    def test_numpy_path_matches_python_path(self):
+        round_data, validated = _make_round(40, ["Name", "Things", "Cities", "Animals"])
+        active = {f"P{p}" for p in range(40)}
+
+        with patch.object(columnar_scoring_engine.ColumnarScoringEngine, "_points_python",
+                          side_effect=AssertionError("fallback used")):
+            result = ColumnarScoringEngine().calculate_points(copy.deepcopy(round_data), validated, active)
+        with patch.object(columnar_scoring_engine, "np", None):
+            expected = ColumnarScoringEngine().calculate_points(copy.deepcopy(round_data), validated, active)
+        self.assertEqual(result, expected)
+
+    def test_round_without_valid_answers_scores_zero(self):
+        round_data, validated = _make_round(40, ["Name", "Cities"])
+        validated = {c: {u: False for u in users} for c, users in validated.items()}
+        active = {f"P{p}" for p in range(40)}
+
+        for np_module in (columnar_scoring_engine.np, None):
+            with patch.object(columnar_scoring_engine, "np", np_module):
+                scores = ColumnarScoringEngine().calculate_points(copy.deepcopy(round_data), validated, active)
+            self.assertEqual(set(scores.values()), {0})
+
+    def test_single_valid_answer_gets_category_bonus(self):
+        round_data = {
+            "Cities": {
+                "P1": {"word": "ROMA", "status": "PENDING_VOTE", "score": 0},
+                "P2": {"word": "RIMINI", "status": "PENDING_VOTE", "score": 0},
+            },
+            "Name": {
+                "P1": {"word": "RITA", "status": "PENDING_VOTE", "score": 0},
+                "P2": {"word": "RITA", "status": "PENDING_VOTE", "score": 0},
+                "P3": {"word": "ROSA", "status": "PENDING_VOTE", "score": 0},
+            },
+        }
+        validated = {"Cities": {"P1": True, "P2": False},
+                     "Name": {"P1": True, "P2": True, "P3": True}}
+
+        scores = ColumnarScoringEngine().calculate_points(round_data, validated, {"P1", "P2", "P3"})
+
+        self.assertEqual(scores["P1"], POINTS_UNIQUE_CATEGORY + POINTS_SHARED_WORD)
+        self.assertEqual(scores["P2"], POINTS_SHARED_WORD)
+        self.assertEqual(scores["P3"], POINTS_UNIQUE_WORD)
+        self.assertEqual(round_data["Cities"]["P2"]["score"], 0)
+
+
+class TestWordNormalization(unittest.TestCase):
+
+    def test_accents_apostrophes_and_spaces_are_folded(self):
+        for variant in ("Città", "CITTA'", "citta", "  Cittá ", "CITTÀ"):
+            self.assertEqual(normalize_word(variant), "CITTA")
+        self.assertEqual(normalize_word("L'Aquila"), normalize_word("L’ aquila"))
+        self.assertEqual(normalize_word("San   Marino"), "SAN MARINO")
+
+    def test_interner_returns_stable_ids(self):
+        interner = WordInterner()
+        first = interner.intern("Città")
+        self.assertEqual(interner.intern("CITTA'"), first)
+        self.assertNotEqual(interner.intern("Cuneo"), first)
+        self.assertEqual(interner.word(first), "CITTA")
+
+    def test_word_id_falls_back_to_the_raw_word(self):
+        interner = WordInterner()
+        self.assertEqual(word_id({"word": "Città"}, interner), word_id({"word": "X", "norm": "CITTA"}, interner))
+        self.assertEqual(len(interner), 1)
+
+    def test_accented_variants_score_as_shared_word(self):
+        round_data, _ = AnswerValidator().validate(
+            {"P1": {"Things": "Città"}, "P2": {"Things": "CITTA'"}, "P3": {"Things": "Cane"}},
+            ["Things"], "C")
+        validated = {"Things": {"P1": True, "P2": True, "P3": True}}
+
+        for engine in (ScoringEngine(), ColumnarScoringEngine()):
+            scores = engine.calculate_points(copy.deepcopy(round_data), validated, {"P1", "P2", "P3"})
+            self.assertEqual(scores, {"P1": POINTS_SHARED_WORD, "P2": POINTS_SHARED_WORD,
+                                      "P3": POINTS_UNIQUE_WORD})
+
+
+class TestWordIndex(unittest.TestCase):
+
+    def setUp(self):
+        self.tmp = tempfile.TemporaryDirectory()
+        with open(os.path.join(self.tmp.name, "city.txt"), "w", encoding="utf-8") as f:
+            f.write("# test list\nRoma\nL'Aquila\nForlì\n")
+        self.index = WordIndex(self.tmp.name)
+
+    def tearDown(self):
+        self.tmp.cleanup()
+
+    def test_lookup_is_normalized(self):
+        self.assertTrue(self.index.contains("City", "roma"))
+        self.assertTrue(self.index.contains("City", "LAQUILA"))
+        self.assertTrue(self.index.contains("City", "Forli'"))
+        self.assertFalse(self.index.contains("City", "Rovigo"))
+        self.assertFalse(self.index.contains("Animals", "Roma"))
+
+    def test_known_words_skip_the_vote(self):
+        validator = AnswerValidator(self.index)
+        round_data, words_to_vote = validator.validate(
+            {"P1": {"City": "Roma"}, "P2": {"City": "Rovigno"}, "P3": {"City": "Milano"}},
+            ["City"], "R")
+
+        self.assertEqual(round_data["City"]["P1"]["status"], "VALID")
+        self.assertEqual(round_data["City"]["P2"]["status"], "PENDING_VOTE")
+        self.assertEqual(round_data["City"]["P3"]["status"], "INVALID")
+        self.assertEqual(words_to_vote["City"], {"P2": "ROVIGNO"})
+
+    def test_game_categories_find_their_word_lists(self):
+        index = WordIndex()
+        self.assertTrue(index.contains("Name", "Ada"))
+        self.assertTrue(index.contains("Cities", "Ancona"))
+        self.assertTrue(index.contains("City", "Ancona"))
+        self.assertFalse(index.contains("Things", "Ancona"))
+
+
+class TestCompiledDictionary(unittest.TestCase):
+
+    def setUp(self):
+        self.tmp = tempfile.TemporaryDirectory()
+        self.path = os.path.join(self.tmp.name, "city.dict")
+
+    def tearDown(self):
+        self.tmp.cleanup()
+
+    def test_every_listed_word_is_found(self):
+        words = read_word_list(os.path.join(DICTIONARIES_PATH, "city.txt"))
+        compile_words(words, self.path)
+        compiled = CompiledDictionary(self.path)
+
+        self.assertEqual(len(compiled), len({normalize_word(w) for w in words}))
+        for word in words:
+            self.assertIn(normalize_word(word), compiled)
+        for missing in ("", "A", "ZZZ", "ROMAX", "ÖSTERSUND"):
+            self.assertNotIn(missing, compiled)
+        compiled.close()
+
+    def test_word_index_prefers_the_compiled_file(self):
+        compile_words(["Rimini"], self.path)
+        with open(os.path.join(self.tmp.name, "city.txt"), "w", encoding="utf-8") as f:
+            f.write("Roma\n")
+
+        index = WordIndex(self.tmp.name)
+        self.assertTrue(index.contains("City", "rimini"))
+        self.assertFalse(index.contains("City", "Roma"))
+
+    def test_rebuild_writes_a_new_version(self):
+        with open(os.path.join(self.tmp.name, "city.txt"), "w", encoding="utf-8") as f:
+            f.write("Roma\n")
+        build_dictionaries(self.tmp.name, self.tmp.name)
+        mapped = WordIndex(self.tmp.name)
+        self.assertTrue(mapped.contains("Cities", "Roma"))
+
+        with open(os.path.join(self.tmp.name, "city.txt"), "w", encoding="utf-8") as f:
+            f.write("Rimini\n")
+        built = build_dictionaries(self.tmp.name, self.tmp.name)
+
+        self.assertEqual(built, {"city": 1})
+        self.assertTrue(mapped.contains("Cities", "Roma"))
+        self.assertTrue(WordIndex(self.tmp.name).contains("Cities", "Rimini"))
+        self.assertEqual(dictionary_versions(self.tmp.name, "city")[-1][0], 1)
+        mapped._index["city"].close()
+
+    def test_rejects_foreign_files(self):
+        with open(self.path, "wb") as f:
+            f.write(b"not a dictionary")
+        with self.assertRaises(ValueError):
+            CompiledDictionary(self.path)
+
+
+class TestFuzzyMatcher(unittest.TestCase):
+
+    def test_phonetic_key(self):
+        self.assertEqual(phonetic_key("CHIARA"), phonetic_key("KIARA"))
+        self.assertEqual(phonetic_key("MILANNO"), phonetic_key("MILANO"))
+        self.assertEqual(phonetic_key("OTEL"), phonetic_key("HOTEL"))
+        self.assertNotEqual(phonetic_key("CASA"), phonetic_key("CENA"))
+
+    def test_deletion_index_matches_brute_force(self):
+        rng = random.Random(3)
+        words = {"".join(rng.choice("AEILNORST") for _ in range(rng.randint(3, 9))) for _ in range(400)}
+        index = DeletionIndex(max_distance=2)
+        for word in words:
+            index.add(word)
+
+        for query in list(words)[:40] + ["MILANO", "A"]:
+            expected = sorted((edit_distance(query, w, 2), w) for w in words if edit_distance(query, w, 2) <= 2)
+            self.assertEqual(index.search(query, 2), expected)
+
+    def test_typos_score_as_shared_word(self):
+        answers = {"P1": {"City": "Milano"}, "P2": {"City": "Milanno"},
+                   "P3": {"City": "Mantova"}, "P4": {"City": "Messina"}}
+        round_data, _ = AnswerValidator().validate(answers, ["City"], "M")
+        validated = {"City": {user: True for user in answers}}
+        expected  = {"P1": POINTS_SHARED_WORD, "P2": POINTS_SHARED_WORD,
+                     "P3": POINTS_UNIQUE_WORD, "P4": POINTS_UNIQUE_WORD}
+
+        for engine in (ScoringEngine(FuzzyMatcher()), ColumnarScoringEngine(FuzzyMatcher())):
+            scores = engine.calculate_points(copy.deepcopy(round_data), validated, set(answers))
+            self.assertEqual(scores, expected)
+
+        exact = ScoringEngine().calculate_points(copy.deepcopy(round_data), validated, set(answers))
+        self.assertEqual(exact["P1"], POINTS_UNIQUE_WORD)
+
+    def test_distinct_names_stay_separate(self):
+        pairs = [("MARIO", "MARCO"), ("PAOLO", "PAOLA"), ("FRANCESCO", "FRANCESCA"), ("MARTINA", "MARTINO")]
+        matcher, words = FuzzyMatcher(), WordInterner()
+        for a, b in pairs:
+            clusters = matcher.cluster({"P1": words.intern(a), "P2": words.intern(b)}, words)
+            self.assertNotEqual(clusters["P1"], clusters["P2"], f"{a}/{b} merged")
+
+    def test_single_typo_in_long_word_is_shared(self):
+        words    = WordInterner()
+        clusters = FuzzyMatcher().cluster({"P1": words.intern("PORTOFINO"),
+                                           "P2": words.intern("PORTOFIMO")}, words)
+        self.assertEqual(clusters["P1"], clusters["P2"])
+
+    def test_short_words_need_the_same_sound(self):
+        words = WordInterner()
+        ids   = {user: words.intern(word) for user, word in
+                 {"P1": "ANNA", "P2": "ANA", "P3": "ANTA"}.items()}
+        clusters = FuzzyMatcher(max_distance=2, min_length=5).cluster(ids, words)
+        self.assertEqual(clusters["P1"], clusters["P2"])
+        self.assertNotEqual(clusters["P1"], clusters["P3"])
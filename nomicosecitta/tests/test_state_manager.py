@@ -36,6 +36,7 @@ class TestStateManager(unittest.TestCase):
         self.mock_session.received_votes = {}
         self.mock_session.round_data = {}
         self.mock_session.words_to_vote = {}
+        self.mock_session.reviewers = None
         self.mock_session.current_round = MagicMock()
         self.mock_session.current_round.letter = "C"
         self.mock_session.current_round.categories = ["Name"]
@@ -0,0 +1,92 @@
+import threading
+import unittest
+import sys
+import os
+
+current_dir = os.path.dirname(os.path.abspath(__file__))
+root_dir = os.path.dirname(current_dir)
+sys.path.append(root_dir)
+
+from src.client.ui_dispatcher import UIDispatcher
+
+
+class FakeRoot:
+    """Collects root.after() callbacks instead of running a Tk mainloop."""
+
+    def __init__(self):
+        self.scheduled = []
+
+    def after(self, delay, fn):
+        self.scheduled.append(fn)
+
+    def run_frame(self):
+        pending, self.scheduled = self.scheduled, []
+        for fn in pending:
+            fn()
+
+
+class TestUIDispatcher(unittest.TestCase):
+
+    def setUp(self):
+        self.root = FakeRoot()
+        self.ui   = UIDispatcher(self.root)
+        self.calls = []
+
+    def test_burst_is_drained_in_one_frame_in_order(self):
+        for i in range(50):
+            self.ui.post(lambda i=i: self.calls.append(i))
+
+        self.assertEqual(len(self.root.scheduled), 1)
+        self.root.run_frame()
+        self.assertEqual(self.calls, list(range(50)))
+
+    def test_keyed_updates_keep_only_the_newest(self):
+        self.ui.post(lambda: self.calls.append("show_lobby"))
+        for n in range(10):
+            self.ui.post(lambda n=n: self.calls.append(f"players {n}"), key="players")
+        self.ui.post(lambda: self.calls.append("chat"))
+
+        self.root.run_frame()
+
+        self.assertEqual(self.calls, ["show_lobby", "players 9", "chat"])
+
+    def test_newest_keyed_update_runs_after_a_screen_switch(self):
+        self.ui.post(lambda: self.calls.append("timer 30"), key="timer")
+        self.ui.post(lambda: self.calls.append("show_voting_phase"))
+        self.ui.post(lambda: self.calls.append("timer 29"), key="timer")
+
+        self.root.run_frame()
+
+        self.assertEqual(self.calls, ["show_voting_phase", "timer 29"])
+
+    def test_posts_after_a_drain_schedule_a_new_frame(self):
+        self.ui.post(lambda: self.calls.append(1), key="scoreboard")
+        self.root.run_frame()
+        self.ui.post(lambda: self.calls.append(2), key="scoreboard")
+        self.root.run_frame()
+
+        self.assertEqual(self.calls, [1, 2])
+
+    def test_failing_update_does_not_stop_the_batch(self):
+        self.ui.post(lambda: 1 / 0)
+        self.ui.post(lambda: self.calls.append("next"))
+
+        self.root.run_frame()
+
+        self.assertEqual(self.calls, ["next"])
+
+    def test_posting_from_many_threads(self):
+        threads = [threading.Thread(target=lambda t=t: [self.ui.post(lambda: self.calls.append(t))
+                                                        for _ in range(100)])
+                   for t in range(8)]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+
+        self.root.run_frame()
+        self.assertEqual(len(self.calls), 800)
+
+
+if __name__ == "__main__":
+    unittest.main()
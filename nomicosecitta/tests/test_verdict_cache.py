@@ -0,0 +1,76 @@
+import unittest
+import os
+import tempfile
+import sys
+
+current_dir = os.path.dirname(os.path.abspath(__file__))
+root_dir = os.path.dirname(current_dir)
+sys.path.append(root_dir)
+
+from src.server.session.verdict_cache import VerdictCache
+from src.server.session.answer_validator import AnswerValidator
+from src.server.session.voting_aggregator import VotingAggregator
+
+class TestVerdictCache(unittest.TestCase):
+
+    def setUp(self):
+        self.temp_dir = tempfile.TemporaryDirectory()
+        self.filepath = os.path.join(self.temp_dir.name, "verdicts.json")
+        self.cache = VerdictCache(self.filepath, capacity=3, min_votes=4, confidence=0.75)
+
+    def tearDown(self):
+        self.temp_dir.cleanup()
+
+    def test_thresholds(self):
+        self.cache.record("City", "FIRENZE", 3, 0)
+        self.assertIsNone(self.cache.lookup("City", "FIRENZE"))   # not enough votes yet
+
+        self.cache.record("City", "FIRENZE", 2, 1)
+        self.assertTrue(self.cache.lookup("City", "FIRENZE"))    # 5 of 6
+
+        self.cache.record("City", "FORZA", 1, 4)
+        self.assertIs(self.cache.lookup("City", "FORZA"), False)  # 4 of 5 against
+
+        self.cache.record("City", "FANO", 2, 2)
+        self.assertIsNone(self.cache.lookup("City", "FANO"))      # no agreement
+        self.assertIsNone(self.cache.lookup("Animals", "FIRENZE"))
+
+    def test_least_recently_used_is_evicted(self):
+        for word in ("A1", "A2", "A3"):
+            self.cache.record("Name", word, 5, 0)
+        self.cache.lookup("Name", "A1")
+        self.cache.record("Name", "A4", 5, 0)
+
+        self.assertEqual(len(self.cache), 3)
+        self.assertIsNone(self.cache.lookup("Name", "A2"))
+        self.assertTrue(self.cache.lookup("Name", "A1"))
+
+    def test_persistence(self):
+        self.cache.record("City", "FIRENZE", 4, 0)
+        self.cache.save()
+
+        reloaded = VerdictCache(self.filepath, min_votes=4, confidence=0.75)
+        self.assertTrue(reloaded.lookup("City", "FIRENZE"))
+
+    def test_learned_words_skip_the_vote(self):
+        validator = AnswerValidator(verdicts=self.cache)
+        aggregator = VotingAggregator()
+
+        round_data, words_to_vote = validator.validate(
+            {"P1": {"City": "Firenze"}, "P2": {"City": "Fiorentina"}}, ["City"], "F")
+        self.assertEqual(words_to_vote["City"], {"P1": "FIRENZE", "P2": "FIORENTINA"})
+
+        aggregator.aggregate(round_data, {
+            voter: {"City": {"P1": True, "P2": False}} for voter in ("V1", "V2", "V3", "V4")})
+        for (category, user), (valid, invalid) in aggregator.tallies().items():
+            self.cache.record(category, round_data[category][user]["norm"], valid, invalid)
+
+        round_data, words_to_vote = validator.validate(
+            {"P3": {"City": "firenze"}, "P4": {"City": "Fiorentina"}, "P5": {"City": "Foggia"}},
+            ["City"], "F")
+        self.assertEqual(round_data["City"]["P3"]["status"], "VALID")
+        self.assertEqual(round_data["City"]["P4"]["status"], "INVALID")
+        self.assertEqual(words_to_vote["City"], {"P5": "FOGGIA"})
+
+if __name__ == "__main__":
+    unittest.main()